@@ -2,6 +2,8 @@
 import runloop, time, sys, motor_pair, motor, runloop # pyright: ignore[reportMissingImports]
 import color_sensor, distance_sensor # pyright: ignore[reportMissingImports]
 from hub import light,port # pyright: ignore[reportMissingImports]
+from ring_buffer import ColorRingBuffer
+from binlog import BinaryLog
 
 # Ports on the robot hub
 distance_port = port.B
@@ -27,8 +29,19 @@ red = 9
 
 # State tracking
 light_state = "unknown"
-reading_buffer = []
 BUFFER_SIZE = 10 # Number of recent readings to analyze
+reading_buffer = ColorRingBuffer(BUFFER_SIZE)
+OFF_TOLERANCE = 0 # Readings that may differ from all black (or all white) and still mean off
+ON_COUNT = 1 # White or no color readings needed to mean on
+CHECK_EVERY_MS = 100 # Time between readings
+SHOW_READINGS = True # Print the color counts every reading (slows the loop down)
+
+# Save readings to a file on the hub instead (decode it with host/binlog_decode.py)
+LOG_READINGS = False
+READING_EVENT = 1 # a = color, b = black count, c = white count, d = no color count
+STATE_EVENT = 2   # a = 1 for on, 0 for off, -1 for unknown
+STATE_CODES = {"on": 1, "off": 0, "unknown": -1}
+reading_log = BinaryLog("light_log.bin") if LOG_READINGS else None
 
 ########################################################################
 # 🔍 Analyze color readings to determine light state
@@ -41,10 +54,15 @@ def analyze_light_state(readings):
         - Light OFF: All black readings (darkness)
         - Light ON: Mix of white, black, and no color (flashing light pattern)
 
+    OFF_TOLERANCE and ON_COUNT set how strict each test is. Replay recorded
+    traces with host/light_replay.py to try other values.
+
+    The buffer already keeps count of each color, so this only looks up three numbers.
+
     Returns:
         "on" if light is on, "off" if light is off, "unknown" if not sure yet
     """
-    if len(readings) < BUFFER_SIZE:
+    if not readings.is_full():
         return "unknown"
 
     # Count different reading types
@@ -53,15 +71,15 @@ def analyze_light_state(readings):
     no_color_count = readings.count(NO_COLOR)
 
     # If all black readings, light is OFF
-    if black_count >= (BUFFER_SIZE * 1.0):# 100% or more black
+    if black_count >= readings.capacity - OFF_TOLERANCE:# 100% black
         return "off"
 
     # If all white readings, light is OFF
-    if white_count >= (BUFFER_SIZE * 1.0):# 100% or more white
+    if white_count >= readings.capacity - OFF_TOLERANCE:# 100% white
         return "off"
 
     # If mix of readings including white or no_color, light is ON
-    if white_count > 0 or no_color_count > 0:
+    if white_count + no_color_count >= ON_COUNT:
         return "on"
 
     return "unknown"
@@ -103,35 +121,47 @@ async def monitor_christmas_light():
     print("🎄 Christmas Light Detector Started")
     print("Connect color sensor to port B and place 1cm from light")
 
-    while True:
-        try:
-            # Read current color
-            current_color = color_sensor.color(color_port)
-
-            # Add to buffer and maintain size
-            reading_buffer.append(current_color)
-            if len(reading_buffer) > BUFFER_SIZE:
-                reading_buffer.pop(0)# Remove oldest reading
-
-            # Analyze current state
-            new_state = analyze_light_state(reading_buffer)
-
-            # Update LED if state changed
-            if new_state != light_state:
-                light_state = new_state
-                set_hub_led(light_state)
-                print("Light state: %s" % light_state)
-
-            # Debug: Show recent readings
-            if len(reading_buffer) >= BUFFER_SIZE:
-
-                print("Readings: %s | light_state: %s" % (reading_buffer[-10:], light_state))
-
-        except Exception as e:
-            print("Error: %s" % e)
-            light.color(light.POWER, yellow) # Error indicator
-
-        await runloop.sleep_ms(100)# Check every 100ms
+    # Stopping the program ends the loop with an exception; close the log so
+    # the last buffered readings still reach the file
+    try:
+        while True:
+            try:
+                # Read current color
+                current_color = color_sensor.color(color_port)
+
+                # Add to buffer (the oldest reading drops out once it is full)
+                reading_buffer.push(current_color)
+
+                if reading_log is not None:
+                    reading_log.log(READING_EVENT, current_color, reading_buffer.count(BLACK),
+                                    reading_buffer.count(WHITE), reading_buffer.count(NO_COLOR))
+
+                # Analyze current state
+                new_state = analyze_light_state(reading_buffer)
+
+                # Update LED if state changed
+                if new_state != light_state:
+                    light_state = new_state
+                    set_hub_led(light_state)
+                    print("Light state: %s" % light_state)
+                    if reading_log is not None:
+                        reading_log.log(STATE_EVENT, STATE_CODES[light_state])
+
+                # Debug: Show how many of each reading are in the buffer
+                if SHOW_READINGS and reading_buffer.is_full():
+
+                    print("Readings: black %d white %d no color %d | light_state: %s" % (
+                        reading_buffer.count(BLACK), reading_buffer.count(WHITE),
+                        reading_buffer.count(NO_COLOR), light_state))
+
+            except Exception as e:
+                print("Error: %s" % e)
+                light.color(light.POWER, yellow) # Error indicator
+
+            await runloop.sleep_ms(CHECK_EVERY_MS)
+    finally:
+        if reading_log is not None:
+            reading_log.close()
 
 ########################################################################
 # 🔄 Rotate right medium motor
@@ -4,6 +4,7 @@ import color_sensor
 from hub import light, port
 from time import sleep
 from runloop import run
+from task_group import TaskGroup
 
 # Conversion constants
 DEGREES_PER_CM = 21
@@ -29,66 +30,59 @@ last_color = None
 # Connect two motors together so they work as a team
 motor_pair.pair(motor_pair.PAIR_1, port.C, port.D)
 
-# This is like a stop sign for our program - when it's True, everything stops
-should_stop = False
+# This is like a stop sign for our program - cancelling the group stops everything,
+# including a turn that is only half done
+group = TaskGroup()
+group.on_cancel(lambda: motor_pair.stop(motor_pair.PAIR_1))
 
 #####################################################################
 # 🛑 Watch for yellow colors continuously
 #####################################################################
 async def when_yellow():
-    global last_color, should_stop
+    global last_color
 
-    while not should_stop:
+    while not group.is_cancelled():
         current_color = color_sensor.color(color_port)
         if current_color == yellow and last_color != yellow:
             light.color(light.POWER, current_color)
             last_color = yellow
 
-        await runloop.sleep_ms(50)
+        await group.token.sleep_ms(50)
 
 #####################################################################
 # 🤖 Movement control function
 #####################################################################
 async def robot_movement():
-    global should_stop
 
     # start initial movement
     motor_pair.move(motor_pair.PAIR_1, 0)
     
-    while not should_stop:
-        
-        # Use async sleep instead of blocking sleep
-        await runloop.sleep_ms(1000)  
-
-        # Check if we should stop before continuing
-        if should_stop:
-            motor_pair.stop(motor_pair.PAIR_1)
-            break
+    # Keep going until the group is cancelled (the motors are stopped by the group)
+    await group.token.until(lambda: False)
 
 #####################################################################
 # 🛑 Watch for blue colors continuously
 #####################################################################
 async def when_blue():
-    global should_stop
 
-    while not should_stop:
+    while not group.is_cancelled():
         current_color = color_sensor.color(color_port)
         if current_color == blue:
             light.color(light.POWER, current_color)
             
-            # Stop forward movement before turning
+            # Stop forward movement before turning (the turn ends early if the group is cancelled)
             motor_pair.stop(motor_pair.PAIR_1)
-            await motor_pair.move_for_degrees(motor_pair.PAIR_1, 180, 100)
+            await group.token.move_for_degrees(motor_pair.PAIR_1, 180, 100)
             
-        await runloop.sleep_ms(50)
+        await group.token.sleep_ms(50)
 
 #####################################################################
 # 🛑 Watch for red colors continuously
 #####################################################################
 async def when_red():
-    global last_red, should_stop
+    global last_red
 
-    while not should_stop:
+    while not group.is_cancelled():
         current_color = color_sensor.color(color_port)
         if current_color == red and last_red != red:
             light.color(light.POWER, current_color)
@@ -96,12 +90,12 @@ async def when_red():
 
             # Stop forward movement before turning
             motor_pair.stop(motor_pair.PAIR_1)
-            await motor_pair.move_for_degrees(motor_pair.PAIR_1, 360, 50)
+            await group.token.move_for_degrees(motor_pair.PAIR_1, 360, 50)
             
         elif current_color != red:
             last_red = None
 
-        await runloop.sleep_ms(50)
+        await group.token.sleep_ms(50)
 
 ########################################################################
 # 🤖 Main - Run all functions concurrently
@@ -109,11 +103,11 @@ async def when_red():
 async def main():
 
     # Run all functions concurrently as events
-    run(
+    run(*group.tasks(
         when_blue(),
         # when_red(),
         robot_movement()
-    )
+    ))
 
 runloop.run(main())
 sys.exit()
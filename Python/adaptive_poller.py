@@ -0,0 +1,121 @@
+# Adaptive Poller
+import runloop, time # pyright: ignore[reportMissingImports]
+
+########################################################################
+# 📡 AdaptivePoller - read a sensor fast when things happen, slowly when they don't
+########################################################################
+class AdaptivePoller:
+    """Read a sensor at a speed that follows what the sensor is doing.
+
+    A fixed 50 or 100 ms wait is too slow to catch a thin stripe at full speed,
+    and wasteful when the robot is sitting still. AdaptivePoller uses
+    fast_ms between readings when:
+
+        - the reading just changed (by at least change), or
+        - the reading is within near of threshold
+
+    Otherwise it doubles the wait after each quiet reading, up to slow_ms.
+    Negative readings (-1 is how sensors say "nothing there") never count
+    as near threshold, so an empty view does not keep the poller fast.
+
+    The poller only speeds up after a reading has changed, so something that
+    appears and disappears between two slow readings is never seen. Keep
+    slow_ms shorter than the shortest event you need to catch (for a color
+    stripe: the time it spends under the sensor).
+
+    Args:
+        read: Function that returns one sensor reading.
+        fast_ms (int): Wait between readings while things are happening.
+            Defaults to 10.
+        slow_ms (int): Longest wait between readings while nothing happens.
+            Defaults to 100.
+        change (int): How much a reading must move to count as a change.
+            Defaults to 1 (any change for whole-number readings like colors).
+        threshold (int): A reading to watch closely, like a distance limit.
+            Defaults to None.
+        near (int): How close to threshold counts as "close".
+            Defaults to 0.
+        name (str): Name shown in report().
+            Defaults to "sensor".
+
+    Example:
+        distance = AdaptivePoller(lambda: distance_sensor.distance(port.B),
+                                  threshold=100, near=80, name="distance")
+        await distance.until(lambda mm: mm != -1 and mm < 100)
+        print(distance.report())
+
+        # feed a ColorEventBus: fast readings right after every color change
+        color_poller = AdaptivePoller(color_bus.poll, fast_ms=10, slow_ms=50, name="color")
+        runloop.run(color_poller.run())
+    """
+
+    def __init__(self, read, fast_ms=10, slow_ms=100, change=1, threshold=None, near=0, name="sensor"):
+        self.read = read
+        self.fast_ms = fast_ms
+        self.slow_ms = slow_ms
+        self.change = change
+        self.threshold = threshold
+        self.near = near
+        self.name = name
+        self.interval_ms = fast_ms
+        self.last_value = None
+        self.samples = 0
+        self.fast_samples = 0
+        self.running = False
+        self._start_ms = None
+
+    def sample(self):
+        """Take one reading, choose the wait before the next one, and return the reading."""
+        if self._start_ms is None:
+            self._start_ms = time.ticks_ms()
+
+        value = self.read()
+        self.samples += 1
+
+        busy = self.last_value is None or abs(value - self.last_value) >= self.change
+        if not busy and self.threshold is not None and value >= 0:
+            busy = abs(value - self.threshold) <= self.near
+
+        if busy:
+            self.interval_ms = self.fast_ms
+            self.fast_samples += 1
+        else:
+            self.interval_ms = min(self.slow_ms, self.interval_ms * 2)
+
+        self.last_value = value
+        return value
+
+    async def run(self, handler=None):
+        """Keep sampling (calling handler(value) if given) until stop() is called."""
+        self.running = True
+        while self.running:
+            value = self.sample()
+            if handler is not None:
+                handler(value)
+            await runloop.sleep_ms(self.interval_ms)
+
+    async def until(self, condition):
+        """Keep sampling until condition(value) is True, then return that value."""
+        self.running = True
+        while self.running:
+            value = self.sample()
+            if condition(value):
+                return value
+            await runloop.sleep_ms(self.interval_ms)
+        return self.last_value
+
+    def stop(self):
+        """Tell run() or until() to finish after the current reading."""
+        self.running = False
+
+    def rate_hz(self):
+        """Return the average number of readings per second so far."""
+        if self._start_ms is None:
+            return 0
+        elapsed_ms = time.ticks_diff(time.ticks_ms(), self._start_ms)
+        return self.samples * 1000 / elapsed_ms if elapsed_ms > 0 else 0
+
+    def report(self):
+        """Return a one-line summary of how often the sensor was read."""
+        return "{:s}: {:d} readings, {:.1f} per second, {:d} fast".format(
+            self.name, self.samples, self.rate_hz(), self.fast_samples)
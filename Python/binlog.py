@@ -0,0 +1,123 @@
+# Binary Ring Log
+import struct, time # pyright: ignore[reportMissingImports]
+
+# File header: magic, version, record size, capacity (records), total records ever written
+HEADER_FORMAT = "<4sHHII"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MAGIC = b"SPKL"
+VERSION = 1
+
+# One record: timestamp (ms), event id, four small whole numbers
+RECORD_FORMAT = "<IHhhhh"
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+FIELDS = 4
+
+########################################################################
+# 🗃️ BinaryLog - fixed-size records in a ring file on the hub
+########################################################################
+class BinaryLog:
+    """Write small fixed-size records to a file on the hub instead of printing text.
+
+    Each record is 14 bytes: when it happened (time.ticks_ms), an event id
+    that you choose, and up to four whole numbers between -32768 and 32767.
+    Records are packed into a buffer in memory and written to the file in
+    one go when the buffer fills up (or on flush()).
+
+    The file holds at most capacity records. When it is full the newest
+    record replaces the oldest one, so the file never grows and always keeps
+    the most recent history.
+
+    Pull the file off the hub and turn it into CSV or NumPy arrays with
+    host/binlog_decode.py.
+
+    Args:
+        path (str): File name on the hub.
+            Defaults to "log.bin".
+        capacity (int): Most records kept in the file.
+            Defaults to 4000.
+        buffer_records (int): Records collected in memory before each write.
+            Defaults to 32.
+
+    Example:
+        STATE_CHANGE = 1
+        log = BinaryLog("light_log.bin")
+        log.log(STATE_CHANGE, 1, black_count, white_count)
+        ...
+        log.close()
+
+    Note:
+        - Records still in the buffer are lost if the program stops without
+          flush() or close().
+        - Opening an existing log with the same capacity keeps adding to it.
+    """
+
+    def __init__(self, path="log.bin", capacity=4000, buffer_records=32):
+        self.path = path
+        self.capacity = capacity
+        self.buffer_records = buffer_records
+        self._buffer = bytearray(buffer_records * RECORD_SIZE)
+        self._buffered = 0
+        self.total = 0
+        self._file = self._open()
+
+    def _open(self):
+        try:
+            log_file = open(self.path, "r+b")
+        except OSError:
+            log_file = None  # no log yet
+        if log_file is not None:
+            try:
+                header = log_file.read(HEADER_SIZE)
+                if len(header) == HEADER_SIZE:  # shorter: cut off or not a log
+                    magic, version, record_size, capacity, total = struct.unpack(HEADER_FORMAT, header)
+                    if magic == MAGIC and version == VERSION and record_size == RECORD_SIZE and capacity == self.capacity:
+                        self.total = total
+                        return log_file
+            except OSError:
+                pass
+            log_file.close()
+
+        # New (or incompatible) log: write the header and reserve space for every record
+        log_file = open(self.path, "w+b")
+        log_file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, RECORD_SIZE, self.capacity, 0))
+        zeros = bytes(RECORD_SIZE * 64)
+        remaining = self.capacity * RECORD_SIZE
+        while remaining > 0:
+            chunk = min(remaining, len(zeros))
+            log_file.write(zeros[:chunk])
+            remaining -= chunk
+        log_file.flush()
+        return log_file
+
+    def log(self, event_id, a=0, b=0, c=0, d=0):
+        """Add one record, writing the buffer to the file when it is full."""
+        struct.pack_into(RECORD_FORMAT, self._buffer, self._buffered * RECORD_SIZE,
+                         time.ticks_ms() & 0xFFFFFFFF, event_id, a, b, c, d)
+        self._buffered += 1
+        if self._buffered == self.buffer_records:
+            self.flush()
+
+    def flush(self):
+        """Write buffered records to their places in the ring and update the header."""
+        buffered = self._buffered
+        if buffered == 0:
+            return
+
+        written = 0
+        while written < buffered:
+            slot = (self.total + written) % self.capacity
+            count = min(buffered - written, self.capacity - slot)  # stop at the end of the ring
+            self._file.seek(HEADER_SIZE + slot * RECORD_SIZE)
+            self._file.write(memoryview(self._buffer)[written * RECORD_SIZE:(written + count) * RECORD_SIZE])
+            written += count
+
+        self.total += buffered
+        self._buffered = 0
+        self._file.seek(0)
+        self._file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, RECORD_SIZE, self.capacity, self.total))
+        self._file.flush()
+
+    def close(self):
+        """Flush and close the file."""
+        self.flush()
+        self._file.close()
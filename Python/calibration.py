@@ -0,0 +1,135 @@
+# Reflection Calibration
+import runloop, time, json, motor_pair, color_sensor # pyright: ignore[reportMissingImports]
+from hub import port # pyright: ignore[reportMissingImports]
+
+# Where the calibration is saved on the hub
+CALIBRATION_FILE = "line_calibration.json"
+
+# Smallest light - dark that is a real line. Less than this and the sweep
+# probably never crossed the line (error_scale would blow up tiny changes).
+MIN_SPAN = 20
+
+########################################################################
+# 🎯 ReflectionCalibration - what "dark" and "light" look like on this mat
+########################################################################
+class ReflectionCalibration:
+    """Remember the darkest and lightest reflection seen and work out the line edge from them.
+
+    The edge of the line is halfway between dark and light:
+
+        target_light = (dark + light) / 2
+
+    Different mats (and different rooms) give different dark and light
+    values. error_scale stretches the error so it always looks like the line
+    goes from 0 to 100, so one kp works on every surface:
+
+        error_scale = 100 / (light - dark)
+
+    Args:
+        dark (int): Lowest reflection seen (over the line).
+            Defaults to 0.
+        light (int): Highest reflection seen (over the mat).
+            Defaults to 100.
+
+    Example:
+        calibration = await load_or_calibrate()
+        line_follower = LineFollow(speed=250, kp=6.5, calibration=calibration)
+    """
+
+    def __init__(self, dark=0, light=100):
+        self.dark = dark
+        self.light = light
+
+    @property
+    def target_light(self):
+        return (self.dark + self.light) // 2
+
+    @property
+    def error_scale(self):
+        span = self.light - self.dark
+        return 100 / span if span > 0 else 1.0
+
+    @property
+    def is_usable(self):
+        """True if dark and light are far enough apart to find the line edge."""
+        return self.light - self.dark >= MIN_SPAN
+
+    def normalized_error(self, reflection):
+        """Return (target_light - reflection) stretched to a 0-100 line."""
+        return (self.target_light - reflection) * self.error_scale
+
+    def save(self, path=CALIBRATION_FILE):
+        """Write dark and light to a small file on the hub."""
+        with open(path, "w") as calibration_file:
+            json.dump({"dark": self.dark, "light": self.light}, calibration_file)
+
+    @staticmethod
+    def load(path=CALIBRATION_FILE):
+        """Return the saved calibration, or None if there is no (readable, usable) file."""
+        try:
+            with open(path) as calibration_file:
+                saved = json.load(calibration_file)
+            calibration = ReflectionCalibration(saved["dark"], saved["light"])
+        except (OSError, ValueError, KeyError):
+            return None
+        return calibration if calibration.is_usable else None
+
+    def __str__(self):
+        return "Calibration: dark {:d} light {:d} target_light {:d} error_scale {:.2f}".format(
+            self.dark, self.light, self.target_light, self.error_scale)
+
+########################################################################
+# 🔄 sweep_reflection - wiggle across the line edge and record dark/light
+########################################################################
+async def sweep_reflection(color_port=port.F, pair=motor_pair.PAIR_1, speed=150, sweep_ms=600):
+    """
+    Turn in place left, right and back again while reading reflection.
+
+    Start the robot with the sensor on the line edge. The sweep moves the
+    sensor over both the line and the mat and ends where it started.
+
+    Returns:
+        A ReflectionCalibration with the lowest and highest readings seen.
+    """
+    dark = 100
+    light = 0
+
+    # left, then right twice as long (past the start), then left back to the start
+    for steering, duration_ms in ((-100, sweep_ms), (100, 2 * sweep_ms), (-100, sweep_ms)):
+        motor_pair.move(pair, steering, velocity=speed)
+        start = time.ticks_ms()
+        while time.ticks_diff(time.ticks_ms(), start) < duration_ms:
+            reflection = color_sensor.reflection(color_port)
+            if reflection < dark:
+                dark = reflection
+            if reflection > light:
+                light = reflection
+            await runloop.sleep_ms(5)
+
+    motor_pair.stop(pair)
+    return ReflectionCalibration(dark, light)
+
+########################################################################
+# 💾 load_or_calibrate - use the saved calibration, or sweep and save one
+########################################################################
+async def load_or_calibrate(path=CALIBRATION_FILE, recalibrate=False, **sweep_options):
+    """
+    Load the saved calibration. If there is none (or recalibrate is True), run
+    sweep_reflection() and save the result for next time.
+
+    Note:
+        If the sweep's dark and light are less than MIN_SPAN apart (the sensor
+        never crossed the line), nothing is saved and the default 0-100
+        calibration is used instead, so the next run sweeps again.
+    """
+    calibration = None if recalibrate else ReflectionCalibration.load(path)
+    if calibration is None:
+        calibration = await sweep_reflection(**sweep_options)
+        if calibration.is_usable:
+            calibration.save(path)
+        else:
+            print("Calibration sweep only saw {:d}-{:d}: start on the line edge and try again. Using 0-100 for now.".format(
+                calibration.dark, calibration.light))
+            calibration = ReflectionCalibration()
+    print(calibration)
+    return calibration
@@ -0,0 +1,86 @@
+# Color Event Bus
+import runloop, color_sensor # pyright: ignore[reportMissingImports]
+from hub import port # pyright: ignore[reportMissingImports]
+
+########################################################################
+# 🎨 ColorEventBus - one color sensor reader shared by many handlers
+########################################################################
+class ColorEventBus:
+    """Read the color sensor once per tick and tell handlers when a color starts or ends.
+
+    Instead of three tasks each asking the sensor "is it blue?", "is it yellow?",
+    "is it red?", one task asks "what color is it?" and hands the answer to
+    everyone who cares. Only changes are reported:
+
+        - enter: the sensor just started seeing a color
+        - exit:  the sensor just stopped seeing a color
+
+    Handlers are plain (not async) functions that receive the color code. They
+    run inside the reading task, one after another, so no other task can sneak
+    in between the reading and the handlers.
+
+    Args:
+        color_port: The hub port the color sensor is plugged into.
+            Defaults to port.F.
+        period_ms (int): Milliseconds to wait between readings in run().
+            Not used when something else (like an AdaptivePoller) calls poll().
+            Defaults to 50.
+
+    Example:
+        def when_blue(color_code):
+            light.color(light.POWER, color_code)
+
+        color_bus = ColorEventBus(port.F, 50)
+        color_bus.on_enter(blue, when_blue)
+
+        runloop.run(color_bus.run(), robot_movement())
+
+    Note:
+        - Call stop() from any task to end run().
+        - reads counts every sensor reading, useful to compare against the old
+          one-task-per-color programs.
+    """
+
+    def __init__(self, color_port=port.F, period_ms=50):
+        self.color_port = color_port
+        self.period_ms = period_ms
+        self.current_color = None
+        self.reads = 0
+        self.running = False
+        self._enter_handlers = {}
+        self._exit_handlers = {}
+
+    def on_enter(self, color_code, handler):
+        """Call handler(color_code) every time the sensor starts seeing color_code."""
+        self._enter_handlers.setdefault(color_code, []).append(handler)
+
+    def on_exit(self, color_code, handler):
+        """Call handler(color_code) every time the sensor stops seeing color_code."""
+        self._exit_handlers.setdefault(color_code, []).append(handler)
+
+    def poll(self):
+        """Take one reading, send enter/exit events if the color changed, and return the color."""
+        new_color = color_sensor.color(self.color_port)
+        self.reads += 1
+
+        old_color = self.current_color
+        if new_color != old_color:
+            self.current_color = new_color
+            if old_color is not None:
+                for handler in self._exit_handlers.get(old_color, ()):
+                    handler(old_color)
+            for handler in self._enter_handlers.get(new_color, ()):
+                handler(new_color)
+
+        return new_color
+
+    async def run(self):
+        """Keep reading the sensor until stop() is called."""
+        self.running = True
+        while self.running:
+            self.poll()
+            await runloop.sleep_ms(self.period_ms)
+
+    def stop(self):
+        """Tell run() to finish after the current reading."""
+        self.running = False
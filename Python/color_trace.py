@@ -0,0 +1,47 @@
+# Color Trace Recorder
+from binlog import BinaryLog
+
+# Event ids in a trace file. Readings use the same id as the Christmas Tree Light
+# Detector's LOG_READINGS log, so that log can be replayed as a trace too.
+COLOR_EVENT = 1 # a = color code from color_sensor.color
+TRUTH_EVENT = 3 # a = 1 when the light really is on, 0 when it is really off
+
+########################################################################
+# 🎞️ ColorTrace - timestamped color readings for replaying on the computer
+########################################################################
+class ColorTrace:
+    """Record every color reading, plus what the light was really doing.
+
+    A trace is a BinaryLog file: each reading is one 14-byte record stamped
+    with time.ticks_ms. Whoever is recording marks when the light is really
+    switched on or off, so the replay on the computer (host/light_replay.py)
+    can tell how quickly the detector noticed and when it got it wrong.
+
+    Args:
+        path (str): File name on the hub.
+            Defaults to "light_trace.bin".
+        capacity (int): Most records kept; the oldest are replaced after that.
+            Defaults to 50000 (about 16 minutes at one reading every 20 ms).
+
+    Example:
+        trace = ColorTrace()
+        trace.mark(False)                        # the light starts off
+        trace.reading(color_sensor.color(port.F))
+        ...
+        trace.close()
+    """
+
+    def __init__(self, path="light_trace.bin", capacity=50000):
+        self.log = BinaryLog(path, capacity, buffer_records=64)
+
+    def reading(self, color_code):
+        """Record one color_sensor.color reading."""
+        self.log.log(COLOR_EVENT, color_code)
+
+    def mark(self, light_on):
+        """Record that the light really is on (True) or off (False) from now on."""
+        self.log.log(TRUTH_EVENT, 1 if light_on else 0)
+
+    def close(self):
+        """Write any buffered records and close the file."""
+        self.log.close()
@@ -4,16 +4,16 @@ import color, color_sensor, distance_sensor
 from hub import light, light_matrix, port, sound
 from time import sleep, sleep_ms
 from runloop import run
+from spike_helpers import DEGREES_PER_CM, DEGREES_PER_INCH, MM_PER_INCH
+from spike_helpers import configure, is_near, is_pressed, is_color_red
 
 # Ports on the robot hub
 color_port = port.A
 distance_port = port.B
 force_port = port.E
 
-# Conversion constants
-DEGREES_PER_CM = 21
-DEGREES_PER_INCH = 53
-MM_PER_INCH = 25.4
+# The helpers read these ports, and is_near() means closer than 150mm (6 inches)
+configure(color_port=color_port, distance_port=distance_port, force_port=force_port, near_mm=150)
 
 # how many times we see each color
 blue_count = 0
@@ -34,51 +34,6 @@ last_color = None
 # This is like a stop sign for our program - when it's True, everything stops
 should_stop = False
 
-########################################################################
-# 🛑 is_color_red - Function to check if the color sensor sees red
-########################################################################
-def is_color_red():
-    """
-    Examples:
-        Using with if:            if is_color_red():
-        Using with wait until:    await runloop.until(is_color_red)
-        Using with repeat until:    while not (is_color_red())
-    """
-    return color_sensor.color(color_port) == color.RED
-
-########################################################################
-# 🎯 is_pressed - Function to check if force sensor is pressed
-########################################################################
-def is_pressed():
-    """
-    Examples:
-        Using with if:            if is_pressed():
-        Using with wait until:    await runloop.until(is_pressed)
-        Using with repeat until:    while not (is_pressed())
-    """
-    return force_sensor.pressed(force_port)
-
-########################################################################
-# ☀️ is_near - Function to check if something is near
-########################################################################
-def is_near(distance_threshold=150): # 150mm (6 inches) threshold
-    """
-    Examples:
-        Using with if:                if is_near():
-        Using with wait until        await runloop.until(is_near)
-        Using with repeat until:        while not (is_near()):
-        Using with repeat until:        while not (is_near(200)):# 200mm (8 inches) threshold
-    """
-    distance = distance_sensor.distance(distance_port)
-
-    if distance == -1:
-        print("Warning: Distance sensor not detecting anything")
-        return False
-
-    print ("Distance {:5.2f} cm {:6.2f} inches ".format(distance / 10, distance / 25.4))
-
-    return distance < distance_threshold
-
 ########################################################################
 # 🤖 Test for is_near with wait until and repeat until
 ########################################################################
@@ -98,7 +53,8 @@ async def repeat_until_demo():
             # stop moving
             motor_pair.stop(motor_pair.PAIR_1)
             light.color(light.POWER, color.RED)
-            sleep_ms(10) # Wait 10 milliseconds before checking again
+            await runloop.sleep_ms(10) # Wait 10 milliseconds before checking again
+                                       # (runloop.sleep_ms lets other tasks run while we wait)
 
 runloop.run(repeat_until_demo())
 sys.exit()
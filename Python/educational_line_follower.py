@@ -15,7 +15,9 @@ Key Learning Concepts:
 import runloop, time, sys, motor_pair, motor, force_sensor
 import color, color_sensor, distance_sensor
 from hub import light_matrix, port, sound
-from time import sleep, sleep_ms
+from periodic import PeriodicTask
+from calibration import load_or_calibrate
+from steering_table import SteeringTable
 
 class EducationalLineFollower:
     """
@@ -32,6 +34,18 @@ class EducationalLineFollower:
         target_light (int): The "center line" light value robot tries to stay on
         speed (int): How fast the robot moves forward
         kp (float): The "rubber band strength" - how hard it pulls back to center
+        controller (PIDController): Optional PID controller from pid.py. It adds a
+            "memory" (I) and a "look-ahead" (D) to the rubber band. When given, it
+            computes the steering force instead of kp × error.
+        calibration (ReflectionCalibration): Optional result from calibration.py. The
+            robot measures how dark the line and how light the mat really are, sets
+            the "center line" halfway between them, and stretches the error so the
+            same rubber band works on any mat.
+        integer_mode (bool): Work out the motor speeds for every possible sensor
+            reading before driving and just look them up while driving. It only
+            knows kp, so giving a controller too raises ValueError.
+        motor_output (MotorOutput): Optional layer from motor_output.py that only
+            talks to a motor when its speed really changes.
         
     Example:
         # Create a robot that follows a line
@@ -41,10 +55,22 @@ class EducationalLineFollower:
         await robot.demonstrate_control()
     """
     
-    def __init__(self, target_light: int = 60, speed: int = 150, kp: float = 5.0) -> None:
+    def __init__(self, target_light: int = 60, speed: int = 150, kp: float = 5.0, controller=None,
+                 calibration=None, integer_mode: bool = False, motor_output=None) -> None:
+        if integer_mode and controller is not None:
+            raise ValueError("integer_mode uses kp only; it cannot be combined with a controller")
         self.target_light = target_light  # Our "center line" target
         self.speed = speed                # Forward movement speed
         self.kp = kp                     # "Rubber band strength"
+        self.controller = controller     # Optional PID controller
+        self.error_scale = 1.0           # Stretches error to a 0-100 line
+        if calibration is not None:
+            self.target_light = calibration.target_light
+            self.error_scale = calibration.error_scale
+        self.steering_table = None       # Ready-made answers for integer mode
+        if integer_mode:
+            self.steering_table = SteeringTable(self.target_light, self.speed, self.kp, self.error_scale)
+        self.motor_output = motor_output  # Skips repeated motor commands
         self.iteration = 0
         
         # Educational tracking variables
@@ -61,20 +87,26 @@ class EducationalLineFollower:
         3. Force creates steering correction
         4. Robot self-corrects back to center
         
+        The robot aims to step every 50ms, like a metronome, even on the
+        iterations that stop to print an explanation. If a step runs longer
+        than 50ms (an overrun), the missed beats are skipped and the next step
+        waits for the next 50ms mark. At the end it shows how steady the beat
+        really was.
+        
         Args:
             show_physics (bool): Whether to display physics analogies
         """
         print("\n🚗 Starting Self-Driving Robot Demonstration!")
         print("Watch how the 'force' changes as the robot moves away from center...\n")
         
-        for i in range(100):  # Run for 100 iterations
-            await self.follow_with_physics_explanation(show_physics)
-            await sleep_ms(50)  # Small delay to see the action
+        control_loop = PeriodicTask(50)  # One step every 50ms
+        await control_loop.run(lambda: self.follow_with_physics_explanation(show_physics), iterations=100)
             
         await self.stop_motors()
         print(f"\n📊 Final Stats:")
         print(f"   Max error seen: {self.max_error_seen:.1f}")
         print(f"   Max force generated: {self.max_force_seen:.1f}")
+        print(f"   {control_loop.report()}")
         
     async def follow_with_physics_explanation(self, show_physics: bool = True) -> None:
         """
@@ -83,20 +115,39 @@ class EducationalLineFollower:
         # Step 1: Read the sensor (like robot's "eyes")
         current_light = color_sensor.reflection(port.F)
         
-        # Step 2: Calculate "distance from center" (error)
-        error = self.target_light - current_light
-        distance_from_center = abs(error)
-        
-        # Step 3: Apply physics! Force = kp × distance (like F = ma)
-        steering_force = self.kp * error
-        
-        # Step 4: Convert force to motor speeds
-        left_speed = self.speed + steering_force
-        right_speed = self.speed - steering_force
+        table = self.steering_table
+        if table is not None:
+            # Steps 2-4 in integer mode: the answers were worked out ahead of time
+            table.sync(self.target_light, self.speed, self.kp, self.error_scale)
+            error = self.target_light - current_light
+            distance_from_center = abs(error)
+            left_speed = table.left[current_light]
+            right_speed = table.right[current_light]
+            steering_force = left_speed - self.speed
+        else:
+            # Step 2: Calculate "distance from center" (error)
+            error = (self.target_light - current_light) * self.error_scale
+            distance_from_center = abs(error)
+            
+            # Step 3: Apply physics! Force = kp × distance (like F = ma)
+            # A PID controller also remembers past error (I) and how fast it changes (D)
+            if self.controller is not None:
+                steering_force = self.controller.update(error)
+            else:
+                steering_force = self.kp * error
+            
+            # Step 4: Convert force to motor speeds
+            left_speed = self.speed + steering_force
+            right_speed = self.speed - steering_force
         
         # Step 5: Apply the steering
-        motor.run(port.C, -int(left_speed))
-        motor.run(port.D, int(right_speed))
+        output = self.motor_output
+        if output is not None:
+            output.run(port.C, -int(left_speed))
+            output.run(port.D, int(right_speed))
+        else:
+            motor.run(port.C, -int(left_speed))
+            motor.run(port.D, int(right_speed))
         
         # Track maximum values for educational purposes
         if distance_from_center > self.max_error_seen:
@@ -152,12 +203,17 @@ class EducationalLineFollower:
                 print(f"   Distance {error:2d} → Force {force:5.1f}")
                 
             print(f"   Notice: Stronger 'rubber band' = Bigger forces!")
-            await sleep_ms(1000)
+            await runloop.sleep_ms(1000)
             
     async def stop_motors(self) -> None:
         """🛑 Stop both motors safely"""
-        motor.stop(port.C)
-        motor.stop(port.D)
+        if self.motor_output is not None:
+            self.motor_output.stop(port.C)
+            self.motor_output.stop(port.D)
+            print(f"   {self.motor_output.report()}")
+        else:
+            motor.stop(port.C)
+            motor.stop(port.D)
         print("🛑 Motors stopped safely")
 
 # 🎯 Hands-on Activity Functions for Students
@@ -182,7 +238,7 @@ async def activity_1_understand_error():
         print(f"Sensor reads {pos:2d}, Target is {target:2d} → Error = {error:+3d}")
         
     print("\nNotice: Bigger distance = Bigger error!")
-    await sleep_ms(2000)
+    await runloop.sleep_ms(2000)
 
 async def activity_2_force_equals_distance():
     """
@@ -202,7 +258,7 @@ async def activity_2_force_equals_distance():
         print(f"Distance {distance:2d} → Force {force:5.1f}")
         
     print("\nBigger distance = Bigger force = Sharper turn!")
-    await sleep_ms(2000)
+    await runloop.sleep_ms(2000)
 
 async def activity_3_compare_rubber_bands():
     """
@@ -222,7 +278,7 @@ async def activity_3_compare_rubber_bands():
         print(f"kp = {kp:4.1f} ({strength:6s} rubber band) → Force = {force:5.1f}")
         
     print("\nStronger rubber band = Bigger force = Faster correction!")
-    await sleep_ms(2000)
+    await runloop.sleep_ms(2000)
 
 # 🚗 Main Demonstration Program
 async def main():
@@ -246,8 +302,11 @@ async def main():
     # Set up motors
     motor_pair.pair(motor_pair.PAIR_1, port.C, port.D)
     
+    # Measure the line and the mat (only the first time - after that it is loaded from the hub)
+    calibration = await load_or_calibrate()
+    
     # Create educational robot
-    robot = EducationalLineFollower(target_light=60, speed=150, kp=5.0)
+    robot = EducationalLineFollower(speed=150, kp=5.0, calibration=calibration)
     
     # Demonstrate control
     await robot.demonstrate_control(show_physics=True)
@@ -0,0 +1,90 @@
+# Gyro Turn
+import runloop, time, motor, motor_pair # pyright: ignore[reportMissingImports]
+from hub import motion_sensor # pyright: ignore[reportMissingImports]
+
+########################################################################
+# 🧭 GyroTurn - turn in place to a yaw angle, slowing down near the end
+########################################################################
+class GyroTurn:
+    """Turn the robot in place to an exact yaw angle in one smooth pass.
+
+    Spinning at full speed and braking when the gyro passes the target always
+    overshoots, and then the robot has to turn back. GyroTurn sets the turning
+    speed from how far is left to go: fast at the start, slower and slower as
+    it gets close, then it brakes once it is within tolerance.
+
+        speed = kp × remaining angle   (kept between min_speed and max_speed)
+
+    Angles are in decidegrees, just like motion_sensor.tilt_angles()[0]
+    (900 = 90 degrees). Positive angles are to the left.
+
+    Args:
+        pair: The motor pair to turn with.
+            Defaults to motor_pair.PAIR_1.
+        max_speed (int): Fastest turning speed in degrees per second.
+            Defaults to 440.
+        min_speed (int): Slowest speed, so the robot never stalls short of the target.
+            Defaults to 55.
+        kp (float): Speed per decidegree of remaining angle.
+            Defaults to 1.0.
+        tolerance (int): How close (in decidegrees) counts as "there".
+            Defaults to 10 (1 degree).
+        timeout_ms (int): Give up after this long.
+            Defaults to 3000.
+
+    Example:
+        gyro_turn = GyroTurn()
+        motion_sensor.reset_yaw(0)
+        await gyro_turn.turn_to(900)    # face 90 degrees left
+        print(gyro_turn.report())
+
+    Note:
+        - After each turn, turn_ms is how long it took and final_error is how far
+          from the target the robot ended up after braking.
+    """
+
+    def __init__(self, pair=motor_pair.PAIR_1, max_speed=440, min_speed=55, kp=1.0, tolerance=10, timeout_ms=3000):
+        self.pair = pair
+        self.max_speed = max_speed
+        self.min_speed = min_speed
+        self.kp = kp
+        self.tolerance = tolerance
+        self.timeout_ms = timeout_ms
+        self.turn_ms = 0
+        self.final_error = 0
+
+    def error_to(self, target):
+        """Return target minus the current yaw, wrapped to -1800..1799 decidegrees."""
+        error = target - motion_sensor.tilt_angles()[0]
+        return (error + 1800) % 3600 - 1800
+
+    async def turn_to(self, target):
+        """Turn in place until yaw is within tolerance of target, then brake. Returns final_error."""
+        start = time.ticks_ms()
+
+        while True:
+            error = self.error_to(target)
+            if abs(error) <= self.tolerance:
+                break
+            if time.ticks_diff(time.ticks_ms(), start) >= self.timeout_ms:
+                break
+
+            speed = int(self.kp * abs(error))
+            if speed > self.max_speed:
+                speed = self.max_speed
+            elif speed < self.min_speed:
+                speed = self.min_speed
+
+            # steering -100 spins left (yaw goes up), 100 spins right (yaw goes down)
+            motor_pair.move(self.pair, -100 if error > 0 else 100, velocity=speed)
+            await runloop.sleep_ms(5)
+
+        motor_pair.stop(self.pair, stop=motor.BRAKE)
+
+        self.turn_ms = time.ticks_diff(time.ticks_ms(), start)
+        self.final_error = self.error_to(target)
+        return self.final_error
+
+    def report(self):
+        """Return a one-line summary of the last turn."""
+        return "Turn: {:4d} ms | final error {:+d} decidegrees".format(self.turn_ms, self.final_error)
@@ -4,6 +4,9 @@ import color, color_sensor, distance_sensor # pyright: ignore[reportMissingImpor
 from hub import light, light_matrix, port, sound # pyright: ignore[reportMissingImports]
 from time import sleep, sleep_ms
 from runloop import run # pyright: ignore[reportMissingImports]
+from color_events import ColorEventBus
+from task_group import TaskGroup
+from adaptive_poller import AdaptivePoller
 
 # Variables to count how many times we see each color
 # Think of these like scoreboards that keep track of points
@@ -20,81 +23,72 @@ red = 9
 # Port C and D are where we plugged in our motors
 motor_pair.pair(motor_pair.PAIR_1, port.C, port.D)
 
-# Remember the last color we saw so we don't count the same color twice in a row
-last_color = None
-
-# This is like a stop sign for our program - when it's True, everything stops
-should_stop = False
-
-# This function watches for blue colors
-# The "async" means it can work at the same time as other functions
-async def check_blue():
+# One helper reads the color sensor for everybody
+# It tells the counters below when a new color shows up (color_poller below decides how often it reads)
+color_bus = ColorEventBus(port.F)
+
+# These helpers read a sensor quickly when something is happening and slowly when nothing is
+# The color is read every 10ms right after it changes, and up to every 50ms on plain mat
+# A stripe must stay under the sensor for 50ms to be counted (about 9mm at the default speed)
+color_poller = AdaptivePoller(color_bus.poll, fast_ms=10, slow_ms=50, name="Color")
+# The distance is read every 10ms when a hand is moving or within 150mm, up to every 100ms otherwise
+distance_poller = AdaptivePoller(lambda: distance_sensor.distance(port.B), fast_ms=10, slow_ms=100,
+                                 change=5, threshold=50, near=100, name="Distance")
+
+# This is like a stop sign for our program - when we cancel it, everything stops
+# Cancelling stops the motors and the color bus right away
+group = TaskGroup()
+group.on_cancel(lambda: motor_pair.stop(motor_pair.PAIR_1))
+group.on_cancel(color_poller.stop)
+group.on_cancel(distance_poller.stop)
+
+# This function counts blue colors
+# The color bus calls it the moment the sensor starts seeing blue
+def check_blue(color_code):
     # Use "global" to access variables from outside this function
-    global blue_count, last_color, should_stop
-    
-    # Keep checking until we're told to stop
-    while not should_stop:
-        # Ask the color sensor what color it sees right now
-        current_color = color_sensor.color(port.F)
-        
-        # If we see blue AND it's different from the last color we saw
-        if current_color == blue and last_color != blue:
-            # Light up the hub with the color we found
-            light.color(light.POWER, current_color)
-            # Remember this color for next time
-            last_color = blue
-            # Add 1 to our blue counter
-            blue_count += 1
-        
-        # Wait a tiny bit before checking again (100 milliseconds)
-        await runloop.sleep_ms(100)
-
-# This function watches for yellow colors (works just like check_blue)
-async def check_yellow():
-    global yellow_count, last_color, should_stop
-    while not should_stop:
-        current_color = color_sensor.color(port.F)
-        if current_color == yellow and last_color != yellow:
-            light.color(light.POWER, current_color)
-            last_color = yellow
-            yellow_count += 1
-
-        await runloop.sleep_ms(100)
-
-# This function watches for red colors (works just like the others)
-async def check_red():
-    global red_count, last_color, should_stop
-    while not should_stop:
-        current_color = color_sensor.color(port.F)
-        if current_color == red and last_color != red:
-            light.color(light.POWER, current_color)
-            last_color = red
-            red_count += 1
-
-        await runloop.sleep_ms(100)
+    global blue_count
+
+    # Light up the hub with the color we found
+    light.color(light.POWER, color_code)
+    # Add 1 to our blue counter
+    blue_count += 1
+
+# This function counts yellow colors (works just like check_blue)
+def check_yellow(color_code):
+    global yellow_count
+    light.color(light.POWER, color_code)
+    yellow_count += 1
+
+# This function counts red colors (works just like the others)
+def check_red(color_code):
+    global red_count
+    light.color(light.POWER, color_code)
+    red_count += 1
+
+# Tell the color bus which function to call for each color
+color_bus.on_enter(blue, check_blue)
+color_bus.on_enter(yellow, check_yellow)
+color_bus.on_enter(red, check_red)
+
+# This function answers "is the hand close?" for one distance reading (in millimeters)
+def is_hand_close(distance):
+    # Something is very close (less than 50mm away) and the sensor is working
+    return distance != -1 and distance < 50
 
 # This function watches for someone waving their hand near the robot
 async def check_hand_wave():
-    global blue_count, yellow_count, should_stop
+    global blue_count, yellow_count
     
-    while not should_stop:
-        # Check how far away the nearest object is (in millimeters)
-        distance = distance_sensor.distance(port.B)
-        print("Distance {:6.2f}".format(distance))
-
-        # If something is very close (less than 50mm away) and the sensor is working
-        if distance != -1 and distance < 50:
-            # Stop the motors from moving
-            motor_pair.stop(motor_pair.PAIR_1)
-            # Tell all other functions to stop too
-            should_stop = True
-            # Show our final results - how many of each color we counted
-            print("Blue count:{:2d}  Yellow count:{:2d}  Red count:{:2d}".format(blue_count, yellow_count, red_count))
-            # Exit this loop
-            break
-
-        # Wait a bit before checking distance again
-        await runloop.sleep_ms(100)
+    # Keep reading the distance sensor until a hand is close
+    await distance_poller.until(is_hand_close)
+
+    # Stop the motors and tell all other functions to stop too
+    group.cancel()
+    # Show our final results - how many of each color we counted
+    print("Blue count:{:2d}  Yellow count:{:2d}  Red count:{:2d}".format(blue_count, yellow_count, red_count))
+    # Show how often each sensor was read
+    print(color_poller.report())
+    print(distance_poller.report())
 
 # This is our main function - it starts everything up
 async def main():
@@ -103,7 +97,7 @@ async def main():
 
     # Run all our checking functions at the same time
     # It's like having multiple people doing different jobs simultaneously
-    run(check_blue(), check_yellow(), check_red(), check_hand_wave())
+    run(*group.tasks(color_poller.run(), check_hand_wave()))
 
 # Start our main function and run the whole program
 runloop.run(main())
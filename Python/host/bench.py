@@ -0,0 +1,281 @@
+"""
+⏱️ Hot Function Benchmarks (runs on your computer, not the hub)
+===============================================================
+
+Times the functions the hub programs call over and over - one line
+follower step, one Christmas light check, one distance check, one color
+event - with the spike_sim stand-ins in place of the hardware.
+
+For each function it reports:
+    ns/call     fastest average time per call (best of several repeats)
+    calls/s     throughput at that speed
+    alloc B     memory allocated while one call runs (tracemalloc peak)
+    kept B      memory still held afterwards, per call (grows = leak)
+
+Times on a computer are much shorter than on the hub and include the
+stand-in modules, so compare runs with each other, not with the hub.
+
+A baseline of the results is kept in bench_baseline.json (made with
+--save). When it exists, every run is compared to it and the script
+fails if a function got slower (or allocates more) by more than
+--threshold, so performance changes are measured, not guessed.
+
+Usage:
+    python bench.py                    # run everything, compare to the baseline
+    python bench.py follow_line        # only benchmarks whose name contains this
+    python bench.py --save             # store these results as the new baseline
+    python bench.py --threshold 0.5    # allow 50% before failing
+"""
+
+import argparse, gc, json, os, sys, time, tracemalloc
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HOST_DIR)
+from spike_sim import PYTHON_DIR, Simulator, fresh_import, load_program, port
+
+DEFAULT_BASELINE = os.path.join(HOST_DIR, "bench_baseline.json")
+ALLOCATION_SLACK = 64  # bytes of allocation growth ignored before calling it a regression
+
+class _Silent:
+    """Stand-in for sys.stdout that throws printing away (printing still costs the formatting)."""
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+def step(make_coroutine):
+    """Turn an async step (that never waits) into a plain function to time."""
+    def call():
+        coroutine = make_coroutine()
+        try:
+            coroutine.send(None)
+        except StopIteration:
+            pass
+    return call
+
+def program(name, sim, run_name="__main__"):
+    """Load a hub program without starting it."""
+    saved_stdout, sys.stdout = sys.stdout, _Silent()
+    try:
+        module = load_program(os.path.join(PYTHON_DIR, name), sim, defer=True, run_name=run_name)
+    finally:
+        sys.stdout = saved_stdout
+    for coroutine in sim.deferred:
+        coroutine.close()
+    sim.deferred = []
+    return module
+
+########################################################################
+# 📋 The benchmarks: each setup returns the function to time
+########################################################################
+BENCHMARKS = {}
+
+def benchmark(name):
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+@benchmark("LineFollow.follow_line (print)")
+def _follow_line_print(sim):
+    sim.set_sensor("reflection", port.F, 48)
+    follower = program("line_follower.py", sim).LineFollow(55, 200, 6.5)
+    return step(follower.follow_line)
+
+@benchmark("LineFollow.follow_line (telemetry)")
+def _follow_line_telemetry(sim):
+    sim.set_sensor("reflection", port.F, 48)
+    LineFollow = program("line_follower.py", sim).LineFollow
+    from telemetry import Telemetry
+    telemetry = Telemetry(capacity=1000)
+    follower = LineFollow(55, 200, 6.5, telemetry=telemetry)
+    follow_line = step(follower.follow_line)
+
+    def call():
+        # Start over when full, so every timed call stores a row instead of counting a drop
+        if telemetry.length == telemetry.capacity:
+            telemetry.clear()
+        follow_line()
+    return call
+
+@benchmark("LineFollow.follow_line (integer_mode)")
+def _follow_line_integer(sim):
+    sim.set_sensor("reflection", port.F, 48)
+    LineFollow = program("line_follower.py", sim).LineFollow
+    follower = LineFollow(55, 200, 6.5, integer_mode=True, quiet=True)
+    return step(follower.follow_line)
+
+@benchmark("EducationalLineFollower.follow_with_physics_explanation")
+def _educational(sim):
+    sim.set_sensor("reflection", port.F, 48)
+    follower = program("educational_line_follower.py", sim).EducationalLineFollower(55, 200, 6.5)
+    return step(lambda: follower.follow_with_physics_explanation(False))
+
+@benchmark("analyze_light_state")
+def _analyze_light_state(sim):
+    detector = program("Christmas Tree Light Detector.py", sim)
+    readings = detector.reading_buffer
+    for color_code in (0, 10, -1, 0, 10, 0, -1, 10, 0, 10):
+        readings.push(color_code)
+    return lambda: detector.analyze_light_state(readings)
+
+@benchmark("is_near (quiet)")
+def _is_near_quiet(sim):
+    sim.set_sensor("distance", port.B, 240)
+    spike_helpers = fresh_import("spike_helpers")
+    spike_helpers.configure(quiet=True)
+    return spike_helpers.is_near
+
+@benchmark("is_near (print)")
+def _is_near_print(sim):
+    sim.set_sensor("distance", port.B, 240)
+    return fresh_import("spike_helpers").is_near
+
+@benchmark("line_counter when_blue")
+def _when_blue(sim):
+    return _bind(program("line_counter.py", sim).when_blue, 3)
+
+@benchmark("hand_wave check_blue")
+def _check_blue(sim):
+    return _bind(program("hand_wave.py", sim).check_blue, 3)
+
+@benchmark("ColorEventBus.poll (color change)")
+def _color_bus_poll(sim):
+    # Alternate blue and white so every poll sends an exit and an enter event
+    sim.set_sensor("color", port.F, lambda time_ms: 3 if int(time_ms * 20) % 2 else 10)
+    return program("hand_wave.py", sim).color_bus.poll
+
+@benchmark("determine_winner")
+def _determine_winner(sim):
+    return _bind(program("rock_paper_scissors.py", sim, run_name="rock_paper_scissors").determine_winner,
+                 "paper", "rock")
+
+def _bind(function, *args):
+    return lambda: function(*args)
+
+########################################################################
+# 📏 Measuring
+########################################################################
+def _time(call, number):
+    started = time.perf_counter_ns()
+    for _ in range(number):
+        call()
+    return time.perf_counter_ns() - started
+
+def measure(call, repeats=5, repeat_ns=20_000_000, allocation_calls=200):
+    """Return {"ns_per_call", "calls_per_s", "alloc_bytes", "kept_bytes"} for call."""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        number = 1
+        while _time(call, number) < repeat_ns / 10:
+            number *= 10
+        elapsed = _time(call, number)
+        number = max(1, int(number * repeat_ns / max(elapsed, 1)))
+        ns_per_call = min(_time(call, number) for _ in range(repeats)) / number
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        call()
+        start_current, _ = tracemalloc.get_traced_memory()
+        peak_total = 0
+        for _ in range(allocation_calls):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - before
+        end_current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ns_per_call": round(ns_per_call, 1),
+        "calls_per_s": round(1e9 / ns_per_call) if ns_per_call else 0,
+        "alloc_bytes": round(peak_total / allocation_calls),
+        "kept_bytes": round(max(0, end_current - start_current) / allocation_calls, 1),
+    }
+
+def run_benchmarks(names):
+    results = {}
+    for name in names:
+        sim = Simulator()
+        call = BENCHMARKS[name](sim)
+        saved_stdout, sys.stdout = sys.stdout, _Silent()
+        try:
+            results[name] = measure(call)
+        finally:
+            sys.stdout = saved_stdout
+    return results
+
+########################################################################
+# 📊 Baseline
+########################################################################
+def compare(results, baseline, threshold):
+    """Return (lines, regressions) comparing results with the baseline."""
+    lines = ["%-56s %10s %12s %8s %7s  %s" % ("benchmark", "ns/call", "calls/s", "alloc B", "kept B", "vs baseline")]
+    regressions = []
+    for name, result in results.items():
+        note = ""
+        old = baseline.get(name)
+        if old:
+            change = result["ns_per_call"] / old["ns_per_call"] - 1 if old["ns_per_call"] else 0.0
+            note = "%+6.1f%% time" % (change * 100)
+            if change > threshold:
+                regressions.append("%s: %.0f -> %.0f ns/call" % (name, old["ns_per_call"], result["ns_per_call"]))
+                note += "  SLOWER"
+            grown = result["alloc_bytes"] - old["alloc_bytes"]
+            if grown > ALLOCATION_SLACK and grown > old["alloc_bytes"] * threshold:
+                regressions.append("%s: %d -> %d bytes allocated per call" % (
+                    name, old["alloc_bytes"], result["alloc_bytes"]))
+                note += "  MORE ALLOCATION"
+        lines.append("%-56s %10.0f %12d %8d %7.1f  %s" % (
+            name, result["ns_per_call"], result["calls_per_s"], result["alloc_bytes"], result["kept_bytes"], note))
+    return lines, regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the hub programs' hot functions on stand-in hardware.")
+    parser.add_argument("names", nargs="*", help="only run benchmarks whose name contains one of these")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="write these results into the baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="fail when a benchmark is this much slower than the baseline (default 0.25 = 25%%)")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and stop")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+    names = [name for name in BENCHMARKS if not args.names or any(part in name for part in args.names)]
+    if not names:
+        print("No benchmark matches %s" % ", ".join(args.names), file=sys.stderr)
+        return 1
+
+    results = run_benchmarks(names)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    lines, regressions = compare(results, {} if args.save else baseline, args.threshold)
+    print("\n".join(lines))
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+        print("\nSaved %d results to %s" % (len(results), args.baseline))
+        return 0
+    if regressions:
+        print("\nRegressions past %.0f%%:" % (args.threshold * 100))
+        for regression in regressions:
+            print("  " + regression)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
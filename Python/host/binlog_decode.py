@@ -0,0 +1,94 @@
+"""
+🗃️ Binary Log Decoder (runs on your computer, not the hub)
+=========================================================
+
+Turns a ring log written on the hub by binlog.BinaryLog into CSV or NumPy
+arrays. Records come out oldest first, even after the ring has wrapped.
+
+Usage:
+    python binlog_decode.py light_log.bin                 # CSV to the screen
+    python binlog_decode.py light_log.bin --csv log.csv   # CSV to a file
+    python binlog_decode.py light_log.bin --npz log.npz   # NumPy arrays
+
+In Python:
+    from binlog_decode import read_log, to_numpy
+    records = read_log("light_log.bin")
+    arrays = to_numpy("light_log.bin")
+    arrays["timestamp_ms"], arrays["event_id"], arrays["a"] ...
+"""
+
+import argparse, csv, os, struct, sys
+
+# The record layout lives in the hub module so the two can never disagree
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from binlog import HEADER_FORMAT, HEADER_SIZE, MAGIC, VERSION, RECORD_FORMAT, RECORD_SIZE
+
+COLUMNS = ("timestamp_ms", "event_id", "a", "b", "c", "d")
+
+def read_header(data: bytes) -> tuple:
+    """Return (capacity, total) from the start of a log file, checking it is a log."""
+    if len(data) < HEADER_SIZE:
+        raise ValueError("File is too short to be a binary log")
+    magic, version, record_size, capacity, total = struct.unpack_from(HEADER_FORMAT, data)
+    if magic != MAGIC:
+        raise ValueError("Not a binary log (magic %r)" % magic)
+    if version != VERSION or record_size != RECORD_SIZE:
+        raise ValueError("Unsupported log version %d / record size %d" % (version, record_size))
+    return capacity, total
+
+def _ordered_records(data: bytes) -> bytes:
+    """Return the record bytes oldest first."""
+    capacity, total = read_header(data)
+    body = data[HEADER_SIZE:HEADER_SIZE + capacity * RECORD_SIZE]
+    if total <= capacity:
+        return body[:total * RECORD_SIZE]
+    split = (total % capacity) * RECORD_SIZE
+    return body[split:] + body[:split]
+
+def read_log(path: str) -> list:
+    """Return every record as a (timestamp_ms, event_id, a, b, c, d) tuple, oldest first."""
+    with open(path, "rb") as log_file:
+        records = _ordered_records(log_file.read())
+    return [record for record in struct.iter_unpack(RECORD_FORMAT, records)]
+
+def to_numpy(path: str) -> dict:
+    """Return a dict of NumPy arrays, one per column, oldest first."""
+    import numpy as np
+
+    with open(path, "rb") as log_file:
+        records = _ordered_records(log_file.read())
+    dtype = np.dtype([("timestamp_ms", "<u4"), ("event_id", "<u2"),
+                      ("a", "<i2"), ("b", "<i2"), ("c", "<i2"), ("d", "<i2")])
+    table = np.frombuffer(records, dtype=dtype)
+    return {column: table[column].copy() for column in COLUMNS}
+
+def write_csv(records: list, out) -> None:
+    """Write records (from read_log) as CSV with a header row."""
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(COLUMNS)
+    writer.writerows(records)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Decode a SPIKE hub binary ring log.")
+    parser.add_argument("log", help="log file pulled from the hub")
+    parser.add_argument("--csv", help="write CSV to this file instead of the screen")
+    parser.add_argument("--npz", help="write NumPy arrays to this .npz file")
+    args = parser.parse_args(argv)
+
+    if args.npz:
+        import numpy as np
+        np.savez(args.npz, **to_numpy(args.log))
+        print("Wrote %s" % args.npz)
+        return 0
+
+    records = read_log(args.log)
+    if args.csv:
+        with open(args.csv, "w", newline="") as out:
+            write_csv(records, out)
+        print("Wrote %d records to %s" % (len(records), args.csv))
+    else:
+        write_csv(records, sys.stdout)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+📦 Precompile hub library modules to .mpy (runs on your computer, not the hub)
+=============================================================================
+
+The hub has to compile every .py file it imports before it can run it,
+which takes time and memory at startup. mpy-cross does that compile step
+on your computer instead and writes .mpy bytecode files, which are smaller
+to upload and import straight away.
+
+Install the compiler once (its version must match the hub's MicroPython):
+    pip install mpy-cross
+
+Usage:
+    python build_mpy.py                      # every module the programs import
+    python build_mpy.py spike_helpers pid    # just these
+    python build_mpy.py --mpy-cross /path/to/mpy-cross --out ../build
+
+Upload the .mpy files to the hub next to your program; "import spike_helpers"
+finds spike_helpers.mpy the same way it finds spike_helpers.py.
+"""
+
+import argparse, ast, os, shutil, subprocess, sys
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUT = os.path.join(PYTHON_DIR, "build")
+
+# Folders of the repo that hold host tools or build output, not hub code
+SKIP_DIRS = {"host", "build", "__pycache__"}
+
+# Library modules that no program imports yet: they are added to your own
+# program (like LineFollow's telemetry=, controller= and motor_output=)
+OPTIONAL_MODULES = ["telemetry", "pid", "motor_output"]
+
+def local_imports(path):
+    """Return the names of the Python/ modules a hub file imports."""
+    with open(path, encoding="utf-8") as source_file:
+        try:
+            tree = ast.parse(source_file.read(), path)
+        except SyntaxError:
+            return set()
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+    return {name for name in names if os.path.exists(os.path.join(PYTHON_DIR, name + ".py"))}
+
+def library_modules():
+    """Find the modules to precompile: every Python/ module a hub file imports, plus OPTIONAL_MODULES.
+
+    Programs are uploaded as .py, so only what they import is built, and a
+    new helper is picked up as soon as a program imports it.
+    """
+    modules = set(OPTIONAL_MODULES)
+    for folder, folders, files in os.walk(PYTHON_DIR):
+        folders[:] = [name for name in folders if name not in SKIP_DIRS]
+        for name in files:
+            if name.endswith(".py"):
+                modules.update(local_imports(os.path.join(folder, name)))
+    return sorted(modules)
+
+def find_mpy_cross(explicit=None):
+    """Return a command list that runs mpy-cross, or None if it is not installed."""
+    if explicit:
+        return [explicit]
+    found = shutil.which("mpy-cross")
+    if found:
+        return [found]
+    try:
+        import mpy_cross  # noqa: F401 - the pip package can also run as a module
+        return [sys.executable, "-m", "mpy_cross"]
+    except ImportError:
+        return None
+
+def build(modules, out_dir, mpy_cross, optimize=1):
+    """Compile each module to out_dir/<module>.mpy. Returns (source_bytes, mpy_bytes) totals."""
+    os.makedirs(out_dir, exist_ok=True)
+    source_total = 0
+    mpy_total = 0
+    for module in modules:
+        source = os.path.join(PYTHON_DIR, module + ".py")
+        target = os.path.join(out_dir, module + ".mpy")
+        subprocess.run(mpy_cross + ["-O%d" % optimize, "-o", target, source], check=True)
+        source_size = os.path.getsize(source)
+        mpy_size = os.path.getsize(target)
+        source_total += source_size
+        mpy_total += mpy_size
+        print("%-18s %7d -> %6d bytes" % (module, source_size, mpy_size))
+    return source_total, mpy_total
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompile hub library modules to .mpy bytecode.")
+    parser.add_argument("modules", nargs="*", help="module names (default: every module the programs import)")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="output folder (default: Python/build)")
+    parser.add_argument("--mpy-cross", help="path to the mpy-cross executable")
+    parser.add_argument("-O", dest="optimize", type=int, default=1,
+                        help="optimization level; 1 or more drops asserts and line numbers")
+    args = parser.parse_args(argv)
+
+    mpy_cross = find_mpy_cross(args.mpy_cross)
+    if mpy_cross is None:
+        print("mpy-cross not found. Install it with: pip install mpy-cross", file=sys.stderr)
+        return 1
+
+    modules = args.modules or library_modules()
+    unknown = [module for module in modules if not os.path.exists(os.path.join(PYTHON_DIR, module + ".py"))]
+    if unknown:
+        print("No such module: %s" % ", ".join(unknown), file=sys.stderr)
+        return 1
+
+    source_total, mpy_total = build(modules, args.out, mpy_cross, args.optimize)
+    print("Total %d -> %d bytes (%d%% smaller)" % (
+        source_total, mpy_total, 100 - 100 * mpy_total // source_total if source_total else 0))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
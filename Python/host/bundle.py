@@ -0,0 +1,440 @@
+"""
+📦 Upload Bundler (runs on your computer, not the hub)
+======================================================
+
+Turns a program from Python/ and the helper modules it imports into one
+small file to upload:
+
+- docstrings, comments and blank lines are removed
+- imports that nothing uses are dropped (and repeated ones merged)
+- local helper modules (pid.py, color_events.py, ...) are pasted in
+  ahead of the program, so there is one file to upload and import
+- with --strip-prints, print() calls are removed too, except the ones
+  whose text contains a --keep-print pattern
+- indentation shrinks to one space per level
+
+A helper is only pasted in when that cannot change what the program does:
+its top-level names must not clash with names in the program or the other
+helpers, it must not use globals(), exec or eval, and every file must use
+it through "from helper import ..." rather than "import helper". A helper
+that fails this is written next to the bundle as its own stripped file and
+imported as usual (the report says so), together with the helpers it
+imports.
+
+The hub compiles every .py file it imports, so smaller source also means
+a quicker start. The report estimates the import time from the size.
+
+Usage:
+    python bundle.py line_counter.py                 # writes Python/build/line_counter.py
+    python bundle.py educational_line_follower.py --strip-prints --keep-print "Final Stats"
+    python bundle.py "Christmas Tree Light Detector.py" --out-dir /tmp/upload --mpy
+"""
+
+import argparse, ast, io, os, subprocess, sys, tempfile, tokenize
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+PYTHON_DIR = os.path.dirname(HOST_DIR)
+DEFAULT_OUT = os.path.join(PYTHON_DIR, "build")
+
+# Rough import cost on the hub: compiling source, plus finding and opening each file.
+# Time an import on your own hub and pass --rate to tune the estimate.
+HUB_COMPILE_BYTES_PER_MS = 25
+HUB_FILE_OPEN_MS = 5
+
+UNSAFE_CALLS = {"globals", "locals", "exec", "eval", "__import__"}
+BLOCKS = (ast.If, ast.For, ast.While, ast.With, ast.Try)
+
+########################################################################
+# 🔎 Finding the program's local modules
+########################################################################
+class Unit:
+    """One source file in the bundle: the program or a local helper module."""
+
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+        with open(path, encoding="utf-8") as source:
+            self.source = source.read()
+        self.tree = ast.parse(self.source, path)
+        self.imports = local_imports(self.tree)
+        self.inline = False
+
+def local_module_path(name, search_dir=PYTHON_DIR):
+    path = os.path.join(search_dir, name + ".py")
+    return path if os.path.exists(path) else None
+
+def local_imports(tree, search_dir=PYTHON_DIR):
+    """Names of local modules imported anywhere in tree, in order."""
+    found = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.level == 0:
+            names = [node.module]
+        elif isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        else:
+            continue
+        for name in names:
+            if name and name not in found and local_module_path(name, search_dir):
+                found.append(name)
+    return found
+
+def collect(program_path, search_dir=PYTHON_DIR):
+    """Return the program and every local module it needs, helpers first (dependencies before users)."""
+    units = {}
+    order = []
+
+    def visit(name, path):
+        if name in units:
+            return
+        unit = units[name] = Unit(name, path)
+        for module in unit.imports:
+            visit(module, local_module_path(module, search_dir))
+        order.append(unit)
+
+    visit("__main__", program_path)
+    return order
+
+########################################################################
+# 🧭 Deciding what can be pasted in
+########################################################################
+def top_level_bindings(tree):
+    """Map each global name a module binds to where it comes from.
+
+    Imports map to ("import", module, name) so two files importing the same
+    thing do not count as a clash; everything else maps to ("define",).
+    """
+    bindings = {}
+
+    def bind(name, origin):
+        bindings.setdefault(name, origin)
+
+    def visit(statements):
+        for node in statements:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    bind(alias.asname or alias.name.split(".")[0], ("import", alias.name, None))
+            elif isinstance(node, ast.ImportFrom):
+                for alias in node.names:
+                    bind(alias.asname or alias.name, ("import", node.module, alias.name))
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                bind(node.name, ("define",))
+            elif isinstance(node, BLOCKS):
+                # if/for/while/with/try run at module level, so their bodies bind globals too
+                heads = [node.target] if isinstance(node, ast.For) else [
+                    item.optional_vars for item in getattr(node, "items", []) if item.optional_vars]
+                for head in heads:
+                    bind_stores(head)
+                for field in ("body", "orelse", "finalbody"):
+                    visit(getattr(node, field, []))
+                for handler in getattr(node, "handlers", []):
+                    if handler.name:
+                        bind(handler.name, ("define",))
+                    visit(handler.body)
+            else:
+                bind_stores(node)
+
+    def bind_stores(node):
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store):
+                bind(child.id, ("define",))
+
+    visit(tree.body)
+    # "global x" inside a function also makes x a module name
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Global):
+            for name in node.names:
+                bind(name, ("define",))
+    return bindings
+
+def uses_unsafe_calls(tree):
+    return any(isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in UNSAFE_CALLS
+               for node in ast.walk(tree))
+
+def plan_inlining(units):
+    """Mark which helper modules can be pasted into the bundle. Returns {module: reason} for the rest."""
+    program = units[-1]
+    helpers = units[:-1]
+    by_name = {unit.name: unit for unit in units}
+    reasons = {}
+
+    # "import waits" needs a real waits module to look names up in, so only
+    # helpers used through "from waits import ..." can be pasted in
+    imported_whole = {}
+    for unit in units:
+        for node in ast.walk(unit.tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    imported_whole.setdefault(alias.name, unit)
+
+    for unit in helpers:
+        if uses_unsafe_calls(unit.tree):
+            reasons[unit.name] = "uses globals()/exec/eval"
+        elif unit.name in imported_whole:
+            reasons[unit.name] = "%s has \"import %s\"" % (_label(imported_whole[unit.name]), unit.name)
+
+    # A helper that is kept separate imports its own helpers, so they must stay separate too
+    changed = True
+    while changed:
+        changed = False
+        for name in list(reasons):
+            for module in by_name[name].imports:
+                if module not in reasons:
+                    reasons[module] = "imported by %s, which stays separate" % name
+                    changed = True
+
+        # Clashing top-level names between files that will share one namespace
+        shared = [unit for unit in units if unit is program or unit.name not in reasons]
+        bindings = {unit.name: top_level_bindings(unit.tree) for unit in shared}
+        for unit in shared:
+            if unit is program:
+                continue
+            own = bindings[unit.name]
+            for other in shared:
+                if other is unit:
+                    continue
+                for name, origin in own.items():
+                    theirs = bindings[other.name].get(name)
+                    if theirs is None or (origin[0] == "import" and origin == theirs):
+                        continue
+                    if theirs == ("import", unit.name, name):
+                        continue  # the other file imports this very name from unit
+                    reasons[unit.name] = "%r is also defined in %s" % (name, _label(other))
+                    changed = True
+                    break
+                if unit.name in reasons:
+                    break
+            if changed:
+                break
+
+    for unit in helpers:
+        unit.inline = unit.name not in reasons
+    return reasons
+
+def _label(unit):
+    return "the program" if unit.name == "__main__" else unit.name + ".py"
+
+########################################################################
+# ✂️ Stripping
+########################################################################
+class Stripper(ast.NodeTransformer):
+    """Remove docstrings, bare strings, inlined-module imports and (optionally) prints."""
+
+    def __init__(self, inlined, strip_prints=False, keep_prints=(), drop_main_block=False):
+        self.inlined = inlined
+        self.strip_prints = strip_prints
+        self.keep_prints = keep_prints
+        self.drop_main_block = drop_main_block
+        self.prints_removed = 0
+
+    def visit_Expr(self, node):
+        if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+            return None  # docstring or a string used as a comment
+        if self.strip_prints and _is_print(node.value):
+            text = ast.unparse(node.value)
+            if not any(pattern in text for pattern in self.keep_prints):
+                self.prints_removed += 1
+                return None
+        return self.generic_visit(node)
+
+    def visit_ImportFrom(self, node):
+        if node.level == 0 and node.module in self.inlined:
+            # The names already exist in the bundle; only renamed ones need an assignment
+            return [ast.Assign([ast.Name(alias.asname, ast.Store())], ast.Name(alias.name, ast.Load()))
+                    for alias in node.names if alias.asname and alias.asname != alias.name] or None
+        return node
+
+    def visit_If(self, node):
+        if self.drop_main_block and _is_main_check(node.test):
+            return node.orelse or None
+        return self.generic_visit(node)
+
+def _is_print(node):
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "print"
+
+def _is_main_check(test):
+    return (isinstance(test, ast.Compare) and isinstance(test.left, ast.Name) and test.left.id == "__name__"
+            and len(test.comparators) == 1 and isinstance(test.comparators[0], ast.Constant)
+            and test.comparators[0].value == "__main__")
+
+def drop_unused_imports(tree):
+    """Remove imported names nothing reads, and top-level imports repeated from earlier. Returns count removed."""
+    used = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Store)}
+    seen = set()
+    removed = 0
+
+    def keep(alias, key, top_level):
+        bound = alias.asname or alias.name.split(".")[0]
+        if bound not in used:
+            return False
+        if top_level:
+            if key in seen:
+                return False
+            seen.add(key)
+        return True
+
+    def clean(statements, top_level):
+        nonlocal removed
+        result = []
+        for node in statements:
+            if isinstance(node, ast.Import):
+                names = [alias for alias in node.names if keep(alias, ("import", alias.name, alias.asname), top_level)]
+            elif isinstance(node, ast.ImportFrom):
+                names = [alias for alias in node.names
+                         if keep(alias, ("from", node.module, alias.name, alias.asname), top_level)]
+            else:
+                for field in ("body", "orelse", "finalbody"):
+                    if isinstance(getattr(node, field, None), list):
+                        setattr(node, field, clean(getattr(node, field), top_level and not isinstance(
+                            node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))))
+                for handler in getattr(node, "handlers", []) or []:
+                    handler.body = clean(handler.body, False)
+                result.append(node)
+                continue
+            removed += len(node.names) - len(names)
+            if names:
+                node.names = names
+                result.append(node)
+        return result
+
+    tree.body = clean(tree.body, True)
+    return removed
+
+def fill_empty_bodies(tree):
+    """Put pass into any block left empty by stripping."""
+    for node in ast.walk(tree):
+        if isinstance(getattr(node, "body", None), list) and not node.body:
+            node.body.append(ast.Pass())
+    return tree
+
+def compact(source, indent=1):
+    """Drop blank lines and shrink 4-space indentation to indent spaces (strings are left alone)."""
+    inside_string = set()
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        if token.type == tokenize.STRING and token.end[0] > token.start[0]:
+            inside_string.update(range(token.start[0] + 1, token.end[0] + 1))
+    lines = []
+    for number, line in enumerate(source.splitlines(), 1):
+        if number in inside_string:
+            lines.append(line)
+            continue
+        if not line.strip():
+            continue
+        stripped = line.lstrip(" ")
+        lines.append(" " * ((len(line) - len(stripped)) // 4 * indent) + stripped)
+    return "\n".join(lines) + "\n"
+
+########################################################################
+# 🏗️ Building
+########################################################################
+def strip_unit(unit, inlined, strip_prints, keep_prints):
+    stripper = Stripper(inlined, strip_prints, keep_prints, drop_main_block=unit.name != "__main__" and unit.inline)
+    tree = stripper.visit(ast.parse(unit.source, unit.path))
+    return tree, stripper.prints_removed
+
+def build(program_path, out_dir=DEFAULT_OUT, strip_prints=False, keep_prints=(), indent=1):
+    """Bundle a program. Returns a report dict (files written, sizes, what was inlined)."""
+    units = collect(program_path)
+    kept_separate = plan_inlining(units)
+    inlined = {unit.name for unit in units if unit.inline}
+    prints_removed = 0
+
+    # The bundle: inlined helpers first, then the program, in one namespace
+    body = []
+    for unit in units:
+        if unit.inline or unit.name == "__main__":
+            tree, removed = strip_unit(unit, inlined, strip_prints, keep_prints)
+            prints_removed += removed
+            body.extend(tree.body)
+    bundle = ast.Module(body=body, type_ignores=[])
+    imports_removed = drop_unused_imports(bundle)
+    outputs = {os.path.basename(program_path): _finish(bundle, indent)}
+
+    # Helpers that could not be pasted in are stripped on their own
+    for unit in units:
+        if unit.name != "__main__" and not unit.inline:
+            tree, removed = strip_unit(unit, inlined, strip_prints, keep_prints)
+            prints_removed += removed
+            imports_removed += drop_unused_imports(tree)
+            outputs[unit.name + ".py"] = _finish(tree, indent)
+
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    for file_name, text in outputs.items():
+        path = os.path.join(out_dir, file_name)
+        with open(path, "w", encoding="utf-8") as out:
+            out.write(text)
+        compile(text, path, "exec")  # the result must still be valid Python
+        written.append(path)
+
+    return {
+        "units": units,
+        "kept_separate": kept_separate,
+        "written": written,
+        "source_bytes": sum(len(unit.source.encode()) for unit in units),
+        "bundle_bytes": sum(len(text.encode()) for text in outputs.values()),
+        "prints_removed": prints_removed,
+        "imports_removed": imports_removed,
+    }
+
+def _finish(tree, indent):
+    return compact(ast.unparse(ast.fix_missing_locations(fill_empty_bodies(tree))), indent)
+
+def estimate_import_ms(total_bytes, files, rate=HUB_COMPILE_BYTES_PER_MS):
+    return total_bytes / rate + files * HUB_FILE_OPEN_MS
+
+def mpy_size(paths):
+    """Total .mpy size of paths using mpy-cross, or None when it is not installed."""
+    from build_mpy import find_mpy_cross
+
+    mpy_cross = find_mpy_cross()
+    if mpy_cross is None:
+        return None
+    total = 0
+    with tempfile.TemporaryDirectory() as temporary:
+        for path in paths:
+            target = os.path.join(temporary, os.path.basename(path)[:-3] + ".mpy")
+            subprocess.run(mpy_cross + ["-o", target, path], check=True)
+            total += os.path.getsize(target)
+    return total
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bundle a hub program and its helper modules into one small file.")
+    parser.add_argument("program", help="program file, for example line_counter.py (looked up in Python/)")
+    parser.add_argument("--out-dir", default=DEFAULT_OUT, help="where to write (default: Python/build)")
+    parser.add_argument("--strip-prints", action="store_true", help="remove print() calls")
+    parser.add_argument("--keep-print", action="append", default=[], metavar="TEXT",
+                        help="with --strip-prints, keep prints whose code contains TEXT (repeatable)")
+    parser.add_argument("--indent", type=int, default=1, help="spaces per indentation level (default 1)")
+    parser.add_argument("--rate", type=float, default=HUB_COMPILE_BYTES_PER_MS,
+                        help="hub compile speed in bytes per ms for the import estimate")
+    parser.add_argument("--mpy", action="store_true", help="also report the size after mpy-cross")
+    args = parser.parse_args(argv)
+
+    program_path = args.program if os.path.exists(args.program) else os.path.join(PYTHON_DIR, args.program)
+    if not os.path.exists(program_path):
+        print("No such program: %s" % args.program, file=sys.stderr)
+        return 1
+
+    report = build(program_path, args.out_dir, args.strip_prints, args.keep_print, args.indent)
+    units = report["units"]
+    print("Sources: %s" % ", ".join(os.path.basename(unit.path) for unit in units))
+    print("Inlined: %s" % (", ".join(unit.name + ".py" for unit in units if unit.inline) or "none"))
+    for name, reason in report["kept_separate"].items():
+        print("Separate: %s.py (%s)" % (name, reason))
+    print("Removed: %d unused imports, %d prints" % (report["imports_removed"], report["prints_removed"]))
+
+    before = report["source_bytes"]
+    after = report["bundle_bytes"]
+    print("Size: %d -> %d bytes (%d%% smaller)" % (before, after, 100 - 100 * after // before if before else 0))
+    print("Estimated hub import: %.0f ms -> %.0f ms" % (
+        estimate_import_ms(before, len(units), args.rate),
+        estimate_import_ms(after, len(report["written"]), args.rate)))
+    if args.mpy:
+        compiled = mpy_size(report["written"])
+        print("After mpy-cross: %s" % ("%d bytes" % compiled if compiled is not None else "mpy-cross not found"))
+    for path in report["written"]:
+        print("Wrote %s" % path)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+⏱️ Event-to-Actuation Latency in the Simulator (runs on your computer, not the hub)
+===================================================================================
+
+Runs hub programs in spike_sim many times. Each run, a sensor changes at a
+random moment (a hand comes close), and the time until the program gives its
+response command (the motors stop) is recorded. Where the moment falls
+relative to each task's sleeps and moves is what makes the delay vary, so
+many runs give the whole spread, printed as a histogram for each program.
+
+The sensor is scripted and the command is caught as the simulator sees it,
+so nothing is added to the program and the numbers are exact on the virtual
+clock. (On the hub, latency.LatencyTracer measures the same thing from
+inside the program; line_counter.py has it behind TRACE_LATENCY.)
+
+Give several programs to see which task structure responds fastest.
+
+Usage:
+    python latency_sim.py line_counter.py                              # 100 runs, hand at B
+    python latency_sim.py line_counter.py hand_wave.py --event distance:B=500:30 --runs 300
+    python latency_sim.py my_program.py --event force:E=0:10 --actuator motor.stop
+
+--event KIND:PORT=BEFORE:AFTER sets what the sensor reads before and after
+the event; --actuator names the command that counts as the response (the
+first one after the event), and can be given more than once.
+"""
+
+import argparse, contextlib, io, os, random, sys, time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HOST_DIR)
+from spike_sim import PYTHON_DIR, Simulator, install, port, run_program
+
+install()  # latency.py imports runloop and time, which must be the stand-ins
+from latency import LatencyStats, LatencyTracer
+
+def parse_event(text):
+    """Turn "distance:B=500:30" into ("distance", port.B, 500, 30)."""
+    try:
+        target, values = text.split("=", 1)
+        kind, port_name = target.split(":", 1)
+        before, after = (int(value) for value in values.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected KIND:PORT=BEFORE:AFTER, got %r" % text)
+    sensor_port = getattr(port, port_name.upper(), None)
+    if sensor_port is None:
+        raise argparse.ArgumentTypeError("unknown port %r" % port_name)
+    return kind, sensor_port, before, after
+
+def measure(path, event, actuators, onset_ms, timeout_ms=2000):
+    """Run a program once with the event at onset_ms. Returns the delay in microseconds, or None if no response."""
+    kind, sensor_port, before, after = event
+    responses = []
+
+    def listen(now_us, name, args):
+        if name in actuators and now_us >= onset_ms * 1000 and not responses:
+            responses.append(now_us - onset_ms * 1000)
+
+    sim = Simulator()
+    sim.set_sensor(kind, sensor_port, [(0, before), (onset_ms, after)])
+    sim.listeners.append(listen)
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_program(path, duration_ms=onset_ms + timeout_ms, sim=sim)
+    return responses[0] if responses else None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure event-to-actuation latency of hub programs in the simulator.")
+    parser.add_argument("programs", nargs="+", help="hub programs (looked up in Python/ too)")
+    parser.add_argument("--event", type=parse_event, default=parse_event("distance:B=500:30"),
+                        help="KIND:PORT=BEFORE:AFTER (default distance:B=500:30)")
+    parser.add_argument("--actuator", action="append", help="response command (default motor_pair.stop)")
+    parser.add_argument("--runs", type=int, default=100, help="runs per program (default 100)")
+    parser.add_argument("--earliest", type=float, default=1.0, help="earliest event time in seconds")
+    parser.add_argument("--latest", type=float, default=10.0, help="latest event time in seconds")
+    parser.add_argument("--timeout", type=float, default=2000, help="ms to wait for the response (default 2000)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    actuators = set(args.actuator or ["motor_pair.stop"])
+
+    # Every program sees the same event times
+    rng = random.Random(args.seed)
+    onsets = [int(rng.uniform(args.earliest, args.latest) * 1000) for _ in range(args.runs)]
+
+    tracer = LatencyTracer()
+    missed = {}
+    started = time.perf_counter()
+    for program in args.programs:
+        path = program if os.path.exists(program) else os.path.join(PYTHON_DIR, program)
+        name = os.path.basename(path)
+        stats = tracer.stats[name] = LatencyStats(name)
+        missed[name] = 0
+        for onset_ms in onsets:
+            latency_us = measure(path, args.event, actuators, onset_ms, args.timeout)
+            if latency_us is None:
+                missed[name] += 1
+            else:
+                stats.add(latency_us)
+
+    tracer.report()
+    print()
+    for name, count in missed.items():
+        if count:
+            print("%s: no %s within %d ms in %d of %d runs" % (
+                name, " / ".join(sorted(actuators)), args.timeout, count, args.runs))
+    print("%d runs of %d programs in %.1f s" % (args.runs, len(args.programs), time.perf_counter() - started))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+🎄 Light Trace Replay (runs on your computer, not the hub)
+==========================================================
+
+Streams recorded color sensor traces through the Christmas Tree Light
+Detector's own monitor_christmas_light() loop, using the spike_sim stand-ins
+and a virtual clock, so an hour of recording replays in well under a second.
+
+Record a trace on the hub with light_trace_recorder.py (or turn on
+LOG_READINGS in the detector; that log replays too, but has no marks of when
+the light was really switched). For every trace and every combination of
+settings it reports:
+    changes     how many times the detector changed state
+    false       changes to "on" or "off" while the light was really the other way
+    missed      real switches the detector never noticed before the next one
+    latency     time from a real switch until the detector showed it
+
+Usage:
+    python light_replay.py light_trace.bin                       # the detector's own settings
+    python light_replay.py trace1.bin trace2.csv --buffer-size 4:20:2 --off-tolerance 0,1,2
+    python light_replay.py traces/*.bin --on-count 1,2 --check-every 50,100 --per-trace
+
+Traces are .bin files pulled off the hub or the CSV binlog_decode.py makes
+from one. Lists of values are comma lists or START:STOP:STEP (STOP included);
+a setting left out keeps the value in the detector program.
+
+In Python:
+    from light_replay import read_trace, replay
+    result = replay(read_trace("light_trace.bin"), buffer_size=6)
+    result["false_toggles"], result["latencies_ms"]
+"""
+
+import argparse, bisect, contextlib, csv, io, itertools, os, sys, time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HOST_DIR)
+from spike_sim import PYTHON_DIR, Simulator, load_program
+from binlog_decode import read_log
+from color_trace import COLOR_EVENT, TRUTH_EVENT
+
+DETECTOR = os.path.join(PYTHON_DIR, "Christmas Tree Light Detector.py")
+TICKS_PERIOD = 1 << 32  # time.ticks_ms wraps around here
+SETTINGS = ("buffer_size", "off_tolerance", "on_count", "check_every_ms")
+
+class Trace:
+    """Color readings and real light states from one recording, in ms from its start."""
+
+    def __init__(self, name, readings, truth):
+        self.name = name
+        self.readings = readings  # [(time_ms, color_code), ...]
+        self.truth = truth        # [(time_ms, light_on), ...]
+
+    @property
+    def duration_ms(self):
+        return self.readings[-1][0] if self.readings else 0
+
+def read_trace(path):
+    """Read a trace from a hub log (.bin) or its CSV."""
+    if path.lower().endswith(".csv"):
+        with open(path, newline="") as trace_file:
+            records = [(int(row["timestamp_ms"]), int(row["event_id"]), int(row["a"]))
+                       for row in csv.DictReader(trace_file)]
+    else:
+        records = [record[:3] for record in read_log(path)]
+
+    readings, truth = [], []
+    elapsed = 0
+    previous = records[0][0] if records else 0
+    for timestamp, event_id, value in records:
+        elapsed += (timestamp - previous) % TICKS_PERIOD
+        previous = timestamp
+        if event_id == COLOR_EVENT:
+            readings.append((elapsed, value))
+        elif event_id == TRUTH_EVENT:
+            truth.append((elapsed, bool(value)))
+    return Trace(os.path.basename(path), readings, truth)
+
+########################################################################
+# ▶️ Replaying through the detector
+########################################################################
+def replay(trace, buffer_size=None, off_tolerance=None, on_count=None, check_every_ms=None):
+    """Run monitor_christmas_light() over a trace. Settings left as None keep the program's values.
+
+    Returns the dict from score(), plus "transitions": [(time_ms, state), ...].
+    """
+    sim = Simulator()
+    with contextlib.redirect_stdout(io.StringIO()):
+        detector = load_program(DETECTOR, sim, defer=True)
+    for coroutine in sim.deferred:
+        coroutine.close()
+    sim.deferred = []
+
+    detector.SHOW_READINGS = False
+    if buffer_size is not None:
+        detector.BUFFER_SIZE = buffer_size
+        detector.reading_buffer = detector.ColorRingBuffer(buffer_size)
+    if off_tolerance is not None:
+        detector.OFF_TOLERANCE = off_tolerance
+    if on_count is not None:
+        detector.ON_COUNT = on_count
+    if check_every_ms is not None:
+        detector.CHECK_EVERY_MS = check_every_ms
+
+    # The detector calls set_hub_led exactly when its state changes
+    start_ms = sim.now_ms
+    transitions = []
+    detector.set_hub_led = lambda state: transitions.append((sim.now_ms - start_ms, state))
+    sim.set_sensor("color", detector.color_port, [(start_ms + time_ms, color_code)
+                                                  for time_ms, color_code in trace.readings])
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim.run(detector.monitor_christmas_light(), duration_ms=trace.duration_ms)
+
+    result = score(transitions, trace.truth, trace.duration_ms)
+    result["transitions"] = transitions
+    return result
+
+def score(transitions, truth, end_ms):
+    """Compare the detector's state changes with the marked real light states.
+
+    Returns {"changes", "latencies_ms", "missed", "false_toggles"}; without
+    marks only "changes" is known and missed/false_toggles are None.
+    """
+    result = {"changes": len(transitions), "latencies_ms": [], "missed": None, "false_toggles": None}
+    if not truth:
+        return result
+    change_times = [time_ms for time_ms, _ in transitions]
+    truth_times = [time_ms for time_ms, _ in truth]
+
+    def detector_state(time_ms):
+        index = bisect.bisect_right(change_times, time_ms) - 1
+        return transitions[index][1] if index >= 0 else "unknown"
+
+    # The first mark is how the light started; every later change is a real switch
+    missed = 0
+    for index in range(1, len(truth)):
+        switched_ms, light_on = truth[index]
+        if light_on == truth[index - 1][1]:
+            continue
+        wanted = "on" if light_on else "off"
+        until_ms = truth[index + 1][0] if index + 1 < len(truth) else end_ms
+        if detector_state(switched_ms) == wanted:
+            result["latencies_ms"].append(0)
+            continue
+        first = bisect.bisect_left(change_times, switched_ms)
+        for time_ms, state in transitions[first:]:
+            if time_ms >= until_ms:
+                break
+            if state == wanted:
+                result["latencies_ms"].append(time_ms - switched_ms)
+                break
+        else:
+            missed += 1
+
+    false_toggles = 0
+    for time_ms, state in transitions:
+        index = bisect.bisect_right(truth_times, time_ms) - 1
+        if index >= 0 and state in ("on", "off") and (state == "on") != truth[index][1]:
+            false_toggles += 1
+    result["missed"] = missed
+    result["false_toggles"] = false_toggles
+    return result
+
+########################################################################
+# 📊 Comparing settings
+########################################################################
+def parse_values(text):
+    """Turn "4:20:2" or "5,10" into a list of whole numbers (STOP included)."""
+    if ":" in text:
+        start, stop, step = (int(part) for part in text.split(":"))
+        return list(range(start, stop + 1, step))
+    return [int(part) for part in text.split(",")]
+
+def summarize(results):
+    """Add up replay results over several traces."""
+    latencies = [latency for result in results for latency in result["latencies_ms"]]
+    marked = [result for result in results if result["false_toggles"] is not None]
+    return {
+        "changes": sum(result["changes"] for result in results),
+        "false_toggles": sum(result["false_toggles"] for result in marked) if marked else None,
+        "missed": sum(result["missed"] for result in marked) if marked else None,
+        "mean_latency_ms": sum(latencies) / len(latencies) if latencies else None,
+        "worst_latency_ms": max(latencies) if latencies else None,
+    }
+
+def format_row(label, summary):
+    def number(value, width, form="%d"):
+        return (form % value).rjust(width) if value is not None else "-".rjust(width)
+    return "%-34s %7d %6s %6s %9s %9s" % (
+        label, summary["changes"], number(summary["false_toggles"], 6), number(summary["missed"], 6),
+        number(summary["mean_latency_ms"], 9, "%.0f"), number(summary["worst_latency_ms"], 9))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay color sensor traces through the Christmas light detector.")
+    parser.add_argument("traces", nargs="+", help="trace files (.bin from the hub, or CSV)")
+    parser.add_argument("--buffer-size", help="BUFFER_SIZE values, e.g. 4:20:2")
+    parser.add_argument("--off-tolerance", help="OFF_TOLERANCE values, e.g. 0,1,2")
+    parser.add_argument("--on-count", help="ON_COUNT values, e.g. 1,2,3")
+    parser.add_argument("--check-every", help="CHECK_EVERY_MS values, e.g. 50,100")
+    parser.add_argument("--per-trace", action="store_true", help="also show each trace on its own")
+    parser.add_argument("--top", type=int, default=20, help="settings to show")
+    args = parser.parse_args(argv)
+
+    traces = [read_trace(path) for path in args.traces]
+    choices = [parse_values(text) if text else [None]
+               for text in (args.buffer_size, args.off_tolerance, args.on_count, args.check_every)]
+    combinations = [dict(zip(SETTINGS, values)) for values in itertools.product(*choices)]
+
+    started = time.perf_counter()
+    rows = []
+    for settings in combinations:
+        results = [replay(trace, **settings) for trace in traces]
+        rows.append((settings, results, summarize(results)))
+    elapsed = time.perf_counter() - started
+
+    # Fewest mistakes first, then the quickest to notice
+    def order(row):
+        summary = row[2]
+        mistakes = (summary["false_toggles"] or 0) + (summary["missed"] or 0)
+        return (mistakes, summary["mean_latency_ms"] if summary["mean_latency_ms"] is not None else float("inf"))
+    rows.sort(key=order)
+
+    print("%-34s %7s %6s %6s %9s %9s" % ("settings", "changes", "false", "missed", "mean ms", "worst ms"))
+    for settings, results, summary in rows[:args.top]:
+        label = " ".join("%s=%s" % (name.split("_")[0], value) for name, value in settings.items() if value is not None)
+        print(format_row(label or "program settings", summary))
+        if args.per_trace:
+            for trace, result in zip(traces, results):
+                print(format_row("  " + trace.name, summarize([result])))
+
+    replayed_s = sum(trace.duration_ms for trace in traces) * len(combinations) / 1000
+    print()
+    print("Replayed %.0f s of traces (%d settings x %d traces) in %.2f s (%.0fx real time)" % (
+        replayed_s, len(combinations), len(traces), elapsed, replayed_s / elapsed if elapsed else 0))
+    if not any(trace.truth for trace in traces):
+        print("No marks of the real light state in these traces, so only changes are counted.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
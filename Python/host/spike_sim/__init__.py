@@ -0,0 +1,29 @@
+"""
+🖥️ SPIKE hub stand-in for your computer
+=======================================
+
+Lets the programs in Python/ run on a computer, faster than real time.
+It provides hub, motor, motor_pair, color_sensor, distance_sensor,
+force_sensor, color, app and runloop, plus a time module whose clock is
+virtual: sleeping or waiting only moves the simulated clock forward, so a
+minute of robot time takes milliseconds.
+
+Sensors are scripted on the Simulator:
+
+    from spike_sim import port, run_program
+    from spike_sim import color
+
+    def setup(sim):
+        sim.set_sensor("color", port.F, [(0, color.BLACK), (2000, color.WHITE)])
+        sim.set_sensor("distance", port.B, lambda time_ms: 80 if time_ms > 5000 else 500)
+
+    program, sim = run_program("../line_counter.py", duration_ms=60000, setup=setup)
+
+Or from the command line (in Python/host):
+
+    python -m spike_sim ../line_counter.py --seconds 60 --set color:F=3 --set distance:B=80
+"""
+
+from .simulator import SimulationLimit, Simulator, Wait, active
+from .loader import PYTHON_DIR, fresh_import, install, load_program, run_program, uninstall
+from .hub import port
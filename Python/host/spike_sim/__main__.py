@@ -0,0 +1,70 @@
+"""
+Run a hub program in the simulator.
+
+    python -m spike_sim ../line_counter.py --seconds 60 --set color:F=3 --set distance:B=80
+    python -m spike_sim "../Christmas Tree Light Detector.py" --scenario blinking_tree.py
+
+--set KIND:PORT=VALUE fixes a sensor (kinds: color, reflection, distance,
+force, pressed, button). A --scenario file defines setup(sim) for anything
+more involved, such as values that change over time.
+"""
+
+import argparse, os, runpy, sys, time
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = "spike_sim"
+
+from spike_sim.hub import port
+from spike_sim.loader import run_program
+from spike_sim.simulator import Simulator
+
+def parse_setting(text):
+    """Turn "color:F=3" into ("color", port.F, 3)."""
+    try:
+        target, value = text.split("=", 1)
+        kind, port_name = target.split(":", 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected KIND:PORT=VALUE, got %r" % text)
+    sensor_port = getattr(port, port_name.upper(), None)
+    if sensor_port is None:
+        sensor_port = int(port_name) if port_name.isdigit() else None
+    if sensor_port is None:
+        raise argparse.ArgumentTypeError("unknown port %r" % port_name)
+    if value.lower() in ("true", "false"):
+        parsed = value.lower() == "true"
+    else:
+        try:
+            parsed = int(value)
+        except ValueError:
+            parsed = float(value)
+    return kind, sensor_port, parsed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a SPIKE hub program on a virtual clock.")
+    parser.add_argument("program", help="hub program (.py)")
+    parser.add_argument("--seconds", type=float, default=60, help="simulated time limit (default 60)")
+    parser.add_argument("--set", dest="settings", action="append", type=parse_setting, default=[],
+                        metavar="KIND:PORT=VALUE", help="fix a sensor value (repeatable)")
+    parser.add_argument("--scenario", help="Python file with setup(sim) that scripts the sensors")
+    parser.add_argument("--events", action="store_true", help="print every actuator command afterwards")
+    args = parser.parse_args(argv)
+
+    sim = Simulator(record_events=args.events)
+    for kind, sensor_port, value in args.settings:
+        sim.set_sensor(kind, sensor_port, value)
+    setup = runpy.run_path(args.scenario)["setup"] if args.scenario else None
+
+    started = time.perf_counter()
+    run_program(args.program, duration_ms=args.seconds * 1000, setup=setup, sim=sim)
+    wall = time.perf_counter() - started
+
+    for time_ms, name, command_args in sim.events:
+        print("%10.1f ms  %s%r" % (time_ms, name, command_args))
+    simulated = sim.now_us / 1e6
+    print("Simulated %.1f s in %.3f s (%.0fx real time), %d tasks, %d errors" % (
+        simulated, wall, simulated / wall if wall else 0, len(sim.tasks), len(sim.errors)))
+    return 1 if sim.errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+"""Stand-in for the SPIKE app module (sounds played through the SPIKE App)."""
+
+from .simulator import Wait, active
+
+class sound:
+    @staticmethod
+    def play(sound_name, volume=100, pitch=0, pan=0):
+        sim = active()
+        sim.emit("app.sound.play", sound_name)
+        return Wait(sim.now_us + 500000)
+
+    @staticmethod
+    def stop():
+        pass
@@ -0,0 +1,14 @@
+"""Stand-in for the SPIKE color module: the color numbers sensors and lights use."""
+
+BLACK = 0
+MAGENTA = 1
+PURPLE = 2
+BLUE = 3
+AZURE = 4
+TURQUOISE = 5
+GREEN = 6
+YELLOW = 7
+ORANGE = 8
+RED = 9
+WHITE = 10
+UNKNOWN = -1
@@ -0,0 +1,13 @@
+"""Stand-in for the SPIKE color_sensor module, reading scripted values."""
+
+from .simulator import active
+
+def color(port):
+    return active().read_sensor("color", port)
+
+def reflection(port):
+    return active().read_sensor("reflection", port)
+
+def rgbi(port):
+    value = active().read_sensor("rgbi", port)
+    return value if value is not None else (0, 0, 0, 0)
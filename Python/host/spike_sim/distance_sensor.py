@@ -0,0 +1,16 @@
+"""Stand-in for the SPIKE distance_sensor module, reading scripted values."""
+
+from .simulator import active
+
+def distance(port):
+    return active().read_sensor("distance", port)
+
+def show(port, pixels):
+    sim = active()
+    sim.io()
+    sim.emit("distance_sensor.show", port, tuple(pixels))
+
+def clear(port):
+    sim = active()
+    sim.io()
+    sim.emit("distance_sensor.clear", port)
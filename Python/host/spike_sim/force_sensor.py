@@ -0,0 +1,12 @@
+"""Stand-in for the SPIKE force_sensor module, reading scripted values."""
+
+from .simulator import active
+
+def force(port):
+    return active().read_sensor("force", port)
+
+def pressed(port):
+    return bool(active().read_sensor("pressed", port))
+
+def raw(port):
+    return active().read_sensor("force", port)
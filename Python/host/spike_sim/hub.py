@@ -0,0 +1,104 @@
+"""Stand-in for the SPIKE hub module: ports, lights, display, sound, buttons and motion sensor."""
+
+from .simulator import Wait, active
+
+class port:
+    A = 0
+    B = 1
+    C = 2
+    D = 3
+    E = 4
+    F = 5
+
+class light:
+    POWER = 0
+    CONNECT = 1
+
+    @staticmethod
+    def color(light, color):
+        sim = active()
+        sim.io()
+        sim.lights[light] = color
+        sim.emit("light.color", light, color)
+
+class _LightMatrix:
+    """light_matrix; any IMAGE_* name is accepted and shown by name."""
+
+    def show_image(self, image):
+        sim = active()
+        sim.io()
+        sim.display = image
+        sim.emit("light_matrix.show_image", image)
+
+    def write(self, text, intensity=100, time_per_character=500):
+        sim = active()
+        sim.io()
+        sim.display = str(text)
+        sim.emit("light_matrix.write", str(text))
+        return Wait(sim.now_us + len(str(text)) * time_per_character * 1000)
+
+    def show(self, pixels):
+        self.show_image(tuple(pixels))
+
+    def clear(self):
+        self.show_image(None)
+
+    def set_pixel(self, x, y, intensity):
+        active().io()
+
+    def __getattr__(self, name):
+        if name.startswith("IMAGE_"):
+            return name
+        raise AttributeError(name)
+
+light_matrix = _LightMatrix()
+
+class sound:
+    @staticmethod
+    def beep(freq=440, duration=500, volume=100, *, attack=0, decay=0, sustain=100, release=0,
+             transition=10, waveform=0, channel=0):
+        sim = active()
+        sim.io()
+        sim.emit("sound.beep", freq, duration)
+        return Wait(sim.now_us + duration * 1000)
+
+    @staticmethod
+    def stop():
+        active().emit("sound.stop")
+
+    @staticmethod
+    def volume(volume):
+        pass
+
+class button:
+    LEFT = 1
+    RIGHT = 2
+
+    @staticmethod
+    def pressed(button):
+        return active().read_sensor("button", button)
+
+class motion_sensor:
+    """Yaw follows the simulated drive base; pitch and roll are scripted (default 0)."""
+
+    @staticmethod
+    def tilt_angles():
+        sim = active()
+        sim.io()
+        return (sim.yaw_decidegrees(), sim.read_sensor("pitch", 0) or 0, sim.read_sensor("roll", 0) or 0)
+
+    @staticmethod
+    def reset_yaw(angle):
+        active().reset_yaw(angle)
+
+    @staticmethod
+    def angular_velocity(raw_unfiltered=False):
+        return active().read_sensor("angular_velocity", 0) or (0, 0, 0)
+
+    @staticmethod
+    def acceleration(raw_unfiltered=False):
+        return active().read_sensor("acceleration", 0) or (0, 0, 1000)
+
+    @staticmethod
+    def stable():
+        return True
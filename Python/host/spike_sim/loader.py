@@ -0,0 +1,128 @@
+"""
+Install the stand-in modules and load hub programs from Python/ into the simulator.
+"""
+
+import builtins, importlib, os, sys, types
+
+from . import app, color, color_sensor, distance_sensor, force_sensor, hub, motor, motor_pair, runloop, vtime
+from .simulator import SimulationLimit, Simulator
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STAND_INS = {
+    "app": app,
+    "color": color,
+    "color_sensor": color_sensor,
+    "distance_sensor": distance_sensor,
+    "force_sensor": force_sensor,
+    "hub": hub,
+    "motor": motor,
+    "motor_pair": motor_pair,
+    "runloop": runloop,
+    "time": vtime,
+}
+
+# Names the SPIKE App editor's snippets assume (line_follower.py uses them without importing)
+SNIPPET_GLOBALS = {
+    "color": color,
+    "color_sensor": color_sensor,
+    "distance_sensor": distance_sensor,
+    "force_sensor": force_sensor,
+    "motor": motor,
+    "motor_pair": motor_pair,
+    "runloop": runloop,
+    "port": hub.port,
+    "light": hub.light,
+    "light_matrix": hub.light_matrix,
+    "sound": hub.sound,
+    "button": hub.button,
+    "motion_sensor": hub.motion_sensor,
+}
+
+_saved_modules = {}
+
+def install():
+    """Put the stand-in modules in sys.modules so "import motor" etc. finds them.
+
+    time is replaced too (by a module that forwards everything it does not
+    simulate to the real time module), so import hub libraries after this.
+    """
+    for name, module in STAND_INS.items():
+        if sys.modules.get(name) is not module:
+            _saved_modules.setdefault(name, sys.modules.get(name))
+            sys.modules[name] = module
+    if PYTHON_DIR not in sys.path:
+        sys.path.insert(0, PYTHON_DIR)
+
+def uninstall():
+    """Put back the modules install() replaced."""
+    for name, module in _saved_modules.items():
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
+    _saved_modules.clear()
+
+def _forget_hub_libraries():
+    """Drop hub library modules from the import cache so each program starts fresh."""
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and os.path.dirname(os.path.abspath(path)) == PYTHON_DIR:
+            del sys.modules[name]
+
+def fresh_import(name):
+    """Import a hub library module from Python/ anew, so settings from earlier use are gone."""
+    install()
+    _forget_hub_libraries()
+    return importlib.import_module(name)
+
+def load_program(path, sim=None, defer=True, run_name="__main__"):
+    """Run a hub program's top level inside the simulator and return it as a module.
+
+    With defer=True the program's top-level runloop.run(...) only collects its
+    coroutines, so you can look at or change the program's objects and then
+    start it with sim.run_deferred(duration_ms). sys.exit() at the end of a
+    program just ends loading. Any other run_name skips the program's
+    if __name__ == "__main__": block.
+    """
+    sim = sim or Simulator()
+    sim.activate()
+    install()
+    _forget_hub_libraries()
+
+    path = os.path.abspath(path)
+    program = types.ModuleType(run_name)
+    program.__dict__.update(SNIPPET_GLOBALS)
+    program.__dict__.update(__file__=path, __builtins__=builtins)
+    program.sim = sim
+
+    program_dir = os.path.dirname(path)
+    if program_dir not in sys.path:
+        sys.path.insert(0, program_dir)
+
+    with open(path, encoding="utf-8") as source:
+        code = compile(source.read(), path, "exec")
+    sim.defer = defer
+    try:
+        exec(code, program.__dict__)
+    except (SystemExit, SimulationLimit):
+        pass
+    finally:
+        sim.defer = False
+    return program
+
+def run_program(path, duration_ms=60000, setup=None, sim=None):
+    """Run a hub program for up to duration_ms of virtual time. Returns (program, sim).
+
+    setup(sim) is called before the program starts, to script sensors.
+    """
+    sim = sim or Simulator()
+    if setup is not None:
+        setup(sim)
+    sim.duration_ms = duration_ms
+    sim.limit_us = sim.now_us + int(duration_ms * 1000)
+    try:
+        program = load_program(path, sim, defer=False)
+    finally:
+        sim.limit_us = None
+    return program, sim
@@ -0,0 +1,108 @@
+"""Stand-in for the SPIKE motor module. Motors turn at exactly the commanded speed."""
+
+from .simulator import Wait, active
+
+# Stop modes
+COAST = 0
+BRAKE = 1
+HOLD = 2
+CONTINUE = 3
+SMART_COAST = 4
+SMART_BRAKE = 5
+
+# Directions for run_to_absolute_position
+CLOCKWISE = 0
+COUNTERCLOCKWISE = 1
+SHORTEST_PATH = 2
+LONGEST_PATH = 3
+
+# Results of awaited moves
+READY = 0
+RUNNING = 1
+STALLED = 2
+CANCELED = 3
+ERROR = 4
+DISCONNECTED = 5
+
+MAX_VELOCITY = 1110  # degrees per second, medium motor
+
+def _limit(velocity):
+    return max(-MAX_VELOCITY, min(MAX_VELOCITY, velocity))
+
+def run(port, velocity, *, acceleration=1000):
+    sim = active()
+    sim.io()
+    sim.set_motor_velocity(port, _limit(velocity))
+    sim.emit("motor.run", port, velocity)
+
+def stop(port, *, stop=BRAKE):
+    sim = active()
+    sim.io()
+    sim.set_motor_velocity(port, 0)
+    sim.emit("motor.stop", port)
+
+def run_for_degrees(port, degrees, velocity, *, stop=BRAKE, acceleration=1000, deceleration=1000):
+    sim = active()
+    sim.io()
+    speed = abs(_limit(velocity))
+    if speed == 0 or degrees == 0:
+        return Wait(sim.now_us)
+    direction = 1 if (degrees > 0) == (velocity > 0) else -1
+    sim.emit("motor.run_for_degrees", port, degrees, velocity)
+    return sim.timed_move({port: direction * speed}, abs(degrees) / speed * 1e6)
+
+def run_for_time(port, duration, velocity, *, stop=BRAKE, acceleration=1000, deceleration=1000):
+    sim = active()
+    sim.io()
+    sim.emit("motor.run_for_time", port, duration, velocity)
+    return sim.timed_move({port: _limit(velocity)}, duration * 1000)
+
+def run_to_absolute_position(port, position, velocity, *, direction=SHORTEST_PATH, stop=BRAKE,
+                             acceleration=1000, deceleration=1000):
+    sim = active()
+    sim.io()
+    current = absolute_position(port)
+    clockwise = (position - current) % 360
+    if direction == CLOCKWISE:
+        delta = clockwise
+    elif direction == COUNTERCLOCKWISE:
+        delta = clockwise - 360 if clockwise else 0
+    else:
+        shortest = clockwise - 360 if clockwise > 180 else clockwise
+        delta = shortest if direction == SHORTEST_PATH else (shortest - 360 if shortest > 0 else shortest + 360)
+    speed = abs(_limit(velocity))
+    sim.emit("motor.run_to_absolute_position", port, position, velocity)
+    if speed == 0 or delta == 0:
+        return Wait(sim.now_us)
+    return sim.timed_move({port: speed if delta > 0 else -speed}, abs(delta) / speed * 1e6)
+
+def run_to_relative_position(port, position, velocity, *, stop=BRAKE, acceleration=1000, deceleration=1000):
+    return run_for_degrees(port, position - relative_position(port), abs(velocity))
+
+def relative_position(port):
+    sim = active()
+    sim.io()
+    return int(round(sim.motor_position(port)))
+
+def reset_relative_position(port, position):
+    sim = active()
+    sim.io()
+    motor_state = sim.motor(port)
+    motor_state.position = float(position)
+    motor_state.since_us = sim.now_us
+
+def absolute_position(port):
+    sim = active()
+    sim.io()
+    return int(round((sim.motor_position(port) + 180) % 360 - 180))
+
+def velocity(port):
+    sim = active()
+    sim.io()
+    return int(sim.motor(port).velocity)
+
+def get_duty_cycle(port):
+    return velocity(port) * 10000 // MAX_VELOCITY
+
+def set_duty_cycle(port, pwm):
+    run(port, pwm * MAX_VELOCITY // 10000)
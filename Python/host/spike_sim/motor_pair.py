@@ -0,0 +1,92 @@
+"""Stand-in for the SPIKE motor_pair module. The left motor is mirrored, like on the robot."""
+
+from .motor import BRAKE, MAX_VELOCITY
+from .simulator import Wait, active
+
+PAIR_1 = 0
+PAIR_2 = 1
+PAIR_3 = 2
+
+def pair(pair, left_motor, right_motor):
+    sim = active()
+    sim.pairs[pair] = (left_motor, right_motor)
+    sim.update_pose()
+    sim.left_port = left_motor
+    sim.right_port = right_motor
+
+def unpair(pair):
+    active().pairs.pop(pair, None)
+
+def _ports(pair):
+    sim = active()
+    return sim.pairs.get(pair, (sim.left_port, sim.right_port))
+
+def _limit(velocity):
+    return max(-MAX_VELOCITY, min(MAX_VELOCITY, velocity))
+
+def _steer(steering, velocity):
+    """Wheel speeds for a steering value: 0 straight, +/-50 one wheel stopped, +/-100 spin."""
+    steering = max(-100, min(100, steering))
+    if steering >= 0:
+        return velocity, velocity * (50 - steering) / 50
+    return velocity * (50 + steering) / 50, velocity
+
+def _drive(pair, left, right):
+    left_port, right_port = _ports(pair)
+    return {left_port: -_limit(left), right_port: _limit(right)}
+
+def move(pair, steering, *, velocity=360, acceleration=1000):
+    sim = active()
+    sim.io()
+    for port, speed in _drive(pair, *_steer(steering, velocity)).items():
+        sim.set_motor_velocity(port, speed)
+    sim.emit("motor_pair.move", pair, steering, velocity)
+
+def move_tank(pair, left_velocity, right_velocity, *, acceleration=1000):
+    sim = active()
+    sim.io()
+    for port, speed in _drive(pair, left_velocity, right_velocity).items():
+        sim.set_motor_velocity(port, speed)
+    sim.emit("motor_pair.move_tank", pair, left_velocity, right_velocity)
+
+def stop(pair, *, stop=BRAKE):
+    sim = active()
+    sim.io()
+    for port in _ports(pair):
+        sim.set_motor_velocity(port, 0)
+    sim.emit("motor_pair.stop", pair)
+
+def _move_degrees(pair, degrees, left, right):
+    sim = active()
+    fastest = max(abs(_limit(left)), abs(_limit(right)))
+    if fastest == 0 or degrees == 0:
+        return Wait(sim.now_us)
+    if degrees < 0:
+        left, right = -left, -right
+    return sim.timed_move(_drive(pair, left, right), abs(degrees) / fastest * 1e6)
+
+def move_for_degrees(pair, degrees, steering, *, velocity=360, stop=BRAKE, acceleration=1000, deceleration=1000):
+    sim = active()
+    sim.io()
+    sim.emit("motor_pair.move_for_degrees", pair, degrees, steering, velocity)
+    return _move_degrees(pair, degrees, *_steer(steering, velocity))
+
+def move_tank_for_degrees(pair, degrees, left_velocity, right_velocity, *, stop=BRAKE,
+                          acceleration=1000, deceleration=1000):
+    sim = active()
+    sim.io()
+    sim.emit("motor_pair.move_tank_for_degrees", pair, degrees, left_velocity, right_velocity)
+    return _move_degrees(pair, degrees, left_velocity, right_velocity)
+
+def move_for_time(pair, duration, steering, *, velocity=360, stop=BRAKE, acceleration=1000, deceleration=1000):
+    sim = active()
+    sim.io()
+    sim.emit("motor_pair.move_for_time", pair, duration, steering, velocity)
+    return sim.timed_move(_drive(pair, *_steer(steering, velocity)), duration * 1000)
+
+def move_tank_for_time(pair, left_velocity, right_velocity, duration, *, stop=BRAKE,
+                       acceleration=1000, deceleration=1000):
+    sim = active()
+    sim.io()
+    sim.emit("motor_pair.move_tank_for_time", pair, left_velocity, right_velocity, duration)
+    return sim.timed_move(_drive(pair, left_velocity, right_velocity), duration * 1000)
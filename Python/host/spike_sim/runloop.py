@@ -0,0 +1,32 @@
+"""Stand-in for the SPIKE runloop module, scheduling on the simulator's virtual clock."""
+
+from .simulator import Wait, active
+
+def run(*functions):
+    """Run coroutines.
+
+    At the top of a program this runs the simulation until every task is done
+    (or the simulator's duration_ms runs out). Called from inside a running
+    coroutine it waits for the new coroutines while the other tasks keep going.
+    """
+    sim = active()
+    if sim.defer and not sim.running:
+        sim.deferred.extend(functions)
+        return None
+    sim.run(*functions, duration_ms=sim.duration_ms)
+    return None
+
+def sleep_ms(duration):
+    """Awaitable that lets other tasks run for duration milliseconds of virtual time."""
+    sim = active()
+    return Wait(sim.now_us + int(duration * 1000))
+
+async def until(function, timeout=0):
+    """Wait until function() returns True, checking it every poll_ms of virtual time."""
+    sim = active()
+    deadline = sim.now_us + int(timeout * 1000) if timeout else None
+    while not function():
+        if deadline is not None and sim.now_us >= deadline:
+            return False
+        await Wait(sim.now_us + sim.poll_ms * 1000)
+    return True
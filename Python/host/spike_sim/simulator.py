@@ -0,0 +1,382 @@
+"""
+The simulated hub: a virtual clock, a discrete-event task scheduler,
+motor and drive-base state, and scriptable sensors.
+
+Only one Simulator is active at a time; the stand-in modules (hub, motor,
+runloop, ...) talk to it through active().
+"""
+
+import heapq, math, sys, traceback
+
+_ACTIVE = None
+
+def active():
+    """Return the Simulator the stand-in modules should use."""
+    if _ACTIVE is None:
+        raise RuntimeError("No SPIKE simulator is active - create one with spike_sim.Simulator()")
+    return _ACTIVE
+
+class SimulationLimit(BaseException):
+    """Raised inside a task when the virtual clock passes the run limit."""
+
+########################################################################
+# ⏳ Wait - what a task yields to the scheduler
+########################################################################
+class Wait:
+    """Awaitable that parks the current task until the virtual clock reaches wake_us."""
+
+    __slots__ = ("wake_us",)
+
+    def __init__(self, wake_us):
+        self.wake_us = wake_us
+
+    def __await__(self):
+        yield self
+
+class Task:
+    """One coroutine running on the simulated runloop."""
+
+    __slots__ = ("coroutine", "name", "done", "result", "steps")
+
+    def __init__(self, coroutine):
+        self.coroutine = coroutine
+        self.name = getattr(coroutine, "__name__", "task")
+        self.done = False
+        self.result = None
+        self.steps = 0
+
+########################################################################
+# ⚙️ Motor - one motor port
+########################################################################
+class Motor:
+    """Position and speed of one motor, updated exactly from piecewise-constant velocity."""
+
+    __slots__ = ("position", "velocity", "since_us", "command")
+
+    def __init__(self):
+        self.position = 0.0
+        self.velocity = 0.0
+        self.since_us = 0
+        self.command = None  # the timed move that owns the motor, if any
+
+    def position_at(self, now_us):
+        return self.position + self.velocity * (now_us - self.since_us) / 1e6
+
+    def set_velocity(self, velocity, now_us):
+        self.position = self.position_at(now_us)
+        self.since_us = now_us
+        self.velocity = float(velocity)
+
+########################################################################
+# 🤖 Simulator - the virtual hub
+########################################################################
+class Simulator:
+    """A virtual SPIKE hub that runs programs against a virtual clock.
+
+    Time only moves when a task sleeps, blocks in time.sleep, or touches
+    hardware, so a simulated minute takes as long as the Python code needs
+    to run, not a minute.
+
+    Sensors are scripted with set_sensor(kind, port, source), where source is
+    a fixed value, a function of the time in milliseconds, or a list of
+    (time_ms, value) steps.
+
+    The drive base (wheels on left_port/right_port, left motor mirrored like
+    the real robot) is tracked as a pose, so motion_sensor yaw follows turns.
+
+    Args:
+        step_cost_us (int): Virtual time charged each time a task resumes.
+        io_cost_us (int): Virtual time charged for each hardware call.
+        poll_ms (int): How often runloop.until() re-checks its condition.
+        left_port, right_port (int): Drive-base motors; motor_pair.pair() changes them.
+        wheel_diameter_mm (float): Drive wheel diameter (56 mm SPIKE wheel).
+        track_width_mm (float): Distance between the wheels.
+        record_events (bool): Keep a list of every actuator command in events.
+    """
+
+    SENSOR_DEFAULTS = {
+        "color": -1,
+        "reflection": 50,
+        "distance": -1,
+        "force": 0,
+        "pressed": False,
+        "button": 0,
+    }
+
+    def __init__(self, step_cost_us=10, io_cost_us=50, poll_ms=1, wheel_diameter_mm=56.0,
+                 track_width_mm=109.0, left_port=2, right_port=3, record_events=False):
+        self.now_us = 0
+        self.limit_us = None
+        self.step_cost_us = step_cost_us
+        self.io_cost_us = io_cost_us
+        self.poll_ms = poll_ms
+
+        self.wheel_diameter_mm = wheel_diameter_mm
+        self.track_width_mm = track_width_mm
+        self.left_port = left_port
+        self.right_port = right_port
+        self.pairs = {}
+        self.x_mm = 0.0
+        self.y_mm = 0.0
+        self.heading = 0.0  # radians, counter-clockwise (left) is positive
+        self.yaw_offset = 0.0
+        self._pose_us = 0
+
+        self.motors = {}
+        self._sensors = {}
+        self.lights = {}
+        self.display = None
+
+        self.record_events = record_events
+        self.events = []
+        self.listeners = []
+        self.errors = []
+
+        self.duration_ms = None
+        self.defer = False
+        self.deferred = []
+        self.running = False
+        self.tasks = []
+        self._queue = []
+        self._sequence = 0
+        self.current_task = None
+        self.activate()
+
+    def activate(self):
+        """Make this the simulator the stand-in modules use."""
+        global _ACTIVE
+        _ACTIVE = self
+        return self
+
+    # ------------------------------------------------------------------
+    # Clock
+    # ------------------------------------------------------------------
+    @property
+    def now_ms(self):
+        return self.now_us // 1000
+
+    def advance(self, duration_us):
+        """Move the clock forward inside a task (blocking sleep or hardware cost)."""
+        self.now_us += int(duration_us)
+        if self.limit_us is not None and self.now_us > self.limit_us:
+            raise SimulationLimit()
+
+    def io(self):
+        """Charge the cost of one hardware call."""
+        if self.io_cost_us:
+            self.advance(self.io_cost_us)
+
+    def emit(self, name, *args):
+        """Tell listeners (and the event list, if recording) about an actuator command."""
+        if self.record_events:
+            self.events.append((self.now_us / 1000, name, args))
+        for listener in self.listeners:
+            listener(self.now_us, name, args)
+
+    # ------------------------------------------------------------------
+    # Sensors
+    # ------------------------------------------------------------------
+    def set_sensor(self, kind, sensor_port, source):
+        """Script a sensor: a value, a function of time_ms, or a list of (time_ms, value) steps."""
+        if callable(source):
+            reader = source
+        elif isinstance(source, (list, tuple)) and source and isinstance(source[0], (list, tuple)):
+            steps = sorted(source)
+            times = [step[0] for step in steps]
+            values = [step[1] for step in steps]
+
+            def reader(time_ms, times=times, values=values):
+                import bisect
+                index = bisect.bisect_right(times, time_ms) - 1
+                return values[index] if index >= 0 else self.SENSOR_DEFAULTS.get(kind)
+        else:
+            reader = lambda time_ms, value=source: value
+        self._sensors[(kind, sensor_port)] = reader
+
+    def read_sensor(self, kind, sensor_port):
+        """Return the scripted value of a sensor at the current time."""
+        self.io()
+        reader = self._sensors.get((kind, sensor_port))
+        if reader is None:
+            return self.SENSOR_DEFAULTS.get(kind)
+        return reader(self.now_us / 1000)
+
+    # ------------------------------------------------------------------
+    # Motors and drive base
+    # ------------------------------------------------------------------
+    def motor(self, motor_port):
+        found = self.motors.get(motor_port)
+        if found is None:
+            found = self.motors[motor_port] = Motor()
+        return found
+
+    def set_motor_velocity(self, motor_port, velocity, command=None):
+        self.update_pose()
+        motor_state = self.motor(motor_port)
+        motor_state.set_velocity(velocity, self.now_us)
+        motor_state.command = command
+
+    def timed_move(self, velocities, duration_us):
+        """Start motors at the given {port: velocity} and stop them after duration_us.
+
+        Returns a Wait for the end of the move, so "await motor.run_for_degrees(...)"
+        blocks like on the hub, while a move that is not awaited still stops on time.
+        A newer command on the same motor takes over and cancels the stop.
+        """
+        command = object()
+        for motor_port, velocity in velocities.items():
+            self.set_motor_velocity(motor_port, velocity, command)
+        end_us = self.now_us + int(duration_us)
+
+        async def stop_when_done():
+            for motor_port in velocities:
+                if self.motor(motor_port).command is command:
+                    self.set_motor_velocity(motor_port, 0)
+
+        self.spawn(stop_when_done(), end_us, internal=True)
+        return Wait(end_us)
+
+    def motor_position(self, motor_port):
+        return self.motor(motor_port).position_at(self.now_us)
+
+    def wheel_speeds(self):
+        """Return (left, right) wheel speeds in degrees per second, forward positive."""
+        left = -self.motor(self.left_port).velocity
+        right = self.motor(self.right_port).velocity
+        return left, right
+
+    def update_pose(self):
+        """Bring the drive-base pose up to the current time (wheel speeds are constant in between)."""
+        dt = (self.now_us - self._pose_us) / 1e6
+        self._pose_us = self.now_us
+        if dt <= 0:
+            return
+        mm_per_degree = math.pi * self.wheel_diameter_mm / 360
+        left, right = self.wheel_speeds()
+        speed = (left + right) / 2 * mm_per_degree
+        turn_rate = (right - left) * mm_per_degree / self.track_width_mm
+        if abs(turn_rate) < 1e-9:
+            self.x_mm += speed * math.cos(self.heading) * dt
+            self.y_mm += speed * math.sin(self.heading) * dt
+        else:
+            new_heading = self.heading + turn_rate * dt
+            radius = speed / turn_rate
+            self.x_mm += radius * (math.sin(new_heading) - math.sin(self.heading))
+            self.y_mm -= radius * (math.cos(new_heading) - math.cos(self.heading))
+            self.heading = new_heading
+
+    def yaw_decidegrees(self):
+        """Return the yaw like motion_sensor.tilt_angles()[0]: decidegrees, left positive."""
+        self.update_pose()
+        degrees = math.degrees(self.heading - self.yaw_offset)
+        return int(round(((degrees + 180) % 360 - 180) * 10))
+
+    def reset_yaw(self, decidegrees=0):
+        self.update_pose()
+        self.yaw_offset = self.heading - math.radians(decidegrees / 10)
+
+    # ------------------------------------------------------------------
+    # Scheduler
+    # ------------------------------------------------------------------
+    def spawn(self, coroutine, wake_us=None, internal=False):
+        """Add a coroutine to the run queue (internal ones are left out of tasks)."""
+        task = Task(coroutine)
+        if not internal:
+            self.tasks.append(task)
+        self._push(task, self.now_us if wake_us is None else wake_us)
+        return task
+
+    def _push(self, task, wake_us):
+        self._sequence += 1
+        heapq.heappush(self._queue, (wake_us, self._sequence, task))
+
+    def run(self, *coroutines, duration_ms=None):
+        """Run coroutines (and everything they start) until all finish or duration_ms passes.
+
+        Called from inside a running task (a nested runloop.run), it behaves
+        like MicroPython's asyncio: the calling task waits until the new
+        coroutines finish while every other task keeps running.
+
+        Returns True if every task finished, False if the time limit stopped them.
+        """
+        if self.running:
+            caller = self.current_task
+            tasks = [self.spawn(coroutine) for coroutine in coroutines]
+            try:
+                self._drive(lambda: all(task.done for task in tasks))
+            finally:
+                self.current_task = caller
+            return True
+
+        self.activate()
+        outer_limit_us = self.limit_us
+        limit_us = None if duration_ms is None else self.now_us + int(duration_ms * 1000)
+        if outer_limit_us is not None and (limit_us is None or limit_us > outer_limit_us):
+            limit_us = outer_limit_us
+        self.limit_us = limit_us
+        for coroutine in coroutines:
+            self.spawn(coroutine)
+
+        self.running = True
+        try:
+            finished = self._drive(None)
+        except SimulationLimit:
+            finished = False
+        except SystemExit:
+            finished = True
+        finally:
+            self.running = False
+            self.current_task = None
+            if self.limit_us is not None and self.now_us > self.limit_us:
+                self.now_us = self.limit_us
+            self.update_pose()
+            for _, _, task in self._queue:
+                task.coroutine.close()
+            self._queue.clear()
+            self.limit_us = outer_limit_us
+        return finished
+
+    def _drive(self, finished):
+        """Resume tasks in wake-up order until finished() is true, the queue empties or time runs out."""
+        queue = self._queue
+        while queue:
+            if finished is not None and finished():
+                return True
+            wake_us, _, task = heapq.heappop(queue)
+            if self.limit_us is not None and wake_us > self.limit_us:
+                self.now_us = self.limit_us
+                heapq.heappush(queue, (wake_us, 0, task))
+                return False
+            if wake_us > self.now_us:
+                self.now_us = wake_us
+
+            try:
+                self.advance(self.step_cost_us)
+            except SimulationLimit:
+                heapq.heappush(queue, (wake_us, 0, task))  # left for run() to close
+                raise
+
+            self.current_task = task
+            task.steps += 1
+            try:
+                request = task.coroutine.send(None)
+            except StopIteration as done:
+                task.done = True
+                task.result = done.value
+                continue
+            except (SimulationLimit, SystemExit):
+                raise
+            except Exception:
+                task.done = True
+                self.errors.append((self.now_us / 1000, task.name, sys.exc_info()[1]))
+                traceback.print_exc()
+                continue
+
+            wake = request.wake_us if isinstance(request, Wait) else self.now_us
+            self._push(task, wake if wake > self.now_us else self.now_us)
+        return True
+
+    def run_deferred(self, duration_ms=None):
+        """Run the coroutines a deferred program passed to runloop.run()."""
+        coroutines, self.deferred = self.deferred, []
+        return self.run(*coroutines, duration_ms=duration_ms)
@@ -0,0 +1,41 @@
+"""
+Stand-in for MicroPython's time module.
+
+ticks_* and sleep* use the simulator's virtual clock. Blocking sleeps move
+the clock forward without letting other tasks run, just like on the hub.
+Anything else (perf_counter, monotonic, ...) is the normal CPython time.
+"""
+
+import time as _host_time
+
+from .simulator import active
+
+def ticks_ms():
+    return active().now_us // 1000
+
+def ticks_us():
+    return active().now_us
+
+def ticks_cpu():
+    return active().now_us
+
+def ticks_diff(ticks1, ticks2):
+    return ticks1 - ticks2
+
+def ticks_add(ticks, delta):
+    return ticks + delta
+
+def sleep(seconds):
+    active().advance(seconds * 1000000)
+
+def sleep_ms(milliseconds):
+    active().advance(milliseconds * 1000)
+
+def sleep_us(microseconds):
+    active().advance(microseconds)
+
+def time():
+    return active().now_us // 1000000
+
+def __getattr__(name):
+    return getattr(_host_time, name)
@@ -0,0 +1,391 @@
+"""
+🚦 Runloop Stall Checker (runs on your computer, not the hub)
+=============================================================
+
+Reads every hub program under Python/ (without running anything) and
+points out code that holds up the runloop:
+
+    blocking    time.sleep / sleep_ms / sleep_us inside an async def, or a
+                call to a plain function that sleeps. Nothing else runs
+                until it returns: no other task, no sensor checks.
+    busy-loop   a while loop inside an async def that never awaits. Other
+                tasks wait until the loop ends.
+    tick-print  print() inside a loop that awaits, so it prints on every
+                pass. Sending text from the hub is slow.
+    double-read the same sensor or motor port read twice in one expression.
+                Each read costs time, and the two values can differ.
+
+Each finding comes with a rough estimate of how long it holds the hub up
+(per pass for loops), using the costs set below. Sleep times are read from
+numbers in the code, or from constants at the top of the file; "?" means
+the time depends on something only known when the program runs.
+
+The exit status is 1 when anything is found, so this can run before an
+upload or in CI.
+
+Usage:
+    python stall_check.py                      # check every program in Python/
+    python stall_check.py ../testit.py         # check some files or folders
+    python stall_check.py --min-ms 5           # hide findings estimated under 5 ms
+"""
+
+import argparse, ast, os, sys
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+PYTHON_DIR = os.path.dirname(HOST_DIR)
+SKIP_DIRS = {"host", "build", "__pycache__"}
+
+# Rough hub costs used for the estimates
+PRINT_MS = 1.0           # one print() call on the hub console
+PRINT_MS_PER_CHAR = 0.1  # sending each character over Bluetooth or USB
+SENSOR_READ_MS = 0.3     # one reading from a sensor or motor
+FORMATTED_VALUE_CHARS = 6  # characters assumed for each value filled into a message
+
+# Blocking sleeps in time / utime, and how many ms one unit of their argument is
+SLEEPS = {"sleep": 1000, "sleep_ms": 1, "sleep_us": 0.001}
+TIME_MODULES = {"time", "utime"}
+
+# Calls that ask the hardware for a reading, by module (or hub object) name
+HARDWARE_READS = {
+    "color_sensor": {"color", "reflection", "rgbi"},
+    "distance_sensor": {"distance"},
+    "force_sensor": {"force", "pressed", "raw"},
+    "motor": {"absolute_position", "relative_position", "velocity", "get_duty_cycle"},
+    "motion_sensor": {"tilt_angles", "angular_velocity", "acceleration", "gesture", "up_face", "quaternion"},
+    "button": {"pressed"},
+}
+
+FUNCTIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)
+
+class Finding:
+    def __init__(self, path, line, kind, where, message, stall_ms):
+        self.path = path
+        self.line = line
+        self.kind = kind
+        self.where = where
+        self.message = message
+        self.stall_ms = stall_ms  # None when it cannot be estimated
+
+    def format(self, root):
+        stall = "?" if self.stall_ms is None else "%.1f" % self.stall_ms if self.stall_ms < 10 else "%.0f" % self.stall_ms
+        path = os.path.relpath(self.path, root) if self.path.startswith(root + os.sep) else self.path
+        return "%s:%d: %-11s %s: %s (~%s ms)" % (
+            path, self.line, self.kind, self.where, self.message, stall)
+
+def own_nodes(node):
+    """Walk node without going into nested functions, lambdas or classes."""
+    stack = list(ast.iter_child_nodes(node))
+    while stack:
+        child = stack.pop()
+        yield child
+        if not isinstance(child, FUNCTIONS):
+            stack.extend(ast.iter_child_nodes(child))
+
+def awaits(node):
+    return any(isinstance(child, (ast.Await, ast.AsyncFor, ast.AsyncWith)) for child in own_nodes(node))
+
+def header_expressions(statement):
+    """The expressions a statement evaluates itself (not the ones in its body)."""
+    return [child for child in ast.iter_child_nodes(statement) if isinstance(child, ast.expr)]
+
+########################################################################
+# 🔎 One module
+########################################################################
+class ModuleChecker:
+    """Find stalls in one file. Call check() for the list of findings."""
+
+    def __init__(self, path, tree):
+        self.path = path
+        self.tree = tree
+        self.findings = []
+        self.time_modules = set()
+        self.sleeps = {}        # local name -> ms per unit, for "from time import sleep_ms"
+        self.read_modules = {}  # local name -> HARDWARE_READS key
+        self.read_functions = set()
+        self.constants = {}
+        self.functions = {}     # "name" or "Class.name" -> def node
+        self._stalls = {}
+        self._find_names()
+
+    def _find_names(self):
+        for node in ast.walk(self.tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    local = alias.asname or alias.name
+                    if alias.name in TIME_MODULES:
+                        self.time_modules.add(local)
+                    if alias.name in HARDWARE_READS:
+                        self.read_modules[local] = alias.name
+            elif isinstance(node, ast.ImportFrom) and node.level == 0:
+                for alias in node.names:
+                    local = alias.asname or alias.name
+                    if node.module in TIME_MODULES and alias.name in SLEEPS:
+                        self.sleeps[local] = SLEEPS[alias.name]
+                    elif alias.name in HARDWARE_READS:
+                        self.read_modules[local] = alias.name  # from hub import button, motion_sensor
+                    elif node.module in HARDWARE_READS and alias.name in HARDWARE_READS[node.module]:
+                        self.read_functions.add(local)
+
+        for node in self.tree.body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                value = self.number(node.value)
+                if value is not None:
+                    self.constants[node.targets[0].id] = value
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self.functions[node.name] = node
+            elif isinstance(node, ast.ClassDef):
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        self.functions["%s.%s" % (node.name, item.name)] = item
+
+    def number(self, node):
+        """The value of a number, a module constant, or simple arithmetic on them; else None."""
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return node.value
+        if isinstance(node, ast.Name):
+            return self.constants.get(node.id)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            value = self.number(node.operand)
+            return -value if value is not None else None
+        if isinstance(node, ast.BinOp):
+            left, right = self.number(node.left), self.number(node.right)
+            if left is None or right is None:
+                return None
+            try:
+                if isinstance(node.op, ast.Add):
+                    return left + right
+                if isinstance(node.op, ast.Sub):
+                    return left - right
+                if isinstance(node.op, ast.Mult):
+                    return left * right
+                if isinstance(node.op, ast.Div):
+                    return left / right
+                if isinstance(node.op, ast.FloorDiv):
+                    return left // right
+            except ZeroDivisionError:
+                return None
+        return None
+
+    # ------------------------------------------------------------------
+    # What a call does
+    # ------------------------------------------------------------------
+    def sleep_ms(self, call):
+        """ms a call blocks for if it is a time sleep (None if unknown), or False if it is not one."""
+        function = call.func
+        if isinstance(function, ast.Name) and function.id in self.sleeps:
+            per_unit = self.sleeps[function.id]
+        elif (isinstance(function, ast.Attribute) and function.attr in SLEEPS
+              and isinstance(function.value, ast.Name) and function.value.id in self.time_modules):
+            per_unit = SLEEPS[function.attr]
+        else:
+            return False
+        value = self.number(call.args[0]) if call.args else None
+        return value * per_unit if value is not None else None
+
+    def local_function(self, call, class_name):
+        """The def a call runs, when it is a plain function (or self.method) in this file."""
+        function = call.func
+        if isinstance(function, ast.Name):
+            return self.functions.get(function.id)
+        if (class_name and isinstance(function, ast.Attribute) and isinstance(function.value, ast.Name)
+                and function.value.id == "self"):
+            return self.functions.get("%s.%s" % (class_name, function.attr))
+        return None
+
+    def hardware_read(self, call):
+        """A name for the reading a call takes, or None if it is not a hardware read."""
+        function = call.func
+        if isinstance(function, ast.Name) and function.id in self.read_functions:
+            name = function.id
+        elif isinstance(function, ast.Attribute):
+            owner = function.value
+            owner_name = owner.id if isinstance(owner, ast.Name) else owner.attr if isinstance(owner, ast.Attribute) else None
+            module = self.read_modules.get(owner_name, owner_name if isinstance(owner, ast.Attribute) else None)
+            if module not in HARDWARE_READS or function.attr not in HARDWARE_READS[module]:
+                return None
+            name = "%s.%s" % (owner_name, function.attr)
+        else:
+            return None
+        return "%s(%s)" % (name, ", ".join(ast.unparse(argument) for argument in call.args))
+
+    def blocking_ms(self, definition, class_name, seen=()):
+        """Estimated ms a plain function blocks for when called (0 if it never sleeps, None if unknown)."""
+        key = id(definition)
+        if key in self._stalls:
+            return self._stalls[key]
+        if isinstance(definition, ast.AsyncFunctionDef) or key in seen:
+            return 0  # calling a coroutine function does not run it; recursion is counted once
+        total = self._block_total(definition.body, class_name, seen + (key,))
+        self._stalls[key] = total
+        return total
+
+    def _block_total(self, statements, class_name, seen):
+        total = 0
+        for statement in statements:
+            if isinstance(statement, FUNCTIONS):
+                continue
+            times = 1
+            if isinstance(statement, ast.For):
+                times = self.range_count(statement.iter)
+            elif isinstance(statement, ast.While):
+                times = None
+            parts = [self._calls_block(expression, class_name, seen) for expression in header_expressions(statement)]
+            for field in ("body", "orelse", "finalbody"):
+                parts.append(self._block_total(getattr(statement, field, []), class_name, seen))
+            for handler in getattr(statement, "handlers", []):
+                parts.append(self._block_total(handler.body, class_name, seen))
+            if any(part is None for part in parts):
+                return None
+            block = sum(parts)
+            if block:
+                if times is None:
+                    return None
+                total += block * times
+        return total
+
+    def _calls_block(self, expression, class_name, seen):
+        total = 0
+        for node in [expression] + list(own_nodes(expression)):
+            if not isinstance(node, ast.Call):
+                continue
+            stall = self.sleep_ms(node)
+            if stall is False:
+                definition = self.local_function(node, class_name)
+                stall = self.blocking_ms(definition, class_name, seen) if definition else 0
+            if stall is None:
+                return None
+            total += stall
+        return total
+
+    def range_count(self, iterable):
+        if (isinstance(iterable, ast.Call) and isinstance(iterable.func, ast.Name) and iterable.func.id == "range"
+                and len(iterable.args) == 1):
+            count = self.number(iterable.args[0])
+            return max(0, int(count)) if count is not None else None
+        return None
+
+    # ------------------------------------------------------------------
+    # Walking the program
+    # ------------------------------------------------------------------
+    def check(self):
+        self._scan(self.tree.body, "<module>", None, False, False)
+        return self.findings
+
+    def _report(self, node, kind, where, message, stall_ms):
+        self.findings.append(Finding(self.path, node.lineno, kind, where, message, stall_ms))
+
+    def _scan(self, statements, where, class_name, in_async, in_tick_loop):
+        for statement in statements:
+            if isinstance(statement, ast.ClassDef):
+                self._scan(statement.body, statement.name, statement.name, False, False)
+                continue
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                name = statement.name if class_name is None else "%s.%s" % (class_name, statement.name)
+                self._scan(statement.body, name, class_name, isinstance(statement, ast.AsyncFunctionDef), False)
+                continue
+
+            expressions = header_expressions(statement)
+            for expression in expressions:
+                self._check_calls(expression, where, class_name, in_async, in_tick_loop)
+            self._check_double_reads(statement, expressions, where)
+
+            body_is_tick_loop = in_tick_loop
+            if isinstance(statement, (ast.While, ast.For, ast.AsyncFor)) and in_async:
+                loop_awaits = awaits(statement)
+                body_is_tick_loop = in_tick_loop or loop_awaits
+                if isinstance(statement, ast.While) and not loop_awaits:
+                    self._report(statement, "busy-loop", where,
+                                 "while loop never awaits, so other tasks wait until it ends", None)
+            for field in ("body", "orelse", "finalbody"):
+                self._scan(getattr(statement, field, []), where, class_name, in_async, body_is_tick_loop)
+            for handler in getattr(statement, "handlers", []):
+                self._scan(handler.body, where, class_name, in_async, body_is_tick_loop)
+
+    def _check_calls(self, expression, where, class_name, in_async, in_tick_loop):
+        for node in [expression] + list(own_nodes(expression)):
+            if not isinstance(node, ast.Call):
+                continue
+            if in_async:
+                stall = self.sleep_ms(node)
+                if stall is not False:
+                    self._report(node, "blocking", where, "%s() inside async def stops every task; use "
+                                 "await runloop.sleep_ms()" % ast.unparse(node.func), stall)
+                else:
+                    definition = self.local_function(node, class_name)
+                    if definition is not None:
+                        stall = self.blocking_ms(definition, class_name)
+                        if stall != 0:
+                            self._report(node, "blocking", where, "calls %s(), which sleeps without awaiting"
+                                         % ast.unparse(node.func), stall)
+            if in_tick_loop and isinstance(node.func, ast.Name) and node.func.id == "print":
+                self._report(node, "tick-print", where, "print() on every pass of a loop", self.print_ms(node))
+
+    def _check_double_reads(self, statement, expressions, where):
+        counts = {}
+        for expression in expressions:
+            for node in [expression] + list(own_nodes(expression)):
+                if isinstance(node, ast.Call):
+                    reading = self.hardware_read(node)
+                    if reading is not None:
+                        counts[reading] = counts.get(reading, 0) + 1
+        for reading, count in counts.items():
+            if count > 1:
+                self._report(statement, "double-read", where, "%s read %d times in one expression; read it once "
+                             "into a variable" % (reading, count), (count - 1) * SENSOR_READ_MS)
+
+    def print_ms(self, call):
+        characters = 0
+        for node in [call] + list(own_nodes(call)):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                characters += len(node.value)
+            elif isinstance(node, (ast.Name, ast.Attribute, ast.Subscript, ast.Call)) and node is not call:
+                characters += FORMATTED_VALUE_CHARS
+        return PRINT_MS + characters * PRINT_MS_PER_CHAR
+
+########################################################################
+# 🗂️ Files
+########################################################################
+def program_files(paths):
+    for path in paths:
+        if os.path.isfile(path):
+            yield path
+            continue
+        for folder, folders, files in os.walk(path):
+            folders[:] = sorted(name for name in folders if name not in SKIP_DIRS and not name.startswith("."))
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    yield os.path.join(folder, name)
+
+def check_file(path):
+    """Return the findings for one file (a SyntaxError is raised as is)."""
+    with open(path, encoding="utf-8") as source:
+        tree = ast.parse(source.read(), path)
+    return ModuleChecker(path, tree).check()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find code that stalls the runloop in hub programs.")
+    parser.add_argument("paths", nargs="*", default=[PYTHON_DIR], help="files or folders (default: Python/)")
+    parser.add_argument("--min-ms", type=float, default=0, help="hide findings estimated to stall less than this")
+    args = parser.parse_args(argv)
+
+    findings = []
+    for path in program_files(args.paths):
+        try:
+            findings.extend(check_file(path))
+        except SyntaxError as error:
+            print("%s: skipped, not valid Python (line %s)" % (os.path.relpath(path, PYTHON_DIR), error.lineno))
+    findings = [finding for finding in findings if finding.stall_ms is None or finding.stall_ms >= args.min_ms]
+
+    for finding in findings:
+        print(finding.format(PYTHON_DIR))
+    if not findings:
+        print("No runloop stalls found")
+        return 0
+    known = [finding.stall_ms for finding in findings if finding.stall_ms is not None]
+    print()
+    print("%d findings; estimated stalls add up to %.0f ms%s" % (
+        len(findings), sum(known), " (plus %d unknown)" % (len(findings) - len(known)) if len(known) < len(findings) else ""))
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+🎛️ Line Follower Parameter Sweep (runs on your computer, not the hub)
+====================================================================
+
+Tries many kp / speed / target_light combinations for LineFollow in the
+track simulator (track_sim.py), spread over every CPU core, and prints
+the fastest combinations that finished every lap without losing the line.
+
+Each combination drives several robots that differ only in sensor noise
+and starting position; it counts as stable when all of them finish and
+none strays further than --max-error from the line edge.
+
+Each worker simulates a chunk of points together as one batch of robots.
+Results are saved in a cache file keyed by a hash of the settings, the
+simulator options and the line follower source, so running the sweep
+again (or a bigger one that includes the same points) only simulates
+the new points. Each point's robots take their start jitter and sensor
+noise from a seed made from the point and --seed, so a point scores the
+same whichever points share its batch, and whatever --chunk, --workers
+or the cache hold.
+
+Usage:
+    python sweep.py                                          # default grid
+    python sweep.py --kp 3:10:0.5 --speed 150:600:50 --target 45,55,65
+    python sweep.py --random 300 --kp 2:12 --speed 100:800 --target 40:70
+    python sweep.py --fast                                   # vectorized controller
+
+Ranges are START:STOP:STEP (STOP included) or a comma list. With --random
+they are START:STOP bounds and points are drawn uniformly.
+"""
+
+import argparse, concurrent.futures, glob, hashlib, itertools, json, os, sys, time
+
+import numpy as np
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HOST_DIR)
+import track_sim
+
+DEFAULT_CACHE = os.path.join(HOST_DIR, "sweep_cache.json")
+SOURCES = ("line_follower.py", "steering_table.py", "telemetry.py", "pid.py", "host/track_sim.py")
+
+def parse_values(text, whole=False):
+    """Turn "3:9:0.5" or "45,55,65" into a list of numbers."""
+    if ":" in text:
+        parts = [float(part) for part in text.split(":")]
+        if len(parts) == 2:
+            raise argparse.ArgumentTypeError("grid range %r needs a step: START:STOP:STEP" % text)
+        start, stop, step = parts
+        values = list(np.arange(start, stop + step / 2, step))
+    else:
+        values = [float(part) for part in text.split(",")]
+    return [int(round(value)) if whole else round(float(value), 4) for value in values]
+
+def parse_bounds(text):
+    """Turn "2:12" into (2.0, 12.0)."""
+    low, high = (float(part) for part in text.split(":")[:2])
+    return low, high
+
+def grid_points(kp_values, speed_values, target_values):
+    return [{"kp": kp, "speed": speed, "target_light": target}
+            for kp, speed, target in itertools.product(kp_values, speed_values, target_values)]
+
+def random_points(count, kp_bounds, speed_bounds, target_bounds, seed=0):
+    rng = np.random.default_rng(seed)
+    return [{"kp": round(float(rng.uniform(*kp_bounds)), 2),
+             "speed": int(round(rng.uniform(*speed_bounds))),
+             "target_light": int(round(rng.uniform(*target_bounds)))} for _ in range(count)]
+
+def source_fingerprint():
+    """Hash of the code being tuned, so edits to it invalidate cached results."""
+    python_dir = os.path.dirname(HOST_DIR)
+    paths = [os.path.join(python_dir, name) for name in SOURCES]
+    paths += sorted(glob.glob(os.path.join(HOST_DIR, "spike_sim", "*.py")))  # the stand-in hub modules
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path, "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+def point_seed(point, seed):
+    """Seed for one point's robots, from the point itself and --seed."""
+    text = json.dumps({"point": point, "seed": seed}, sort_keys=True)
+    return int(hashlib.sha1(text.encode()).hexdigest()[:16], 16)
+
+def point_key(point, options, fingerprint):
+    text = json.dumps({"point": point, "options": options, "source": fingerprint}, sort_keys=True)
+    return hashlib.sha1(text.encode()).hexdigest()
+
+########################################################################
+# 🏁 One point, run in a worker process
+########################################################################
+_track = None
+
+def _start_worker(track_options):
+    """Build the track once per worker process; it takes longer than one simulation."""
+    global _track
+    _track = track_sim.oval_track(**track_options)
+
+def simulate(points, options):
+    """Drive options["robots"] robots per point, all points in one batch. Returns a result dict per point."""
+    robots = options["robots"]
+    settings = {name: np.repeat([point[name] for point in points], robots)
+                for name in ("kp", "speed", "target_light")}
+    seeds = [point_seed(point, options["seed"]) for point in points]
+    sim = track_sim.TrackSimulator(_track, robots=robots * len(points), control_period_ms=options["period_ms"],
+                                   motor_lag_ms=options["lag_ms"], noise=options["noise"], seed=seeds)
+    if options["fast"]:
+        controller = track_sim.ProportionalBatch(settings["target_light"], settings["speed"], settings["kp"])
+        result = sim.drive(controller=controller, laps=options["laps"], duration_ms=options["seconds"] * 1000)
+    else:
+        steps = track_sim.line_follow_steps(sim, settings["target_light"].tolist(), settings["speed"].tolist(),
+                                            settings["kp"].tolist())
+        result = sim.drive(steps, laps=options["laps"], duration_ms=options["seconds"] * 1000)
+
+    results = []
+    for index in range(len(points)):
+        robot = slice(index * robots, (index + 1) * robots)
+        finished = result.finished[robot]
+        lap_times = result.lap_time_ms[robot][finished] / 1000 / options["laps"]
+        results.append({
+            "finished": int(finished.sum()),
+            "lost": int(result.lost[robot].sum()),
+            "mean_lap_s": float(lap_times.mean()) if finished.any() else None,
+            "worst_lap_s": float(lap_times.max()) if finished.any() else None,
+            "rms_error_mm": float(result.rms_error_mm[robot].mean()),
+            "max_error_mm": float(result.max_error_mm[robot].max()),
+            "progress_laps": float(result.laps_done[robot].mean()),
+        })
+    return results
+
+########################################################################
+# 📋 Cache and ranking
+########################################################################
+def load_cache(path):
+    try:
+        with open(path) as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(path, cache):
+    temporary = path + ".tmp"
+    with open(temporary, "w") as cache_file:
+        json.dump(cache, cache_file, indent=0, sort_keys=True)
+    os.replace(temporary, path)
+
+def is_stable(result, robots, max_error_mm):
+    return result["finished"] == robots and result["max_error_mm"] <= max_error_mm
+
+def rank(rows, robots, max_error_mm):
+    """Stable points first, fastest worst-case lap first; then the rest by how far they got."""
+    def order(row):
+        point, result = row
+        if is_stable(result, robots, max_error_mm):
+            return (0, result["worst_lap_s"], result["rms_error_mm"])
+        return (1, -result["progress_laps"], result["rms_error_mm"])
+    return sorted(rows, key=order)
+
+def format_table(ranked, robots, max_error_mm, top):
+    lines = ["%4s %6s %6s %6s | %8s %8s | %7s %7s | %s" % (
+        "rank", "kp", "speed", "target", "lap s", "worst s", "rms mm", "max mm", "result")]
+    for number, (point, result) in enumerate(ranked[:top], 1):
+        if is_stable(result, robots, max_error_mm):
+            verdict = "stable"
+        elif result["finished"] == robots:
+            verdict = "wobbly"
+        else:
+            verdict = "%d/%d lost" % (result["lost"], robots) if result["lost"] else "too slow"
+        lap = "%8.2f %8.2f" % (result["mean_lap_s"], result["worst_lap_s"]) if result["mean_lap_s"] else "%8s %8s" % ("-", "-")
+        lines.append("%4d %6.2f %6d %6d | %s | %7.1f %7.1f | %s" % (
+            number, point["kp"], point["speed"], point["target_light"], lap,
+            result["rms_error_mm"], result["max_error_mm"], verdict))
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep LineFollow settings in the track simulator.")
+    parser.add_argument("--kp", default="3:9:1", help="kp values (default 3:9:1)")
+    parser.add_argument("--speed", default="150:450:100", help="speed values (default 150:450:100)")
+    parser.add_argument("--target", default="45,55,65", help="target_light values (default 45,55,65)")
+    parser.add_argument("--random", type=int, metavar="N", help="draw N random points inside the ranges instead")
+    parser.add_argument("--robots", type=int, default=4, help="robots per point, each with its own noise")
+    parser.add_argument("--laps", type=int, default=1)
+    parser.add_argument("--seconds", type=float, default=120, help="simulated time limit per point")
+    parser.add_argument("--max-error", type=float, default=15.0, help="largest allowed mm from the edge")
+    parser.add_argument("--period", type=int, default=10, help="control period in ms")
+    parser.add_argument("--lag", type=float, default=40, help="motor lag time constant in ms")
+    parser.add_argument("--noise", type=float, default=1.5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--fast", action="store_true", help="use ProportionalBatch instead of LineFollow objects")
+    parser.add_argument("--chunk", type=int, default=50, help="most points simulated together in one batch")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes (default: every core)")
+    parser.add_argument("--cache", default=DEFAULT_CACHE, help="results cache file ('' for none)")
+    parser.add_argument("--top", type=int, default=20, help="rows to print")
+    args = parser.parse_args(argv)
+
+    if args.random:
+        points = random_points(args.random, parse_bounds(args.kp), parse_bounds(args.speed),
+                               parse_bounds(args.target), args.seed)
+    else:
+        points = grid_points(parse_values(args.kp), parse_values(args.speed, whole=True),
+                             parse_values(args.target, whole=True))
+
+    options = {"robots": args.robots, "laps": args.laps, "seconds": args.seconds, "period_ms": args.period,
+               "lag_ms": args.lag, "noise": args.noise, "seed": args.seed, "fast": args.fast}
+    track_options = {}
+    fingerprint = source_fingerprint()
+    cache = load_cache(args.cache) if args.cache else {}
+    keys = [point_key(point, dict(options, track=track_options), fingerprint) for point in points]
+    todo = [(key, point) for key, point in zip(keys, points) if key not in cache]
+    todo = list(dict(todo).items())  # the same point twice is simulated once
+
+    print("%d points, %d cached, %d to simulate on %d workers" % (
+        len(points), len(points) - len(todo), len(todo), args.workers))
+    started = time.perf_counter()
+    if todo:
+        # A few chunks per worker keeps every core busy until the end
+        chunk_size = max(1, min(args.chunk, -(-len(todo) // (args.workers * 4))))
+        chunks = [todo[start:start + chunk_size] for start in range(0, len(todo), chunk_size)]
+        done = 0
+        with concurrent.futures.ProcessPoolExecutor(args.workers, initializer=_start_worker,
+                                                    initargs=(track_options,)) as pool:
+            futures = {pool.submit(simulate, [point for _, point in chunk], options): chunk for chunk in chunks}
+            for future in concurrent.futures.as_completed(futures):
+                chunk = futures[future]
+                for (key, _), result in zip(chunk, future.result()):
+                    cache[key] = result
+                done += len(chunk)
+                print("  %d/%d done (%.1f s)" % (done, len(todo), time.perf_counter() - started))
+                if args.cache:
+                    save_cache(args.cache, cache)
+
+    rows = [(point, cache[key]) for point, key in zip(points, keys)]
+    ranked = rank(list({key: row for key, row in zip(keys, rows)}.values()), args.robots, args.max_error)
+    stable = sum(is_stable(result, args.robots, args.max_error) for _, result in ranked)
+    print()
+    print(format_table(ranked, args.robots, args.max_error, args.top))
+    print()
+    print("%d of %d points stable (all %d robots finished, max error <= %.0f mm) in %.1f s" % (
+        stable, len(ranked), args.robots, args.max_error, time.perf_counter() - started))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
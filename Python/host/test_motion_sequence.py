@@ -0,0 +1,33 @@
+"""
+Checks for MotionSequence's join speeds (run with: python -m pytest test_motion_sequence.py).
+"""
+
+import os, sys
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HOST_DIR)
+from spike_sim import Simulator, fresh_import
+
+def motion_sequence():
+    Simulator()
+    return fresh_import("motion_sequence").MotionSequence()
+
+def test_spin_into_straight_stops_at_the_join():
+    # The left wheel turns backward in a spin and forward on a straight
+    motion = motion_sequence()
+    speeds = motion.junction_speeds([(180, -100), (400, 0), (180, 100), (400, 0)])
+    assert speeds == [0, 0, 0, 0]
+
+def test_gentle_steering_change_keeps_most_of_the_speed():
+    motion = motion_sequence()
+    speeds = motion.junction_speeds([(2000, 0), (2000, 10), (2000, 10)])
+    # steering 10 slows one wheel by 20% of the speed, so the join keeps 90%
+    assert speeds[0] == motion.max_speed * 90 // 100
+    assert speeds[1] == motion.max_speed
+    assert speeds[2] == 0
+
+def test_wheel_shares_follow_motor_pair_steering():
+    motion = motion_sequence()
+    assert motion.wheel_shares(0) == (100, 100)
+    assert motion.wheel_shares(50) == (100, 0)
+    assert motion.wheel_shares(-100) == (-100, 100)
@@ -0,0 +1,567 @@
+"""
+🛣️ Line Follower Track Simulator (runs on your computer, not the hub)
+====================================================================
+
+Drives simulated robots around a track picture so LineFollow and
+EducationalLineFollower can be tuned without the mat.
+
+- The track is a picture of reflection values (0-100). The light under the
+  color sensor is read from it with NumPy, with a soft edge the size of
+  the sensor's light spot and random sensor noise.
+- Motors C (left, mirrored) and D (right) drive a two-wheel robot. They
+  reach the commanded speed gradually (actuator lag), like real motors.
+- The robots' own follow_line() runs unchanged, each robot with its own
+  LineFollow object, while sensing, motors and movement for the whole
+  batch are computed together in array operations.
+- ProportionalBatch is the same proportional steering as LineFollow, worked
+  out for every robot at once. It is much faster for large sweeps.
+
+Each robot reports its lap time and its cross-track error: how far the
+color sensor is from the line edge it follows (the right-hand edge when
+driving, since LineFollow steers right when it sees dark).
+
+Usage:
+    python track_sim.py                                  # 20 LineFollow robots, one lap
+    python track_sim.py --robots 200 --kp 5 --speed 250 --target 55
+    python track_sim.py --follower educational
+    python track_sim.py --follower batch --robots 5000    # vectorized controller
+
+In Python:
+    from track_sim import TrackSimulator, oval_track, line_follow_steps
+    sim = TrackSimulator(oval_track(), robots=50, seed=1)
+    result = sim.drive(line_follow_steps(sim, target_light=55, speed=200, kp=5.0))
+    print(result.summary())
+"""
+
+import argparse, math, os, sys, time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from spike_sim import Simulator, load_program, port
+
+MAX_VELOCITY = 1110  # degrees per second, medium motor
+
+########################################################################
+# 🗺️ Track - reflection picture plus the line's centre for scoring
+########################################################################
+class Track:
+    """A track picture and the centre line of the line drawn on it.
+
+    Args:
+        reflection (ndarray): Reflection (0-100) per pixel, rows are y.
+        mm_per_pixel (float): Size of one pixel.
+        centerline (ndarray): (M, 2) points in mm along the middle of the line,
+            in driving order. The track is a loop: the last point joins the first.
+        line_width_mm (float): Width of the line.
+        outside (float): Reflection read off the edge of the picture.
+    """
+
+    def __init__(self, reflection, mm_per_pixel, centerline, line_width_mm=20.0, outside=95.0):
+        self.reflection = np.asarray(reflection, dtype=np.float32)
+        self.mm_per_pixel = float(mm_per_pixel)
+        self.line_width_mm = float(line_width_mm)
+        self.outside = float(outside)
+
+        points = np.asarray(centerline, dtype=np.float64)
+        self.starts = points
+        self.vectors = np.roll(points, -1, axis=0) - points
+        self.lengths = np.hypot(self.vectors[:, 0], self.vectors[:, 1])
+        self.offsets = np.concatenate(([0.0], np.cumsum(self.lengths)[:-1]))
+        self.length = float(self.lengths.sum())
+        self.along_map, self.offset_map = _nearest_maps(points, self.reflection.shape, self.mm_per_pixel)
+
+    @classmethod
+    def from_centerline(cls, points, line_width_mm=20.0, margin_mm=120.0, mm_per_pixel=2.0,
+                        dark=15.0, light=95.0, spot_mm=8.0):
+        """Draw a dark line of line_width_mm along points on a light mat."""
+        points = np.asarray(points, dtype=np.float64)
+        points = points - points.min(axis=0) + margin_mm
+        width, height = points.max(axis=0) + margin_mm
+        shape = (int(math.ceil(height / mm_per_pixel)), int(math.ceil(width / mm_per_pixel)))
+        _, offset = _nearest_maps(points, shape, mm_per_pixel)
+
+        # The sensor sees a spot, so dark fades to light across spot_mm at the edge
+        blend = np.clip((np.abs(offset) - line_width_mm / 2) / spot_mm + 0.5, 0.0, 1.0)
+        return cls(dark + (light - dark) * blend, mm_per_pixel, points, line_width_mm, light)
+
+    @classmethod
+    def from_image(cls, path, mm_per_pixel, centerline, line_width_mm=20.0, spot_mm=8.0):
+        """Load a track picture (.npy of reflection values, or any image if Pillow is installed).
+
+        Images are turned to grey and scaled so black is 0 and white is 100,
+        then blurred over the sensor spot. centerline is in mm from the
+        top-left corner of the picture.
+        """
+        if path.endswith(".npy"):
+            image = np.load(path).astype(np.float32)
+        else:
+            try:
+                from PIL import Image
+            except ImportError:
+                raise ImportError("Reading %s needs Pillow (pip install pillow), or save it as .npy" % path)
+            image = np.asarray(Image.open(path).convert("L"), dtype=np.float32) * (100.0 / 255.0)
+
+        radius = int(round(spot_mm / mm_per_pixel / 2))
+        if radius > 0:
+            image = _box_blur(image, radius)
+        return cls(image, mm_per_pixel, centerline, line_width_mm, float(np.median(image)))
+
+    def _pixels(self, x, y):
+        rows, columns = self.reflection.shape
+        column = np.clip((x / self.mm_per_pixel).astype(np.intp), 0, columns - 1)
+        row = np.clip((y / self.mm_per_pixel).astype(np.intp), 0, rows - 1)
+        return row, column
+
+    def sample(self, x, y):
+        """Reflection under each (x, y) position in mm."""
+        rows, columns = self.reflection.shape
+        inside = (x >= 0) & (y >= 0) & (x < columns * self.mm_per_pixel) & (y < rows * self.mm_per_pixel)
+        row, column = self._pixels(x, y)
+        return np.where(inside, self.reflection[row, column], np.float32(self.outside))
+
+    def locate(self, x, y):
+        """Return (distance along the track, signed offset left of the centre line) in mm.
+
+        Both are looked up in maps made once for the whole picture, so this is
+        as cheap as sample(). The offset is interpolated between pixels.
+        """
+        along = self.along_map[self._pixels(x, y)]
+        rows, columns = self.offset_map.shape
+        column = np.clip(x / self.mm_per_pixel - 0.5, 0, columns - 1.001)
+        row = np.clip(y / self.mm_per_pixel - 0.5, 0, rows - 1.001)
+        left = column.astype(np.intp)
+        top = row.astype(np.intp)
+        across = column - left
+        down = row - top
+        grid = self.offset_map
+        upper = grid[top, left] * (1 - across) + grid[top, left + 1] * across
+        lower = grid[top + 1, left] * (1 - across) + grid[top + 1, left + 1] * across
+        return along, upper * (1 - down) + lower * down
+
+    def pose_at(self, along, offset=0.0):
+        """Return (x, y, heading) of the point along mm down the track, offset mm to the left."""
+        along = along % self.length
+        segment = int(np.searchsorted(self.offsets, along, side="right") - 1)
+        direction = self.vectors[segment] / self.lengths[segment]
+        point = self.starts[segment] + direction * (along - self.offsets[segment])
+        heading = math.atan2(direction[1], direction[0])
+        return point[0] - direction[1] * offset, point[1] + direction[0] * offset, heading
+
+def _nearest_maps(points, shape, mm_per_pixel):
+    """For every pixel: distance along the loop to its nearest centre-line point, and the
+    signed distance to it (positive on the left when driving)."""
+    rows, columns = shape
+    grid_x, grid_y = np.meshgrid((np.arange(columns) + 0.5) * mm_per_pixel, (np.arange(rows) + 0.5) * mm_per_pixel)
+    best = np.full(shape, np.inf)
+    along = np.zeros(shape)
+    side = np.ones(shape)
+    travelled = 0.0
+    for start, end in zip(points, np.roll(points, -1, axis=0)):
+        vector = end - start
+        length = math.hypot(*vector)
+        dx = grid_x - start[0]
+        dy = grid_y - start[1]
+        t = np.clip((dx * vector[0] + dy * vector[1]) / max(length * length, 1e-12), 0.0, 1.0)
+        distance = np.hypot(dx - t * vector[0], dy - t * vector[1])
+        closer = distance < best
+        best[closer] = distance[closer]
+        along[closer] = travelled + t[closer] * length
+        side[closer] = np.where(vector[0] * dy[closer] - vector[1] * dx[closer] < 0, -1.0, 1.0)
+        travelled += length
+    return along.astype(np.float32), (side * best).astype(np.float32)
+
+def _box_blur(image, radius):
+    """Average every pixel with its neighbours in a (2 * radius + 1) square."""
+    size = 2 * radius + 1
+    padded = np.pad(image, radius, mode="edge")
+    summed = padded.cumsum(axis=0).cumsum(axis=1)
+    summed = np.pad(summed, ((1, 0), (1, 0)))
+    total = summed[size:, size:] - summed[:-size, size:] - summed[size:, :-size] + summed[:-size, :-size]
+    return (total / (size * size)).astype(np.float32)
+
+def oval_track(straight_mm=600.0, radius_mm=250.0, points_per_curve=48, **options):
+    """A loop with two straights and two half circles, driven counter-clockwise.
+
+    Extra options (line_width_mm, mm_per_pixel, dark, light, ...) go to
+    Track.from_centerline.
+    """
+    angles = np.linspace(-math.pi / 2, math.pi / 2, points_per_curve, endpoint=False)
+    bottom = [(x, 0.0) for x in np.linspace(0.0, straight_mm, 8, endpoint=False)]
+    right = [(straight_mm + radius_mm * math.cos(a), radius_mm + radius_mm * math.sin(a)) for a in angles]
+    top = [(x, 2 * radius_mm) for x in np.linspace(straight_mm, 0.0, 8, endpoint=False)]
+    left = [(-radius_mm * math.cos(a), radius_mm - radius_mm * math.sin(a)) for a in angles]
+    return Track.from_centerline(np.array(bottom + right + top + left), **options)
+
+########################################################################
+# 🤖 TrackSimulator - a batch of robots on one track
+########################################################################
+class TrackSimulator(Simulator):
+    """Many line-following robots on one track, moved together with NumPy.
+
+    Each control tick, every robot's step (for example its follow_line())
+    runs once: color_sensor.reflection() returns that robot's reading and
+    motor.run() on the drive ports sets that robot's wheel speeds. Then all
+    robots move for control_period_ms in one set of array operations.
+
+    Args:
+        track (Track): The track, for example oval_track().
+        robots (int): How many robots drive at once.
+        control_period_ms (int): Time between steps (the hub's loop time).
+        motor_lag_ms (float): Time constant for a motor to reach a new speed.
+        noise (float): Standard deviation of the reflection reading.
+        sensor_offset_mm (float): How far in front of the wheels the color sensor sits.
+        start_jitter_mm (float): Random sideways start offset (each robot differs).
+        heading_jitter_deg (float): Random start heading error.
+        lost_mm (float): A robot this far from its edge has lost the line and stops.
+        seed (int or list): Random seed, for repeatable runs. A list gives the
+            robots out in equal groups, one group per seed, and each group
+            draws its start and noise from its own seed, so a group drives
+            the same whatever other groups share the batch.
+    """
+
+    def __init__(self, track, robots=20, control_period_ms=10, motor_lag_ms=40.0,
+                 noise=1.5, sensor_offset_mm=55.0, start_jitter_mm=3.0, heading_jitter_deg=3.0,
+                 lost_mm=40.0, seed=None, wheel_diameter_mm=56.0, track_width_mm=109.0):
+        super().__init__(step_cost_us=0, io_cost_us=0, wheel_diameter_mm=wheel_diameter_mm,
+                         track_width_mm=track_width_mm, left_port=port.C, right_port=port.D)
+        self.track = track
+        self.robots = robots
+        self.control_period_ms = control_period_ms
+        self.motor_lag_ms = motor_lag_ms
+        self.noise = noise
+        self.sensor_offset_mm = sensor_offset_mm
+        self.lost_mm = lost_mm
+        seeds = list(seed) if isinstance(seed, (list, tuple)) else [seed]
+        if robots % len(seeds):
+            raise ValueError("%d robots cannot be split evenly between %d seeds" % (robots, len(seeds)))
+        self.group_size = robots // len(seeds)
+        self.rngs = [np.random.default_rng(group_seed) for group_seed in seeds]
+        self.mm_per_degree = math.pi * wheel_diameter_mm / 360
+
+        # The robot whose step is running, and what its hardware calls see
+        self.robot = 0
+        self._readings = [0] * robots
+        self._commands = [[0.0, 0.0] for _ in range(robots)]
+
+        # Start every robot with its sensor on the right-hand edge of the line
+        x, y, heading = track.pose_at(0.0, -track.line_width_mm / 2)
+        offset = self.normal(start_jitter_mm)
+        self.robot_heading = heading + np.radians(self.normal(heading_jitter_deg))
+        sensor_x = x - math.sin(heading) * offset
+        sensor_y = y + math.cos(heading) * offset
+        self.robot_x = sensor_x - sensor_offset_mm * np.cos(self.robot_heading)
+        self.robot_y = sensor_y - sensor_offset_mm * np.sin(self.robot_heading)
+        self.wheel_speed = np.zeros((robots, 2))    # degrees per second, forward positive
+        self.wheel_degrees = np.zeros((robots, 2))
+
+    # ------------------------------------------------------------------
+    # What the stand-in modules call, answered for the current robot
+    # ------------------------------------------------------------------
+    def read_sensor(self, kind, sensor_port):
+        if kind == "reflection":
+            return self._readings[self.robot]
+        if kind == "color":
+            reading = self._readings[self.robot]
+            return 0 if reading < 30 else (10 if reading > 70 else -1)
+        return super().read_sensor(kind, sensor_port)
+
+    def set_motor_velocity(self, motor_port, velocity, command=None):
+        if motor_port == self.left_port:
+            self._commands[self.robot][0] = -velocity
+        elif motor_port == self.right_port:
+            self._commands[self.robot][1] = velocity
+        else:
+            super().set_motor_velocity(motor_port, velocity, command)
+
+    def motor_position(self, motor_port):
+        if motor_port == self.left_port:
+            return -self.wheel_degrees[self.robot, 0]
+        if motor_port == self.right_port:
+            return self.wheel_degrees[self.robot, 1]
+        return super().motor_position(motor_port)
+
+    # ------------------------------------------------------------------
+    # Batch physics
+    # ------------------------------------------------------------------
+    def sensor_position(self):
+        return (self.robot_x + self.sensor_offset_mm * np.cos(self.robot_heading),
+                self.robot_y + self.sensor_offset_mm * np.sin(self.robot_heading))
+
+    def normal(self, scale):
+        """One random number per robot (mean 0), each group from its own seed."""
+        if len(self.rngs) == 1:
+            return self.rngs[0].normal(0.0, scale, self.robots)
+        return np.concatenate([rng.normal(0.0, scale, self.group_size) for rng in self.rngs])
+
+    def read_reflection(self, position=None):
+        """Noisy whole-number reflection under every robot's sensor (at position, if already known)."""
+        values = self.track.sample(*(position or self.sensor_position()))
+        if self.noise:
+            values = values + self.normal(self.noise)
+        return np.clip(np.rint(values), 0, 100).astype(np.int64)
+
+    def move(self, commands, duration_ms):
+        """Move every robot for duration_ms with the wheel speeds lagging behind commands.
+
+        The lag is first order, so each wheel's speed and the distance it
+        covers in the step are worked out exactly; the turn uses the heading
+        halfway through the step.
+        """
+        commands = np.clip(commands, -MAX_VELOCITY, MAX_VELOCITY)
+        dt = duration_ms / 1000
+        if self.motor_lag_ms > 0:
+            tau = self.motor_lag_ms / 1000
+            decay = math.exp(-dt / tau)
+            gap = self.wheel_speed - commands
+            average = commands + gap * (tau / dt * (1.0 - decay))
+            self.wheel_speed = commands + gap * decay
+        else:
+            average = self.wheel_speed = commands
+        self.wheel_degrees += average * dt
+
+        distance = average * (self.mm_per_degree * dt)
+        left = distance[:, 0]
+        right = distance[:, 1]
+        forward = (left + right) * 0.5
+        turn = (right - left) / self.track_width_mm
+        middle = self.robot_heading + turn * 0.5
+        self.robot_x += forward * np.cos(middle)
+        self.robot_y += forward * np.sin(middle)
+        self.robot_heading += turn
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+    def drive(self, steps=None, controller=None, laps=1, duration_ms=120000, quiet=True):
+        """Drive every robot until it finishes laps, loses the line, or time runs out.
+
+        Give either steps, one function per robot that returns the coroutine for
+        one control step (see line_follow_steps), or controller, a function
+        that takes every robot's reading and returns (left, right) wheel speeds
+        (see ProportionalBatch).
+
+        quiet hides anything the steps print. Returns a BatchResult.
+        """
+        if (steps is None) == (controller is None):
+            raise ValueError("Give either steps or controller")
+        if steps is not None and len(steps) != self.robots:
+            raise ValueError("Need one step per robot (%d), got %d" % (self.robots, len(steps)))
+        self.activate()
+
+        track = self.track
+        count = self.robots
+        position = self.sensor_position()
+        along, _ = track.locate(*position)
+        progress = np.zeros(count)
+        lap_time_ms = np.full(count, np.nan)
+        active = np.ones(count, dtype=bool)
+        lost = np.zeros(count, dtype=bool)
+        squared_error = np.zeros(count)
+        max_error = np.zeros(count)
+        samples = np.zeros(count)
+        goal = laps * track.length
+        half_width = track.line_width_mm / 2
+
+        saved_stdout = sys.stdout
+        if quiet:
+            sys.stdout = _Silent()
+        try:
+            ticks = int(duration_ms // self.control_period_ms)
+            for _ in range(ticks):
+                if not active.any():
+                    break
+                readings = self.read_reflection(position)
+                if controller is not None:
+                    left, right = controller(readings)
+                    commands = np.stack((left, right), axis=1).astype(np.float64)
+                else:
+                    self._readings = readings.tolist()
+                    for robot in np.flatnonzero(active).tolist():
+                        self.robot = robot
+                        _run_step(steps[robot]())
+                    commands = np.array(self._commands, dtype=np.float64)
+                commands[~active] = 0.0
+                self.move(commands, self.control_period_ms)
+                self.now_us += self.control_period_ms * 1000
+
+                # Score: progress along the track and distance from the followed edge
+                position = self.sensor_position()
+                new_along, offset = track.locate(*position)
+                step = (new_along - along + track.length / 2) % track.length - track.length / 2
+                along = new_along
+                error = offset + half_width
+                progress[active] += step[active]
+                squared_error[active] += error[active] ** 2
+                np.maximum(max_error, np.where(active, np.abs(error), 0.0), out=max_error)
+                samples[active] += 1
+
+                newly_lost = active & (np.abs(error) > self.lost_mm)
+                lost |= newly_lost
+                finished = active & (progress >= goal)
+                lap_time_ms[finished] = self.now_us / 1000
+                active &= ~(newly_lost | finished)
+                self.wheel_speed[~active] = 0.0
+        finally:
+            sys.stdout = saved_stdout
+
+        rms_error = np.sqrt(squared_error / np.maximum(samples, 1))
+        return BatchResult(lap_time_ms, rms_error, max_error, lost, progress / track.length, laps)
+
+def _run_step(coroutine):
+    """Run one control step to the end. Steps must not wait (no sleep inside)."""
+    try:
+        coroutine.send(None)
+    except StopIteration:
+        return
+    coroutine.close()
+    raise RuntimeError("A control step awaited something; the track simulator runs steps without waiting")
+
+class _Silent:
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+########################################################################
+# 📊 BatchResult - how each robot did
+########################################################################
+class BatchResult:
+    """Per-robot results of TrackSimulator.drive(), as NumPy arrays.
+
+    Attributes:
+        lap_time_ms: Time to finish the laps (nan if the robot did not finish).
+        rms_error_mm: Root-mean-square distance from the followed edge.
+        max_error_mm: Largest distance from the followed edge.
+        lost: True for robots that lost the line.
+        laps_done: How far each robot got, in laps.
+    """
+
+    def __init__(self, lap_time_ms, rms_error_mm, max_error_mm, lost, laps_done, laps):
+        self.lap_time_ms = lap_time_ms
+        self.rms_error_mm = rms_error_mm
+        self.max_error_mm = max_error_mm
+        self.lost = lost
+        self.laps_done = laps_done
+        self.laps = laps
+
+    @property
+    def finished(self):
+        return ~np.isnan(self.lap_time_ms)
+
+    def summary(self):
+        finished = self.finished
+        lines = ["Robots: %d | finished %d | lost the line %d | out of time %d" % (
+            len(finished), finished.sum(), self.lost.sum(), (~finished & ~self.lost).sum())]
+        if finished.any():
+            times = self.lap_time_ms[finished] / 1000 / self.laps
+            lines.append("Lap time: mean %.2f s | best %.2f s | worst %.2f s" % (times.mean(), times.min(), times.max()))
+            lines.append("Cross-track error (finished): RMS %.1f mm | max %.1f mm" % (
+                self.rms_error_mm[finished].mean(), self.max_error_mm[finished].max()))
+        else:
+            lines.append("Furthest robot: %.2f laps" % self.laps_done.max())
+        return "\n".join(lines)
+
+########################################################################
+# 🎛️ Controllers
+########################################################################
+class ProportionalBatch:
+    """LineFollow's proportional steering for every robot at once.
+
+    Same formula as follow_line() without a controller or table: correction =
+    kp * (target_light - reflection), then the motors get int(speed +/- correction).
+    Each argument can be a single number or one value per robot.
+    """
+
+    def __init__(self, target_light, speed, kp, error_scale=1.0):
+        self.target_light = np.asarray(target_light, dtype=np.float64)
+        self.speed = np.asarray(speed, dtype=np.float64)
+        self.kp = np.asarray(kp, dtype=np.float64)
+        self.error_scale = error_scale
+
+    def __call__(self, reflection):
+        correction = self.kp * ((self.target_light - reflection) * self.error_scale)
+        return np.trunc(self.speed + correction), np.trunc(self.speed - correction)
+
+def load_follower_class(program, name):
+    """Load a class from a hub program (in Python/) without starting the program."""
+    from spike_sim import PYTHON_DIR
+
+    sim = Simulator()
+    module = load_program(os.path.join(PYTHON_DIR, program), sim, defer=True)
+    for coroutine in sim.deferred:
+        coroutine.close()
+    return getattr(module, name)
+
+def line_follow_steps(sim, target_light=55, speed=140, kp=6.5, **options):
+    """One LineFollow per robot, with follow_line() as its step.
+
+    Settings can be single numbers or one per robot. Each robot is made
+    with quiet=True, so follow_line() skips its per-iteration print.
+    Extra options (controller, integer_mode, ...) go to LineFollow; a
+    controller must be a function that makes a new one for each robot.
+    """
+    LineFollow = load_follower_class("line_follower.py", "LineFollow")
+    sim.activate()
+    make_controller = options.pop("controller", None)
+    steps = []
+    for robot in range(sim.robots):
+        follower = LineFollow(_pick(target_light, robot), _pick(speed, robot), _pick(kp, robot),
+                              quiet=True,
+                              controller=make_controller() if make_controller else None, **options)
+        steps.append(follower.follow_line)
+    return steps
+
+def educational_steps(sim, target_light=55, speed=140, kp=6.5, **options):
+    """One EducationalLineFollower per robot, stepping follow_with_physics_explanation(False)."""
+    EducationalLineFollower = load_follower_class("educational_line_follower.py", "EducationalLineFollower")
+    sim.activate()
+    steps = []
+    for robot in range(sim.robots):
+        follower = EducationalLineFollower(_pick(target_light, robot), _pick(speed, robot), _pick(kp, robot),
+                                           **options)
+        steps.append(lambda follower=follower: follower.follow_with_physics_explanation(False))
+    return steps
+
+def _pick(value, robot):
+    return value[robot] if isinstance(value, (list, tuple, np.ndarray)) else value
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Drive simulated line followers around a track.")
+    parser.add_argument("--follower", choices=("line_follower", "educational", "batch"), default="line_follower",
+                        help="LineFollow, EducationalLineFollower, or the vectorized ProportionalBatch")
+    parser.add_argument("--robots", type=int, default=20)
+    parser.add_argument("--target", type=float, default=55, help="target_light")
+    parser.add_argument("--speed", type=float, default=140)
+    parser.add_argument("--kp", type=float, default=6.5)
+    parser.add_argument("--laps", type=int, default=1)
+    parser.add_argument("--seconds", type=float, default=120, help="simulated time limit")
+    parser.add_argument("--period", type=int, default=10, help="control period in ms")
+    parser.add_argument("--noise", type=float, default=1.5)
+    parser.add_argument("--lag", type=float, default=40, help="motor lag time constant in ms")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    track = oval_track()
+    sim = TrackSimulator(track, robots=args.robots, control_period_ms=args.period, motor_lag_ms=args.lag,
+                         noise=args.noise, seed=args.seed)
+    started = time.perf_counter()
+    if args.follower == "batch":
+        result = sim.drive(controller=ProportionalBatch(args.target, args.speed, args.kp),
+                           laps=args.laps, duration_ms=args.seconds * 1000)
+    else:
+        make_steps = line_follow_steps if args.follower == "line_follower" else educational_steps
+        target = int(args.target)
+        speed = int(args.speed)
+        result = sim.drive(make_steps(sim, target, speed, args.kp), laps=args.laps, duration_ms=args.seconds * 1000)
+    wall = time.perf_counter() - started
+
+    print("Track: %.0f mm loop, line %.0f mm wide" % (track.length, track.line_width_mm))
+    print(result.summary())
+    laps = np.minimum(result.laps_done, args.laps).sum()
+    print("Simulated %.0f robot-laps in %.2f s (%.0f laps per second)" % (laps, wall, laps / wall if wall else 0))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
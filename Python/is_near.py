@@ -3,30 +3,12 @@ import runloop, time, sys, motor_pair, motor, force_sensor
 import color, color_sensor, distance_sensor
 from hub import light, light_matrix, port, sound
 from time import sleep, sleep_ms
+from sensor_cache import SensorSnapshot
+from spike_helpers import DEGREES_PER_CM, DEGREES_PER_INCH, MM_PER_INCH
+from spike_helpers import configure, is_near, is_pressed, is_color_red
 
-#constants
-DEGREES_PER_CM = 21
-DEGREES_PER_INCH = 53
-MM_PER_INCH = 25.4
-
-
-def is_pressed():
-    return force_sensor.pressed(port.A)
-
-
-def is_near(distance_threshold=100):
-    distance = distance_sensor.distance(port.B)
-    
-    # Check if sensor is working (returns -1 when no reading)
-    if distance == -1:
-        print("Warning: Distance sensor not detecting anything")
-        return False
-    
-    print ("Distance {:5.2f} cm {:6.2f} inches ".format(distance / 10, distance / 25.4))
-    return distance < distance_threshold
-
-def is_color_red():
-    return color_sensor.color(port.A) == color.RED
+# Checks that happen in the same tick share one reading of each sensor
+configure(sensors=SensorSnapshot())
 
 
 async def main():
@@ -42,7 +24,7 @@ async def main():
 
             # stop moving
             motor_pair.stop(motor_pair.PAIR_1)
-            sleep_ms(10) # sleep 10 milliseconds
+            await runloop.sleep_ms(10) # sleep 10 milliseconds
 
 runloop.run(main())
 sys.exit()
@@ -0,0 +1,180 @@
+# Latency Tracer
+import runloop, time # pyright: ignore[reportMissingImports]
+
+# Histogram bins in ms: under 1, 1-2, 2-5, ... 500-1000, and 1000 or more
+BIN_EDGES_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+########################################################################
+# ⏱️ LatencyStats - how long one kind of event took to get a response
+########################################################################
+class LatencyStats:
+    """A histogram of event-to-actuation times (in microseconds) for one event type.
+
+    Only counts and totals are kept, never a list of every sample, so it
+    uses the same memory however long the program runs.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.bins = [0] * (len(BIN_EDGES_MS) + 1)
+        self.count = 0
+        self.total_us = 0
+        self.min_us = None
+        self.max_us = 0
+        self.noticed = 0         # responses where the program's own check was timed too
+        self.notice_total_us = 0 # event to the program noticing it, summed over those
+
+        # The event waiting for a response (ticks_us), or None
+        self.onset_us = None
+        self.noticed_us = None
+
+    def add(self, latency_us):
+        self.count += 1
+        self.total_us += latency_us
+        if self.min_us is None or latency_us < self.min_us:
+            self.min_us = latency_us
+        if latency_us > self.max_us:
+            self.max_us = latency_us
+        latency_ms = latency_us // 1000
+        index = 0
+        while index < len(BIN_EDGES_MS) and latency_ms >= BIN_EDGES_MS[index]:
+            index += 1
+        self.bins[index] += 1
+
+########################################################################
+# ⏱️ LatencyTracer - time from a sensor event to the command it causes
+########################################################################
+class LatencyTracer:
+    """Measure how long the program takes to respond to sensor events.
+
+    Three things are timed with time.ticks_us:
+
+        1. When the event really happens. watch() gives the tracer the
+           condition (like is_near), and the tracer's own probe() task checks
+           it every probe_ms, separately from the program's tasks.
+        2. When the program notices it (optional). Wrap the program's own
+           check with noticed(), so the delay can be split in two: waiting
+           for a check, and getting from the check to the command.
+        3. When the command is given. Wrap the actuator call (like
+           motor_pair.stop) with actuator(); its first call after an event
+           ends the measurement.
+
+    report() prints a histogram of the delays for each event type. The
+    probe reads the sensor often, so it costs a little time itself; the
+    delays it sees can be up to probe_ms late.
+
+    When enabled is False, nothing is wrapped and probe() returns at once,
+    so the program runs with no tracing cost.
+
+    Args:
+        enabled (bool): Turn tracing on or off.
+            Defaults to True.
+        probe_ms (int): How often the probe checks the watched conditions.
+            Defaults to 2.
+
+    Example:
+        tracer = LatencyTracer(enabled=TRACE_LATENCY)
+        tracer.watch("hand", is_near)
+        stop = tracer.actuator(lambda: motor_pair.stop(motor_pair.PAIR_1), "hand")
+
+        async def when_hand_wave():
+            await runloop.until(tracer.noticed("hand", is_near))
+            stop()
+
+        runloop.run(when_hand_wave(), robot_movement(), tracer.probe())
+        tracer.report()
+    """
+
+    def __init__(self, enabled=True, probe_ms=2):
+        self.enabled = enabled
+        self.probe_ms = probe_ms
+        self.stats = {}
+        self._watched = []
+
+    def _stats_for(self, event):
+        stats = self.stats.get(event)
+        if stats is None:
+            stats = self.stats[event] = LatencyStats(event)
+        return stats
+
+    def watch(self, event, condition):
+        """Have probe() timestamp the moment condition() becomes True."""
+        if self.enabled:
+            self._watched.append([self._stats_for(event), condition, False])
+
+    def noticed(self, event, condition):
+        """Return condition wrapped to timestamp when the program first sees it True (or condition itself if disabled)."""
+        if not self.enabled:
+            return condition
+        stats = self._stats_for(event)
+
+        def check():
+            result = condition()
+            if result and stats.noticed_us is None:
+                stats.noticed_us = time.ticks_us()
+                if stats.onset_us is None:
+                    stats.onset_us = stats.noticed_us  # not watched: time from noticing
+            return result
+
+        return check
+
+    def actuator(self, function, event):
+        """Return function wrapped so its first call after an event records the delay (or function itself if disabled)."""
+        if not self.enabled:
+            return function
+        stats = self._stats_for(event)
+
+        def traced(*args, **kwargs):
+            if stats.onset_us is not None:
+                now = time.ticks_us()
+                stats.add(time.ticks_diff(now, stats.onset_us))
+                if stats.noticed_us is not None:
+                    stats.noticed += 1
+                    stats.notice_total_us += time.ticks_diff(stats.noticed_us, stats.onset_us)
+                stats.onset_us = None
+                stats.noticed_us = None
+            return function(*args, **kwargs)
+
+        return traced
+
+    def event(self, event):
+        """Record that event happened now (for events the program finds some other way)."""
+        if self.enabled:
+            stats = self._stats_for(event)
+            if stats.onset_us is None:
+                stats.onset_us = time.ticks_us()
+
+    async def probe(self, stop_when=None):
+        """Task that checks every watched condition each probe_ms until stop_when() is True."""
+        if not self.enabled or not self._watched:
+            return
+        while stop_when is None or not stop_when():
+            for watched in self._watched:
+                stats, condition, was_true = watched
+                is_true = bool(condition())
+                if is_true and not was_true and stats.onset_us is None:
+                    stats.onset_us = time.ticks_us()
+                watched[2] = is_true
+            await runloop.sleep_ms(self.probe_ms)
+
+    def report(self):
+        """Print the delay histogram for each event type."""
+        if not self.enabled:
+            return
+        lines = []
+        for stats in self.stats.values():
+            if not stats.count:
+                lines.append("%s: no responses yet%s" % (stats.name, " (1 waiting)" if stats.onset_us is not None else ""))
+                continue
+            line = "%s: %d responses, min %d ms, avg %d ms, max %d ms" % (
+                stats.name, stats.count, stats.min_us // 1000, stats.total_us // stats.count // 1000, stats.max_us // 1000)
+            if stats.noticed:
+                line += " (avg %d ms until noticed)" % (stats.notice_total_us // stats.noticed // 1000)
+            lines.append(line)
+            low = 0
+            for index, count in enumerate(stats.bins):
+                if count:
+                    label = "%d-%d ms" % (low, BIN_EDGES_MS[index]) if index < len(BIN_EDGES_MS) else "%d+ ms" % low
+                    lines.append("  %10s %4d %s" % (label, count, "#" * min(count, 40)))
+                low = BIN_EDGES_MS[index] if index < len(BIN_EDGES_MS) else low
+        print("\n".join(lines))
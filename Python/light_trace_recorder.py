@@ -0,0 +1,51 @@
+# Light Trace Recorder
+import runloop, sys # pyright: ignore[reportMissingImports]
+import color_sensor # pyright: ignore[reportMissingImports]
+from hub import button, light, port # pyright: ignore[reportMissingImports]
+from color_trace import ColorTrace
+
+########################################################################
+# 🎞️ Light Trace Recorder
+# Records the color sensor in front of a Christmas light so the
+# Christmas Tree Light Detector can be re-tuned on the computer:
+#     python host/light_replay.py light_trace.bin --buffer-size 5:20:5
+#
+# 1. Start with the light switched OFF and the sensor 1cm from it
+# 2. Press the LEFT button every time you switch the light on or off
+# 3. Press the RIGHT button to stop and save the trace
+########################################################################
+color_port = port.F
+RECORD_EVERY_MS = 20 # Faster than the detector, so any detector speed can be replayed
+TRACE_FILE = "light_trace.bin"
+TRACE_CAPACITY = 50000 # Records kept (about 16 minutes at 20ms)
+
+# Color codes for the power button LED
+green = 6
+red = 9
+
+async def record():
+    trace = ColorTrace(TRACE_FILE, TRACE_CAPACITY)
+    light_on = False
+    trace.mark(light_on)
+    light.color(light.POWER, red)
+    left_was_pressed = False
+    print("🎞️ Recording - LEFT when you switch the light, RIGHT to stop")
+
+    while not button.pressed(button.RIGHT):
+        trace.reading(color_sensor.color(color_port))
+
+        # Count a press once, not every reading while the button is held
+        left_pressed = bool(button.pressed(button.LEFT))
+        if left_pressed and not left_was_pressed:
+            light_on = not light_on
+            trace.mark(light_on)
+            light.color(light.POWER, green if light_on else red)
+        left_was_pressed = left_pressed
+
+        await runloop.sleep_ms(RECORD_EVERY_MS)
+
+    trace.close()
+    print("Saved %d records to %s" % (trace.log.total, TRACE_FILE))
+
+runloop.run(record())
+sys.exit()
@@ -4,17 +4,32 @@ import color, color_sensor, distance_sensor # pyright: ignore[reportMissingImpor
 from hub import light, light_matrix, port, sound # pyright: ignore[reportMissingImports]
 from time import sleep, sleep_ms
 from runloop import run # pyright: ignore[reportMissingImports]
-
-# Conversion constants
-DEGREES_PER_CM = 21
-DEGREES_PER_INCH = 53
-MM_PER_INCH = 25.4
+from color_events import ColorEventBus
+from motion_sequence import MotionSequence
+from task_group import TaskGroup
+from adaptive_poller import AdaptivePoller
+from profiler import Profiler
+from latency import LatencyTracer
+from spike_helpers import DEGREES_PER_CM, DEGREES_PER_INCH, MM_PER_INCH
+from spike_helpers import configure, is_near
+
+# Set to True to print how long each task runs and how much memory is used
+PROFILE = False
+profiler = Profiler(enabled=PROFILE)
+
+# Set to True to measure how long the motors take to stop after a hand comes close
+TRACE_LATENCY = False
+tracer = LatencyTracer(enabled=TRACE_LATENCY)
+
+# Sensor helpers read the distance sensor on port B (is_near stays quiet so it doesn't slow the loop)
+distance_port = port.B
+configure(distance_port=distance_port, quiet=True)
+tracer.watch("hand", is_near)
 
 # how many times we see each color
 red_count = 0
 yellow_count = 0
 blue_count = 0
-distance_port = port.B
 
 # Color codes - these numbers represent different colors to the robot
 blue = 3
@@ -24,106 +39,83 @@ red = 9
 # Connect two motors together so they work as a team
 motor_pair.pair(motor_pair.PAIR_1, port.C, port.D)
 
-# Remember the last color we saw so we don't count the same color twice in a row
-last_color = None
+# Drives a list of moves without stopping between them
+motion = MotionSequence(motor_pair.PAIR_1, port.C, port.D)
 
-# This is like a stop sign for our program - when it's True, everything stops
-should_stop = False
+# turn left 90 degrees, then move forward 4in - four times makes a full lap
+lap = [(180, -100), (4 * DEGREES_PER_INCH, 0)] * 4
 
-########################################################################
-# ☀️ is_near - Function or condition to check if something is close
-########################################################################
-def is_near(distance_threshold=100): # 100mm (4 inches) minimum
-    distance = distance_sensor.distance(distance_port)
-    if distance == -1:
-        return False
-    return distance < distance_threshold
+# One task reads the color sensor and tells the counters when a color starts
+# It reads every 10ms right after a color change, slowing down to every 50ms on plain mat
+# A stripe must stay under the sensor for 50ms to be counted (about 9mm at the default speed)
+color_bus = ColorEventBus(port.F)
+color_poller = AdaptivePoller(profiler.function(color_bus.poll, "color poll"), fast_ms=10, slow_ms=50, name="Color")
+
+# This is like a stop sign for our program - cancelling the group stops everything
+# The motors and the color bus are stopped the moment it is cancelled
+group = TaskGroup()
+group.on_cancel(tracer.actuator(lambda: motor_pair.stop(motor_pair.PAIR_1), "hand"))
+group.on_cancel(color_poller.stop)
 
 #####################################################################
-# 🛑 Watch for blue colors continuously
+# 🛑 Count blue crossings (called by the color event bus)
 #####################################################################
-async def when_blue():
-    global blue_count, last_color, should_stop
+def when_blue(color_code):
+    global blue_count
 
-    while not should_stop:
-        # count the number of times crossing over the blue
-        current_color = color_sensor.color(port.F)
-        if current_color == blue and last_color != blue:
-            light.color(light.POWER, current_color)
-            last_color = blue
-            blue_count += 1
-
-        await runloop.sleep_ms(50)
+    # count the number of times crossing over the blue
+    light.color(light.POWER, color_code)
+    blue_count += 1
 
 #####################################################################
-# 🛑 Watch for yellow colors continuously
+# 🛑 Count yellow crossings (called by the color event bus)
 #####################################################################
-async def when_yellow():
-    global yellow_count, last_color, should_stop
-
-    while not should_stop:
-        # count the number of times crossing over the yellow
-        current_color = color_sensor.color(port.F)
-        if current_color == yellow and last_color != yellow:
-            light.color(light.POWER, current_color)
-            last_color = yellow
-            yellow_count += 1
+def when_yellow(color_code):
+    global yellow_count
 
-        await runloop.sleep_ms(50)
+    # count the number of times crossing over the yellow
+    light.color(light.POWER, color_code)
+    yellow_count += 1
 
 #####################################################################
-# 🛑 Watch for red colors continuously
+# 🛑 Count red crossings (called by the color event bus)
 #####################################################################
-async def when_red():
-    global red_count, last_color, should_stop
+def when_red(color_code):
+    global red_count
 
-    while not should_stop:
-        # count the number of times crossing over the red
-        current_color = color_sensor.color(port.F)
-        if current_color == red and last_color != red:
-            light.color(light.POWER, current_color)
-            last_color = red
-            red_count += 1
+    # count the number of times crossing over the red
+    light.color(light.POWER, color_code)
+    red_count += 1
 
-        await runloop.sleep_ms(50)
+color_bus.on_enter(blue, when_blue)
+color_bus.on_enter(yellow, when_yellow)
+color_bus.on_enter(red, when_red)
 
 #####################################################################
 # 🛑 Watch for someone waving their hand near the distance sensor continuously
 #####################################################################
 async def when_hand_wave():
-    global blue_count, yellow_count, red_count, should_stop
-
-    while not should_stop:
+    global blue_count, yellow_count, red_count
 
-        # if sensor is working and hand wave closer than 100mm (4in)
-        if is_near():
-            motor_pair.stop(motor_pair.PAIR_1)
+    # wait until the sensor is working and a hand waves closer than 100mm (4in)
+    await group.token.until(tracer.noticed("hand", is_near))
 
-            # Tell all other functions to stop
-            should_stop = True
+    # Stop the motors and tell all other functions to stop
+    group.cancel()
 
-            print("Blue count:{:2d} Yellow count:{:2d} Red count:{:2d}".format(blue_count, yellow_count, red_count))
-            break
-
-        # Wait a bit before checking distance again
-        await runloop.sleep_ms(50)
+    print("Blue count:{:2d} Yellow count:{:2d} Red count:{:2d}".format(blue_count, yellow_count, red_count))
+    print(color_poller.report())
 
 #####################################################################
 # 🤖 Movement control function
 #####################################################################
 async def robot_movement():
-    global should_stop
-
-    while not should_stop:
-        
-        # turn left 90 degrees
-        await motor_pair.move_for_degrees(motor_pair.PAIR_1, 180, -100)
 
-        if should_stop:
-            break
+    while not group.is_cancelled():
 
-        # move forward 4in
-        await motor_pair.move_for_degrees(motor_pair.PAIR_1, 4 * 53, 0)
+        # drive a whole lap, blending the turns into the straights
+        # and stopping right away if the group is cancelled
+        await motion.run(lap, stop_when=group.is_cancelled)
 
 ########################################################################
 # 🤖 Main - Run all functions concurrently
@@ -131,13 +123,14 @@ async def robot_movement():
 async def main():
     
     # Run all functions concurrently as events
-    run(
-        when_hand_wave(),
-        when_blue(),
-        when_yellow(),
-        when_red(),
-        robot_movement()
-    )
+    run(*group.tasks(
+        profiler.task(when_hand_wave(), "hand wave"),
+        profiler.task(color_poller.run(), "color watcher"),
+        profiler.task(robot_movement(), "movement"),
+        tracer.probe(stop_when=group.is_cancelled)
+    ))
 
 runloop.run(main())
+profiler.report()
+tracer.report()
 sys.exit()
\ No newline at end of file
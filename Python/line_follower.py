@@ -1,3 +1,6 @@
+from steering_table import SteeringTable
+
+
 class LineFollow:
     """A robot that can follow a line.
     
@@ -19,6 +22,28 @@ class LineFollow:
             Defaults to 180.
         kp (float): Proportional gain for steering correction.
             Defaults to 6.8.
+        telemetry (Telemetry): Optional recorder from telemetry.py. When given, each
+            iteration is stored in its arrays instead of printed.
+            Defaults to None.
+        controller (PIDController): Optional controller from pid.py that adds integral
+            and derivative terms. When given, it computes the steering correction and
+            kp is only used for the debug print.
+            Defaults to None (proportional control with kp).
+        calibration (ReflectionCalibration): Optional result from calibration.py. When
+            given, target_light comes from the measured dark/light readings and the error
+            is stretched by its error_scale, so the same kp works on any surface.
+            Defaults to None.
+        integer_mode (bool): Look the motor speeds up in a SteeringTable built with
+            whole-number math instead of calculating them each iteration, so the loop
+            creates no decimal numbers. Uses kp only, so it cannot be combined with a
+            controller.
+            Defaults to False.
+        motor_output (MotorOutput): Optional layer from motor_output.py that skips motor
+            commands repeating the last speed sent to a port.
+            Defaults to None (every command is sent).
+        quiet (bool): Skip the per-iteration debug print when no telemetry is given,
+            for runs where nobody reads the output (like the track simulator).
+            Defaults to False.
            
     Example:
         Basic usage example:
@@ -29,16 +54,56 @@ class LineFollow:
             for i in range(100):
                 await line_follower.follow_line()
 
+        Fast runs without printing every iteration:
+
+            telemetry = Telemetry(capacity=1000)
+            line_follower = LineFollow(60, 180, 6.8, telemetry=telemetry)
+            for i in range(1000):
+                await line_follower.follow_line()
+            telemetry.dump()
+
+        Full PID control for higher speeds:
+
+            pid = PIDController(kp=6.0, ki=2.0, kd=0.4, integral_limit=20, output_limit=300)
+            line_follower = LineFollow(60, 250, controller=pid)
+
+        Target light measured on the mat (swept once, then loaded from the hub):
+
+            calibration = await load_or_calibrate()
+            line_follower = LineFollow(speed=250, kp=6.5, calibration=calibration)
+
+        Integer-only loop for long competition runs:
+
+            line_follower = LineFollow(60, 250, 6.5, telemetry=telemetry, integer_mode=True,
+                                       motor_output=MotorOutput(deadband=3))
+
+    Raises:
+        ValueError: If both integer_mode and a controller are given.
+
     Note:
         - Target_light is computed from half the difference between the value returned from the sensor when positioning over the light then over the dark. 
         - Higher speeds are mostly for competition runs. 
         - kp is the gain in a PID controller.
         """
 
-def __init__(self, target_light=70, speed=140, kp=6.5):
+    def __init__(self, target_light=70, speed=140, kp=6.5, telemetry=None, controller=None, calibration=None,
+                 integer_mode=False, motor_output=None, quiet=False):
+        if integer_mode and controller is not None:
+            raise ValueError("integer_mode uses kp only; it cannot be combined with a controller")
         self.target_light = target_light
         self.speed = speed
         self.kp = kp
+        self.telemetry = telemetry
+        self.controller = controller
+        self.error_scale = 1.0
+        if calibration is not None:
+            self.target_light = calibration.target_light
+            self.error_scale = calibration.error_scale
+        self.steering_table = None
+        if integer_mode:
+            self.steering_table = SteeringTable(self.target_light, self.speed, self.kp, self.error_scale)
+        self.motor_output = motor_output
+        self.quiet = quiet
         self.iteration = 0
     
     async def follow_line(self):
@@ -52,7 +117,9 @@ def __init__(self, target_light=70, speed=140, kp=6.5):
         The control algorithm works by:
         1. Reading light reflection from the color sensor
         2. Calculating error as (target_light - current_light)
-        3. Applying proportional gain (kp) to generate steering correction
+        3. Applying proportional gain (kp) to generate steering correction, or asking the
+           PID controller for it when one was given (in integer mode steps 2-4 are a
+           single steering table lookup)
         4. Adjusting left/right motor speeds based on correction
         
         Motor behavior:
@@ -70,7 +137,8 @@ def __init__(self, target_light=70, speed=140, kp=6.5):
             - Color sensor must be set to reflection mode before calling this method.
             - Parent code should call this method repeatedly in a loop for continuous line following
             - Each call performs one sensor reading and motor speed adjustment
-            - Debug information is printed each iteration showing sensor readings and calculated motor speeds
+            - Debug information is printed each iteration showing sensor readings and calculated motor speeds,
+              unless a Telemetry recorder was given, which stores the numbers instead, or quiet is True
         
         Example:
             # Parent code controls the loop
@@ -91,16 +159,36 @@ def __init__(self, target_light=70, speed=140, kp=6.5):
         # sleep(2)        # pyright: ignore[reportUndefinedVariable] # Perform one line following iteration
         # Perform one line following iteration
         light_intensity = color_sensor.reflection(port.F) # pyright: ignore[reportUndefinedVariable]
-        steering_correction = self.kp * (self.target_light - light_intensity)
-        
-        left_speed = self.speed + steering_correction
-        right_speed = self.speed - steering_correction
+        table = self.steering_table
+        if table is not None:
+            # Integer mode: the table is rebuilt only if a setting changed
+            table.sync(self.target_light, self.speed, self.kp, self.error_scale)
+            left_speed = table.left[light_intensity]
+            right_speed = table.right[light_intensity]
+            steering_correction = left_speed - self.speed
+        else:
+            error = (self.target_light - light_intensity) * self.error_scale
+            if self.controller is not None:
+                steering_correction = self.controller.update(error)
+            else:
+                steering_correction = self.kp * error
+            
+            left_speed = self.speed + steering_correction
+            right_speed = self.speed - steering_correction
         
-        motor.run(port.C, -int(left_speed)) # pyright: ignore[reportUndefinedVariable]
-        motor.run(port.D, int(right_speed)) # pyright: ignore[reportUndefinedVariable]
+        output = self.motor_output
+        if output is not None:
+            output.run(port.C, -int(left_speed)) # pyright: ignore[reportUndefinedVariable]
+            output.run(port.D, int(right_speed)) # pyright: ignore[reportUndefinedVariable]
+        else:
+            motor.run(port.C, -int(left_speed)) # pyright: ignore[reportUndefinedVariable]
+            motor.run(port.D, int(right_speed)) # pyright: ignore[reportUndefinedVariable]
         
-        self.debug_print(self.iteration, self.target_light, self.speed, self.kp, light_intensity, 
-                         steering_correction, left_speed, right_speed)
+        if self.telemetry is not None:
+            self.telemetry.record(self.iteration, light_intensity, steering_correction, left_speed, right_speed)
+        elif not self.quiet:
+            self.debug_print(self.iteration, self.target_light, self.speed, self.kp, light_intensity, 
+                             steering_correction, left_speed, right_speed)
         
         self.iteration += 1
 
@@ -112,5 +200,9 @@ def __init__(self, target_light=70, speed=140, kp=6.5):
 
     async def stop_motors(self):
         """Stop both motors"""
-        motor.stop(port.C) # pyright: ignore[reportUndefinedVariable]
-        motor.stop(port.D) # pyright: ignore[reportUndefinedVariable]
\ No newline at end of file
+        if self.motor_output is not None:
+            self.motor_output.stop(port.C) # pyright: ignore[reportUndefinedVariable]
+            self.motor_output.stop(port.D) # pyright: ignore[reportUndefinedVariable]
+        else:
+            motor.stop(port.C) # pyright: ignore[reportUndefinedVariable]
+            motor.stop(port.D) # pyright: ignore[reportUndefinedVariable]
\ No newline at end of file
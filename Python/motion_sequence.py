@@ -0,0 +1,168 @@
+# Motion Sequence
+import runloop, time, motor, motor_pair # pyright: ignore[reportMissingImports]
+from hub import port # pyright: ignore[reportMissingImports]
+
+########################################################################
+# 🛣️ MotionSequence - drive several moves in a row without stopping between them
+########################################################################
+class MotionSequence:
+    """Drive a list of (degrees, steering) moves as one smooth trip.
+
+    Each await motor_pair.move_for_degrees(...) speeds up from zero and slows
+    down to zero, so a path made of many moves spends a lot of time braking
+    and accelerating. MotionSequence plans the whole list first:
+
+        - Inside a move the speed follows a trapezoid: speed up, cruise, slow down.
+        - Where two moves join, the robot only slows down as much as the
+          biggest jump in one wheel's speed needs (a big change in steering =
+          slower join). It stops where a move asks to stop, where the
+          direction reverses, or where a wheel has to turn the other way (a
+          spin turn into a straight).
+
+    Segments are tuples:
+        (degrees, steering)          keep rolling into the next move
+        (degrees, steering, True)    come to a stop at the end of this move
+
+    degrees is how far the faster wheel turns, like move_for_degrees. Negative
+    degrees drive backward.
+
+    Args:
+        pair: The motor pair to drive.
+            Defaults to motor_pair.PAIR_1.
+        left_port: Port of the pair's left motor (used to measure distance).
+            Defaults to port.C.
+        right_port: Port of the pair's right motor.
+            Defaults to port.D.
+        max_speed (int): Cruise speed in degrees per second.
+            Defaults to 660.
+        acceleration (int): How quickly speed may change, in degrees per second per second.
+            Defaults to 1500.
+        min_speed (int): Slowest speed while moving, so the robot never stalls.
+            Defaults to 60.
+
+    Example:
+        motion = MotionSequence(motor_pair.PAIR_1, port.C, port.D)
+
+        # a square: four straight sides with in-place turns between them
+        square = [(10 * DEGREES_PER_INCH, 0), (180, -100)] * 4
+        await motion.run(square)
+        print(motion.report())
+
+    Note:
+        - stop_when (optional) is checked every tick; when it returns True the
+          robot stops right away and run() returns.
+    """
+
+    def __init__(self, pair=motor_pair.PAIR_1, left_port=port.C, right_port=port.D,
+                 max_speed=660, acceleration=1500, min_speed=60):
+        self.pair = pair
+        self.left_port = left_port
+        self.right_port = right_port
+        self.max_speed = max_speed
+        self.acceleration = acceleration
+        self.min_speed = min_speed
+        self.run_ms = 0
+        self.segments_done = 0
+
+    @staticmethod
+    def wheel_shares(steering):
+        """Return (left, right) wheel speed as a percent of the move's speed, like motor_pair steering."""
+        steering = max(-100, min(100, steering))
+        inner = 100 - 2 * abs(steering)  # 0 at +/-50 (one wheel stopped), -100 at +/-100 (spin)
+        return (100, inner) if steering >= 0 else (inner, 100)
+
+    def junction_speeds(self, segments):
+        """Return the speed to have at the end of each segment (the last one is always 0)."""
+        count = len(segments)
+        exit_speeds = [0] * count
+
+        # Highest speed each join allows on its own
+        for i in range(count - 1):
+            degrees, steering = segments[i][0], segments[i][1]
+            next_degrees, next_steering = segments[i + 1][0], segments[i + 1][1]
+            stop_here = len(segments[i]) > 2 and segments[i][2]
+            if stop_here or (degrees < 0) != (next_degrees < 0):
+                continue
+
+            # A wheel that has to turn the other way must stop first; otherwise the
+            # join is as slow as the biggest jump in a single wheel's speed needs
+            largest = 0
+            for share, next_share in zip(self.wheel_shares(steering), self.wheel_shares(next_steering)):
+                if share * next_share < 0:
+                    largest = 200
+                    break
+                if abs(next_share - share) > largest:
+                    largest = abs(next_share - share)
+            exit_speeds[i] = self.max_speed * (200 - largest) // 200
+
+        # Every segment must be long enough to reach its exit speed from its entry speed
+        # (v² = v0² + 2·a·d), first checking forward, then backward
+        two_a = 2 * self.acceleration
+        entry = 0
+        for i in range(count):
+            reachable = (entry * entry + two_a * abs(segments[i][0])) ** 0.5
+            if exit_speeds[i] > reachable:
+                exit_speeds[i] = int(reachable)
+            entry = exit_speeds[i]
+        for i in range(count - 1, 0, -1):
+            reachable = (exit_speeds[i] * exit_speeds[i] + two_a * abs(segments[i][0])) ** 0.5
+            if exit_speeds[i - 1] > reachable:
+                exit_speeds[i - 1] = int(reachable)
+
+        return exit_speeds
+
+    def _traveled(self):
+        left = abs(motor.relative_position(self.left_port))
+        right = abs(motor.relative_position(self.right_port))
+        return left if left > right else right
+
+    async def run(self, segments, stop_when=None):
+        """Drive every segment in order. Returns False if stop_when ended the trip early."""
+        start = time.ticks_ms()
+        exit_speeds = self.junction_speeds(segments)
+        two_a = 2 * self.acceleration
+        entry_speed = 0
+        self.segments_done = 0
+        finished = True
+
+        for i in range(len(segments)):
+            degrees, steering = segments[i][0], segments[i][1]
+            length = abs(degrees)
+            direction = 1 if degrees >= 0 else -1
+            exit_speed = exit_speeds[i]
+
+            motor.reset_relative_position(self.left_port, 0)
+            motor.reset_relative_position(self.right_port, 0)
+
+            traveled = 0
+            while traveled < length:
+                if stop_when is not None and stop_when():
+                    finished = False
+                    break
+
+                # Trapezoid: limited by speeding up from entry, slowing down to exit, and cruise
+                speed_up = (entry_speed * entry_speed + two_a * traveled) ** 0.5
+                slow_down = (exit_speed * exit_speed + two_a * (length - traveled)) ** 0.5
+                speed = min(self.max_speed, speed_up, slow_down)
+                if speed < self.min_speed:
+                    speed = self.min_speed
+
+                motor_pair.move(self.pair, steering, velocity=direction * int(speed))
+                await runloop.sleep_ms(10)
+                traveled = self._traveled()
+
+            if not finished:
+                break
+
+            self.segments_done += 1
+            entry_speed = exit_speed
+            if exit_speed == 0:
+                motor_pair.stop(self.pair)
+
+        motor_pair.stop(self.pair)
+        self.run_ms = time.ticks_diff(time.ticks_ms(), start)
+        return finished
+
+    def report(self):
+        """Return a one-line summary of the last run."""
+        return "Motion: {:d} segments in {:d} ms".format(self.segments_done, self.run_ms)
@@ -0,0 +1,73 @@
+# Motor Output
+import time, motor # pyright: ignore[reportMissingImports]
+
+########################################################################
+# ⚙️ MotorOutput - only send motor commands that change something
+########################################################################
+class MotorOutput:
+    """Skip motor.run() commands that would not change what the motor is doing.
+
+    A control loop usually asks for the same (or almost the same) speed many
+    times in a row. Every motor.run() is a message to the motor over the port,
+    so MotorOutput remembers the last speed sent to each port and drops a new
+    command when:
+
+        - it is within deadband of the last speed sent, or
+        - the last command to that port was sent less than min_interval_ms ago
+
+    A dropped command is not lost for long: the loop asks again next tick and
+    it goes through once the interval has passed.
+
+    Args:
+        deadband (int): Speed changes this small (degrees per second) are skipped.
+            Defaults to 3.
+        min_interval_ms (int): Shortest time between two commands to one port.
+            Defaults to 0 (no limit).
+
+    Example:
+        output = MotorOutput(deadband=3, min_interval_ms=10)
+        line_follower = LineFollow(60, 180, 6.8, motor_output=output)
+        ...
+        print(output.report())
+
+    Note:
+        - stop() is always sent and makes the next run() on that port go through.
+    """
+
+    def __init__(self, deadband=3, min_interval_ms=0):
+        self.deadband = deadband
+        self.min_interval_ms = min_interval_ms
+        self.sent = 0
+        self.suppressed = 0
+        self._last_velocity = {}
+        self._last_ms = {}
+
+    def run(self, motor_port, velocity):
+        """Send motor.run(motor_port, velocity) unless it is a repeat. Returns True if sent."""
+        now = time.ticks_ms()
+        last = self._last_velocity.get(motor_port)
+        if last is not None:
+            if abs(velocity - last) <= self.deadband:
+                self.suppressed += 1
+                return False
+            if time.ticks_diff(now, self._last_ms[motor_port]) < self.min_interval_ms:
+                self.suppressed += 1
+                return False
+
+        motor.run(motor_port, velocity)
+        self._last_velocity[motor_port] = velocity
+        self._last_ms[motor_port] = now
+        self.sent += 1
+        return True
+
+    def stop(self, motor_port):
+        """Stop the motor and forget its last speed."""
+        motor.stop(motor_port)
+        self._last_velocity.pop(motor_port, None)
+        self.sent += 1
+
+    def report(self):
+        """Return a one-line summary of sent and skipped commands."""
+        total = self.sent + self.suppressed
+        percent = 100 * self.suppressed // total if total else 0
+        return "Motor commands: sent %d suppressed %d (%d%% skipped)" % (self.sent, self.suppressed, percent)
@@ -0,0 +1,129 @@
+# Periodic Task Scheduler
+import runloop, time # pyright: ignore[reportMissingImports]
+
+# What to do when a step takes longer than one period
+SKIP = 0        # drop the missed wakeups and wait for the next deadline on the grid
+CATCH_UP = 1    # run the missed steps back-to-back (up to max_catch_up of them)
+
+########################################################################
+# ⏱️ PeriodicTask - run a step at a true fixed rate
+########################################################################
+class PeriodicTask:
+    """Call a step function every period_ms, measured from fixed deadlines.
+
+    "Do the work, then sleep 50 ms" really repeats every 50 ms PLUS however long
+    the work took, and that changes from one iteration to the next. PeriodicTask
+    instead works out the next deadline (start + 50, start + 100, ...) and only
+    sleeps for the time that is left, so the rate stays fixed.
+
+    When a step runs past its deadline (an overrun), the overrun setting decides:
+        - SKIP: forget the missed wakeups and line up with the next deadline.
+        - CATCH_UP: run the missed steps right away, but never more than
+          max_catch_up behind; beyond that it skips like SKIP.
+
+    It also measures the real time between steps so you can see if the hub
+    keeps up: min, max and mean period, and jitter (how far each period was
+    from period_ms).
+
+    Args:
+        period_ms (int): Time from one step start to the next.
+        overrun (int): SKIP or CATCH_UP.
+            Defaults to SKIP.
+        max_catch_up (int): Most missed steps CATCH_UP will run back-to-back.
+            Defaults to 3.
+
+    Example:
+        loop = PeriodicTask(20)
+        await loop.run(line_follower.follow_line, iterations=500)
+        print(loop.report())
+
+    Note:
+        - step may be a normal function or an async function.
+        - Call stop() from another task to end run() early.
+    """
+
+    def __init__(self, period_ms, overrun=SKIP, max_catch_up=3):
+        self.period_ms = period_ms
+        self.overrun = overrun
+        self.max_catch_up = max_catch_up
+        self.running = False
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Clear all measurements."""
+        self.steps = 0
+        self.overruns = 0
+        self.skipped = 0
+        self.min_period_ms = None
+        self.max_period_ms = 0
+        self.total_period_ms = 0
+        self.periods = 0
+        self.max_jitter_ms = 0
+        self.total_jitter_ms = 0
+
+    def _record_period(self, period):
+        if self.min_period_ms is None or period < self.min_period_ms:
+            self.min_period_ms = period
+        if period > self.max_period_ms:
+            self.max_period_ms = period
+        self.total_period_ms += period
+        self.periods += 1
+
+        jitter = abs(period - self.period_ms)
+        if jitter > self.max_jitter_ms:
+            self.max_jitter_ms = jitter
+        self.total_jitter_ms += jitter
+
+    async def run(self, step, iterations=None):
+        """Call step() every period_ms until stop() or until it has run iterations times."""
+        self.running = True
+        period = self.period_ms
+        deadline = time.ticks_ms()
+        last_start = None
+
+        while self.running and (iterations is None or self.steps < iterations):
+            start = time.ticks_ms()
+            if last_start is not None:
+                self._record_period(time.ticks_diff(start, last_start))
+            last_start = start
+
+            result = step()
+            if result is not None:
+                await result
+            self.steps += 1
+
+            deadline = time.ticks_add(deadline, period)
+            late = time.ticks_diff(time.ticks_ms(), deadline)
+            if late > 0:
+                self.overruns += 1
+                behind = late // period + 1
+                if self.overrun == CATCH_UP and behind <= self.max_catch_up:
+                    # Run the next step right away; the deadline is already in the past
+                    await runloop.sleep_ms(0)
+                    continue
+
+                # Drop the missed steps and line up with the next deadline
+                self.skipped += behind
+                deadline = time.ticks_add(deadline, behind * period)
+
+            await runloop.sleep_ms(max(0, time.ticks_diff(deadline, time.ticks_ms())))
+
+        self.running = False
+
+    def stop(self):
+        """Tell run() to finish after the current step."""
+        self.running = False
+
+    def mean_period_ms(self):
+        """Return the average time between step starts (0 before two steps have run)."""
+        return self.total_period_ms / self.periods if self.periods else 0
+
+    def mean_jitter_ms(self):
+        """Return the average distance between the real period and period_ms."""
+        return self.total_jitter_ms / self.periods if self.periods else 0
+
+    def report(self):
+        """Return a one-line summary of the measurements."""
+        return "Period %dms | steps %d | min %s max %d mean %.1f | jitter max %d mean %.1f | overruns %d skipped %d" % (
+            self.period_ms, self.steps, self.min_period_ms, self.max_period_ms, self.mean_period_ms(),
+            self.max_jitter_ms, self.mean_jitter_ms(), self.overruns, self.skipped)
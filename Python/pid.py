@@ -0,0 +1,105 @@
+# PID Controller
+import time
+
+########################################################################
+# 🎛️ PIDController - proportional, integral and derivative steering
+########################################################################
+class PIDController:
+    """Turn an error (how far off the line we are) into a steering correction.
+
+    The three terms each answer a different question:
+
+        - P (kp): How far off are we right now?
+        - I (ki): How long have we been off to the same side?
+        - D (kd): How fast is the error changing?
+
+    The I and D terms use the real time between calls, measured with
+    time.ticks_ms(), so a slow iteration (for example one that printed
+    something) does not throw off the math.
+
+    Args:
+        kp (float): Proportional gain.
+        ki (float): Integral gain (per second).
+            Defaults to 0.0.
+        kd (float): Derivative gain (seconds).
+            Defaults to 0.0.
+        integral_limit (float): Largest size the summed-up error may reach, so
+            the I term cannot "wind up" while the robot is far off the line.
+            Defaults to None (no limit).
+        output_limit (float): Largest correction returned, in either direction.
+            While the output is at this limit the integral stops growing.
+            Defaults to None (no limit).
+        derivative_filter (float): Smoothing for the D term from 0.0 (no
+            smoothing) to just below 1.0 (heavy smoothing). Sensor noise makes
+            the raw derivative jumpy; smoothing calms it down.
+            Defaults to 0.0.
+
+    Example:
+        pid = PIDController(kp=6.0, ki=2.0, kd=0.4, integral_limit=20, output_limit=300)
+        line_follower = LineFollow(60, 250, controller=pid)
+
+    Note:
+        - The first call after creating or reset() only has the P term, because
+          there is no earlier reading to measure time or change against.
+        - Call reset() before starting a new run so old error history is forgotten.
+    """
+
+    def __init__(self, kp, ki=0.0, kd=0.0, integral_limit=None, output_limit=None, derivative_filter=0.0):
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+        self.integral_limit = integral_limit
+        self.output_limit = output_limit
+        self.derivative_filter = derivative_filter
+        self.reset()
+
+    def reset(self):
+        """Forget the summed-up error, the last error and the last time."""
+        self.integral = 0.0
+        self.derivative = 0.0
+        self.last_error = None
+        self.last_ms = None
+
+    def update(self, error, now_ms=None):
+        """Return the correction for error, measured at now_ms (defaults to time.ticks_ms())."""
+        if now_ms is None:
+            now_ms = time.ticks_ms()
+
+        integral = self.integral
+        if self.last_ms is not None:
+            dt_ms = time.ticks_diff(now_ms, self.last_ms)
+            if dt_ms > 0:
+                dt = dt_ms / 1000
+
+                # I term: add up error over time, but never past the limit
+                integral += error * dt
+                if self.integral_limit is not None:
+                    if integral > self.integral_limit:
+                        integral = self.integral_limit
+                    elif integral < -self.integral_limit:
+                        integral = -self.integral_limit
+
+                # D term: change in error per second, optionally smoothed
+                raw_derivative = (error - self.last_error) / dt
+                alpha = self.derivative_filter
+                self.derivative = alpha * self.derivative + (1 - alpha) * raw_derivative
+
+        output = self.kp * error + self.ki * integral + self.kd * self.derivative
+
+        # Anti-windup: while the output is saturated, only keep integral changes
+        # that pull it back toward the limit
+        limit = self.output_limit
+        if limit is not None:
+            if output > limit:
+                output = limit
+                if integral > self.integral:
+                    integral = self.integral
+            elif output < -limit:
+                output = -limit
+                if integral < self.integral:
+                    integral = self.integral
+
+        self.integral = integral
+        self.last_error = error
+        self.last_ms = now_ms
+        return output
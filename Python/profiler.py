@@ -0,0 +1,153 @@
+# Loop Profiler
+import runloop, time, gc # pyright: ignore[reportMissingImports]
+
+# Lets CPython's await accept the step-by-step wrapper (the hub's await already does)
+try:
+    from types import coroutine as _awaitable
+except ImportError:
+    _awaitable = lambda function: function
+
+########################################################################
+# 🔬 TaskStats - timing numbers for one task or function
+########################################################################
+class TaskStats:
+    """Call count and run time (in microseconds) for one profiled task or function."""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    def add(self, elapsed_us):
+        self.calls += 1
+        self.total_us += elapsed_us
+        if elapsed_us > self.max_us:
+            self.max_us = elapsed_us
+
+########################################################################
+# 🔬 Profiler - where does the time (and memory) go?
+########################################################################
+class Profiler:
+    """Measure how long each task runs between awaits, and watch the heap.
+
+    Every time a task wakes up, runs, and reaches its next await counts as
+    one "call". For each task the profiler keeps the number of calls, the
+    total and the longest call in microseconds (time.ticks_us). After each
+    call it also checks the heap: the most memory ever in use (high-water
+    mark) and how many times the garbage collector freed memory.
+
+    When enabled is False, task() and function() hand back exactly what they
+    were given, so the program runs with no profiling cost at all.
+
+    Args:
+        enabled (bool): Turn profiling on or off.
+            Defaults to True.
+
+    Example:
+        profiler = Profiler(enabled=PROFILE)
+        analyze_light_state = profiler.function(analyze_light_state)
+
+        async def main():
+            run(profiler.task(when_hand_wave(), "hand wave"),
+                profiler.task(robot_movement(), "movement"))
+
+        runloop.run(main())
+        profiler.report()
+
+    Note:
+        - Heap numbers need gc.mem_alloc() and gc.mem_free(), which the hub has.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.stats = []
+        self.heap_high_water = 0
+        self.heap_low_free = None
+        self.gc_count = 0
+        self._last_alloc = 0
+        self._has_heap = hasattr(gc, "mem_alloc") and hasattr(gc, "mem_free")
+        self._start_ms = time.ticks_ms()
+
+    def _stats_for(self, name):
+        stats = TaskStats(name)
+        self.stats.append(stats)
+        return stats
+
+    def _check_heap(self):
+        allocated = gc.mem_alloc()
+        if allocated < self._last_alloc:
+            self.gc_count += 1  # memory went down, so the collector ran
+        self._last_alloc = allocated
+        if allocated > self.heap_high_water:
+            self.heap_high_water = allocated
+        free = gc.mem_free()
+        if self.heap_low_free is None or free < self.heap_low_free:
+            self.heap_low_free = free
+
+    @_awaitable
+    def _timed(self, coroutine, stats):
+        # Drive the coroutine one step at a time so each step can be timed
+        value = None
+        error = None
+        while True:
+            start = time.ticks_us()
+            try:
+                if error is None:
+                    waiting_on = coroutine.send(value)
+                else:
+                    waiting_on = coroutine.throw(error)
+            except StopIteration as done:
+                stats.add(time.ticks_diff(time.ticks_us(), start))
+                return done.value
+            stats.add(time.ticks_diff(time.ticks_us(), start))
+            if self._has_heap:
+                self._check_heap()
+
+            value = None
+            error = None
+            try:
+                value = yield waiting_on
+            except BaseException as exception:
+                error = exception
+
+    def task(self, coroutine, name=None):
+        """Return coroutine wrapped so every step is timed (or coroutine itself if disabled)."""
+        if not self.enabled:
+            return coroutine
+        if name is None:
+            name = getattr(coroutine, "__name__", "task%d" % len(self.stats))
+        return self._timed(coroutine, self._stats_for(name))
+
+    def function(self, function, name=None):
+        """Return function wrapped so every call is timed (or function itself if disabled)."""
+        if not self.enabled:
+            return function
+        stats = self._stats_for(name or getattr(function, "__name__", "function"))
+
+        def timed(*args, **kwargs):
+            start = time.ticks_us()
+            result = function(*args, **kwargs)
+            stats.add(time.ticks_diff(time.ticks_us(), start))
+            return result
+
+        return timed
+
+    def run(self, *coroutines):
+        """Like runloop.run(*coroutines), with every coroutine profiled and a report at the end."""
+        runloop.run(*[self.task(coroutine) for coroutine in coroutines])
+        self.report()
+
+    def report(self):
+        """Print one compact table of everything measured."""
+        if not self.enabled:
+            return
+        elapsed_ms = time.ticks_diff(time.ticks_ms(), self._start_ms)
+        lines = ["Profile: %d ms" % elapsed_ms, "%-20s %7s %10s %8s %8s" % ("name", "calls", "total_us", "avg_us", "max_us")]
+        for stats in self.stats:
+            average = stats.total_us // stats.calls if stats.calls else 0
+            lines.append("%-20s %7d %10d %8d %8d" % (stats.name[:20], stats.calls, stats.total_us, average, stats.max_us))
+        if self._has_heap:
+            lines.append("Heap: high water %d bytes, lowest free %d bytes, gc runs %d" % (
+                self.heap_high_water, self.heap_low_free or 0, self.gc_count))
+        print("\n".join(lines))
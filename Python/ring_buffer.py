@@ -0,0 +1,79 @@
+# Color Ring Buffer
+
+# Color codes go from -1 (no color) to 10 (white), so 12 slots cover them all
+COLOR_SLOTS = 12
+
+########################################################################
+# 🔁 ColorRingBuffer - the last N color readings plus a running count of each color
+########################################################################
+class ColorRingBuffer:
+    """Remember the most recent color readings without making new lists.
+
+    A ring buffer is like a circular parking lot with a fixed number of spaces.
+    When it is full, the newest car parks in the space of the oldest car. The
+    buffer also keeps a scoreboard of how many of each color are parked right
+    now, updating it as cars arrive and leave, so asking "how many blacks?"
+    never has to walk through the whole lot.
+
+    All the memory is set aside once in __init__; push() and count() do not
+    create any new objects, so a bigger buffer or faster sampling does not
+    give the garbage collector more work.
+
+    Args:
+        capacity (int): How many readings to remember.
+
+    Example:
+        readings = ColorRingBuffer(10)
+        readings.push(color_sensor.color(port.F))
+
+        if readings.is_full() and readings.count(BLACK) == readings.capacity:
+            print("All black")
+
+    Note:
+        - Readings must be color codes from -1 to 10.
+        - recent() makes a list and is only meant for debugging.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.length = 0
+        self._samples = bytearray(capacity)  # color code + 1 for each reading
+        self._counts = [0] * COLOR_SLOTS
+        self._next = 0
+
+    def push(self, color_code):
+        """Add a reading, dropping the oldest one when the buffer is full."""
+        slot = color_code + 1
+        if self.length == self.capacity:
+            self._counts[self._samples[self._next]] -= 1
+        else:
+            self.length += 1
+
+        self._samples[self._next] = slot
+        self._counts[slot] += 1
+
+        self._next += 1
+        if self._next == self.capacity:
+            self._next = 0
+
+    def count(self, color_code):
+        """Return how many of the remembered readings are color_code."""
+        return self._counts[color_code + 1]
+
+    def is_full(self):
+        """Return True once capacity readings have been pushed."""
+        return self.length == self.capacity
+
+    def clear(self):
+        """Forget every reading."""
+        for slot in range(COLOR_SLOTS):
+            self._counts[slot] = 0
+        self.length = 0
+        self._next = 0
+
+    def recent(self, n=None):
+        """Return the last n readings (all of them by default), oldest first."""
+        if n is None or n > self.length:
+            n = self.length
+        start = self._next - n
+        return [self._samples[(start + i) % self.capacity] - 1 for i in range(n)]
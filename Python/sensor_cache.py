@@ -0,0 +1,94 @@
+# Sensor Snapshot Cache
+import time, color_sensor, distance_sensor, force_sensor # pyright: ignore[reportMissingImports]
+
+########################################################################
+# 📸 SensorSnapshot - read each sensor port at most once per tick
+########################################################################
+class SensorSnapshot:
+    """Share one sensor reading between every check that happens close together.
+
+    A condition like
+
+        if distance_sensor.distance(port.B) > 100 or distance_sensor.distance(port.B) == -1:
+
+    asks the sensor twice, and the two answers can even be different. A
+    snapshot remembers each reading for ttl_ms milliseconds, so every
+    function that asks in that time gets the same number and only the first
+    one talks to the sensor.
+
+    Args:
+        ttl_ms (int): How long a reading stays fresh, in milliseconds. Use about
+            the length of one scheduler tick so each tick still gets a new reading.
+            Defaults to 10.
+
+    Example:
+        sensors = SensorSnapshot()
+
+        def is_near(distance_threshold=100):
+            distance = sensors.distance(port.B)
+            return distance != -1 and distance < distance_threshold
+
+        print(sensors.report())   # hits 42 misses 21 ...
+
+    Note:
+        - new_tick() throws away every reading so the next call reads fresh,
+          for loops that want exactly one reading per iteration.
+        - hits counts answers served from memory, misses counts real sensor reads.
+    """
+
+    def __init__(self, ttl_ms=10):
+        self.ttl_ms = ttl_ms
+        self.hits = 0
+        self.misses = 0
+        self._values = {}
+        self._times = {}
+        for reader in (distance_sensor.distance, color_sensor.color, color_sensor.reflection,
+                       force_sensor.pressed, force_sensor.force):
+            self._values[reader] = {}
+            self._times[reader] = {}
+
+    def _read(self, reader, sensor_port):
+        values = self._values[reader]
+        times = self._times[reader]
+        now = time.ticks_ms()
+
+        if sensor_port in values and time.ticks_diff(now, times[sensor_port]) < self.ttl_ms:
+            self.hits += 1
+            return values[sensor_port]
+
+        self.misses += 1
+        value = reader(sensor_port)
+        values[sensor_port] = value
+        times[sensor_port] = now
+        return value
+
+    def distance(self, sensor_port):
+        """Return distance_sensor.distance(sensor_port), reusing a fresh reading."""
+        return self._read(distance_sensor.distance, sensor_port)
+
+    def color(self, sensor_port):
+        """Return color_sensor.color(sensor_port), reusing a fresh reading."""
+        return self._read(color_sensor.color, sensor_port)
+
+    def reflection(self, sensor_port):
+        """Return color_sensor.reflection(sensor_port), reusing a fresh reading."""
+        return self._read(color_sensor.reflection, sensor_port)
+
+    def pressed(self, sensor_port):
+        """Return force_sensor.pressed(sensor_port), reusing a fresh reading."""
+        return self._read(force_sensor.pressed, sensor_port)
+
+    def force(self, sensor_port):
+        """Return force_sensor.force(sensor_port), reusing a fresh reading."""
+        return self._read(force_sensor.force, sensor_port)
+
+    def new_tick(self):
+        """Forget every reading so the next call of each kind goes to the sensor."""
+        for values in self._values.values():
+            values.clear()
+
+    def report(self):
+        """Return a one-line summary of cache hits and misses."""
+        total = self.hits + self.misses
+        percent = 100 * self.hits // total if total else 0
+        return "Sensor cache: hits %d misses %d (%d%% served from cache)" % (self.hits, self.misses, percent)
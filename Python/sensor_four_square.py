@@ -3,31 +3,8 @@ import runloop, time, sys, motor_pair, motor, force_sensor
 import color, color_sensor, distance_sensor
 from hub import light, light_matrix, port, sound
 from time import sleep, sleep_ms
-
-#constants
-DEGREES_PER_CM = 21
-DEGREES_PER_INCH = 53
-MM_PER_INCH = 25.4
-
-
-def is_color_red():
-    return color_sensor.color(port.F) == color.RED
-
-
-def is_pressed():
-    return force_sensor.pressed(port.A)
-
-
-def is_near(distance_threshold=100): # 100mm (4 inches) minimum
-    distance = distance_sensor.distance(port.B)
-
-    # Check if sensor is working (returns -1 when no reading)
-    if distance == -1:
-        print("Warning: Distance sensor not detecting anything")
-        return False
-
-    print ("Distance {:5.2f} cm {:6.2f} inches ".format(distance / 10, distance / 25.4))
-    return distance < distance_threshold
+from spike_helpers import DEGREES_PER_CM, DEGREES_PER_INCH, MM_PER_INCH
+from spike_helpers import is_near, is_pressed, is_color_red
 
 
 async def main():
@@ -42,8 +19,8 @@ async def main():
     # move backward for 6in step 2
     await motor_pair.move_for_degrees(motor_pair.PAIR_1, -6 * DEGREES_PER_INCH, 0)
 
-    # Wait for 1 second step 2
-    sleep(2)
+    # Wait for 2 seconds step 2
+    await runloop.sleep_ms(2000)
 
     # turn left 90 degrees step 3
     degrees = 180 # number of degrees of wheel turn
@@ -72,7 +49,7 @@ async def main():
 
     # Turn On Angry Face For 2 Seconds step 5
     light_matrix.show_image(light_matrix.IMAGE_ANGRY)
-    sleep(2)
+    await runloop.sleep_ms(2000)
 
     # turn left 90 degrees step 6
     degrees = 180 # number of degrees of wheel turn
@@ -90,7 +67,7 @@ async def main():
 
     # stop moving
     motor_pair.stop(motor_pair.PAIR_1)
-    sleep_ms(10) # sleep 10 milliseconds
+    await runloop.sleep_ms(10) # sleep 10 milliseconds
 
 
 runloop.run(main())
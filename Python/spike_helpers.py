@@ -0,0 +1,101 @@
+# SPIKE Helpers
+import color, color_sensor, distance_sensor, force_sensor # pyright: ignore[reportMissingImports]
+from hub import port # pyright: ignore[reportMissingImports]
+
+########################################################################
+# 📏 Conversion constants
+########################################################################
+DEGREES_PER_CM = 21
+DEGREES_PER_INCH = 53
+MM_PER_INCH = 25.4
+
+########################################################################
+# ⚙️ Settings - change them with configure()
+########################################################################
+_color_port = port.F
+_distance_port = port.B
+_force_port = port.A
+_near_mm = 100  # default distance for is_near(), 100mm (4 inches)
+_quiet = False  # True stops is_near() from printing
+
+# The functions that actually read the sensors (a SensorSnapshot can replace them)
+_read_color = color_sensor.color
+_read_distance = distance_sensor.distance
+_read_pressed = force_sensor.pressed
+
+def configure(color_port=None, distance_port=None, force_port=None, near_mm=None, quiet=None, sensors=None):
+    """
+    Change which ports the helpers read and how they behave.
+    Only the settings you pass are changed.
+
+    Examples:
+        configure(color_port=port.A, force_port=port.E, near_mm=150)
+        configure(quiet=True)                  # no distance printing
+        configure(sensors=SensorSnapshot())    # share readings within a tick
+    """
+    global _color_port, _distance_port, _force_port, _near_mm, _quiet
+    global _read_color, _read_distance, _read_pressed
+    if color_port is not None:
+        _color_port = color_port
+    if distance_port is not None:
+        _distance_port = distance_port
+    if force_port is not None:
+        _force_port = force_port
+    if near_mm is not None:
+        _near_mm = near_mm
+    if quiet is not None:
+        _quiet = quiet
+    if sensors is not None:
+        _read_color = sensors.color
+        _read_distance = sensors.distance
+        _read_pressed = sensors.pressed
+
+########################################################################
+# 🛑 is_color_red - Function to check if the color sensor sees red
+########################################################################
+def is_color_red():
+    """
+    Examples:
+        Using with if:            if is_color_red():
+        Using with wait until:    await runloop.until(is_color_red)
+        Using with repeat until:    while not (is_color_red())
+    """
+    return _read_color(_color_port) == color.RED
+
+########################################################################
+# 🎯 is_pressed - Function to check if force sensor is pressed
+########################################################################
+def is_pressed():
+    """
+    Examples:
+        Using with if:            if is_pressed():
+        Using with wait until:    await runloop.until(is_pressed)
+        Using with repeat until:    while not (is_pressed())
+    """
+    return _read_pressed(_force_port)
+
+########################################################################
+# ☀️ is_near - Function to check if something is near
+# Example with lambda: is_close = lambda: is_near(50)  # Creates a function that checks if within 50mm
+########################################################################
+def is_near(distance_threshold=None):
+    """
+    Examples:
+        Using with if:                if is_near():
+        Using with wait until        await runloop.until(is_near)
+        Using with repeat until:        while not (is_near()):
+        Using with repeat until:        while not (is_near(200)):# 200mm (8 inches) threshold
+    """
+    if distance_threshold is None:
+        distance_threshold = _near_mm
+    distance = _read_distance(_distance_port)
+
+    # Check if sensor is working (returns -1 when no reading)
+    if distance == -1:
+        if not _quiet:
+            print("Warning: Distance sensor not detecting anything")
+        return False
+
+    if not _quiet:
+        print ("Distance {:5.2f} cm {:6.2f} inches ".format(distance / 10, distance / MM_PER_INCH))
+    return distance < distance_threshold
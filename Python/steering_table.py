@@ -0,0 +1,76 @@
+# Steering Lookup Table
+from array import array
+
+# kp and error_scale are stored as whole numbers: 1.0 is stored as FIXED_ONE
+FIXED_ONE = 256
+
+# color_sensor.reflection() returns 0 to 100
+REFLECTION_VALUES = 101
+
+########################################################################
+# 📋 SteeringTable - motor speeds for every reflection, worked out ahead of time
+########################################################################
+class SteeringTable:
+    """Look up the left and right motor speeds instead of calculating them every tick.
+
+    Reflection can only be one of 101 values (0 to 100), so the line follower
+    can only ever ask for 101 different pairs of motor speeds. SteeringTable
+    works all of them out once, with whole-number (fixed-point) math, and the
+    control loop just looks up table.left[reflection] and table.right[reflection].
+    On the hub, every decimal-number result creates a new object for the
+    garbage collector to clean up; a lookup creates none.
+
+    The table is only rebuilt when sync() sees that target_light, speed, kp or
+    error_scale changed.
+
+    Args:
+        target_light (int): The reflection the robot tries to stay on.
+        speed (int): Forward speed.
+        kp (float): Proportional gain.
+        error_scale (float): Multiplier on the error (see calibration.py).
+            Defaults to 1.0.
+
+    Example:
+        table = SteeringTable(60, 180, 6.8)
+        reflection = color_sensor.reflection(port.F)
+        motor.run(port.C, -table.left[reflection])
+        motor.run(port.D, table.right[reflection])
+
+    Note:
+        - kp and error_scale are rounded to 1/256, which is far finer than a
+          motor speed step.
+    """
+
+    def __init__(self, target_light, speed, kp, error_scale=1.0):
+        self.left = array("h", [0] * REFLECTION_VALUES)
+        self.right = array("h", [0] * REFLECTION_VALUES)
+        self.rebuilds = 0
+        self.target_light = None
+        self.sync(target_light, speed, kp, error_scale)
+
+    def sync(self, target_light, speed, kp, error_scale=1.0):
+        """Rebuild the table if any setting is different from the last build."""
+        if (target_light == self.target_light and speed == self.speed
+                and kp == self.kp and error_scale == self.error_scale):
+            return
+        self.target_light = target_light
+        self.speed = speed
+        self.kp = kp
+        self.error_scale = error_scale
+        self._rebuild()
+
+    def _rebuild(self):
+        kp_fixed = int(self.kp * FIXED_ONE)
+        scale_fixed = int(self.error_scale * FIXED_ONE)
+        divisor = FIXED_ONE * FIXED_ONE
+
+        for reflection in range(REFLECTION_VALUES):
+            error = self.target_light - reflection
+            # Round the size and put the sign back, so errors of -5 and +5
+            # steer by the same amount (// alone rounds negatives down)
+            magnitude = abs(error) * scale_fixed * kp_fixed // divisor
+            correction = magnitude if error >= 0 else -magnitude
+            self.left[reflection] = self.speed + correction
+            self.right[reflection] = self.speed - correction
+
+        self.rebuilds += 1
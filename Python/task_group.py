@@ -0,0 +1,155 @@
+# Task Groups and Cancellation
+import runloop, time, motor, motor_pair # pyright: ignore[reportMissingImports]
+from hub import port # pyright: ignore[reportMissingImports]
+
+class Cancelled(Exception):
+    """Raised inside a task when its group has been cancelled."""
+
+########################################################################
+# 🚫 CancelToken - a stop sign that interrupts waits and moves right away
+########################################################################
+class CancelToken:
+    """A shared stop sign that tasks can wait on.
+
+    A should_stop flag is only looked at between awaits, so a task in the
+    middle of "await motor_pair.move_for_degrees(...)" keeps going until the
+    whole move is done. A CancelToken fixes that two ways:
+
+        1. Cleanups registered with on_cancel() (like stopping the motors)
+           run the moment cancel() is called.
+        2. The waits and moves on the token (sleep_ms, until,
+           move_for_degrees, run_for_degrees) check the token every tick and
+           raise Cancelled as soon as it is cancelled.
+
+    Example:
+        token = CancelToken()
+        token.on_cancel(lambda: motor_pair.stop(motor_pair.PAIR_1))
+
+        # in one task
+        await token.move_for_degrees(motor_pair.PAIR_1, 180, -100)
+
+        # in another task - the move above ends on the next tick
+        token.cancel()
+    """
+
+    def __init__(self):
+        self.cancelled = False
+        self.cancelled_at = None
+        self._cleanups = []
+
+    def is_cancelled(self):
+        """Return True once cancel() has been called (handy as a stop_when function)."""
+        return self.cancelled
+
+    def on_cancel(self, cleanup):
+        """Call cleanup() when the token is cancelled (right away if it already is)."""
+        if self.cancelled:
+            cleanup()
+        else:
+            self._cleanups.append(cleanup)
+
+    def cancel(self):
+        """Cancel the token and run every cleanup. Calling it again does nothing."""
+        if self.cancelled:
+            return
+        self.cancelled = True
+        self.cancelled_at = time.ticks_ms()
+        for cleanup in self._cleanups:
+            cleanup()
+
+    def check(self):
+        """Raise Cancelled if the token has been cancelled."""
+        if self.cancelled:
+            raise Cancelled()
+
+    async def until(self, condition):
+        """Like runloop.until(condition), but raise Cancelled if cancelled first."""
+        self.check()
+        await runloop.until(lambda: self.cancelled or condition())
+        self.check()
+
+    async def sleep_ms(self, duration_ms):
+        """Like runloop.sleep_ms, but raise Cancelled the tick the token is cancelled."""
+        deadline = time.ticks_add(time.ticks_ms(), duration_ms)
+        await self.until(lambda: time.ticks_diff(time.ticks_ms(), deadline) >= 0)
+
+    async def move_for_degrees(self, pair, degrees, steering, velocity=360, left_port=port.C, right_port=port.D):
+        """Like motor_pair.move_for_degrees, but the move stops on the tick the token is cancelled.
+
+        left_port and right_port must be the pair's motors; they are used to measure the distance.
+        """
+        motor.reset_relative_position(left_port, 0)
+        motor.reset_relative_position(right_port, 0)
+        distance = abs(degrees)
+
+        def arrived():
+            left = abs(motor.relative_position(left_port))
+            right = abs(motor.relative_position(right_port))
+            return (left if left > right else right) >= distance
+
+        motor_pair.move(pair, steering, velocity=velocity if degrees >= 0 else -velocity)
+        try:
+            await self.until(arrived)
+        finally:
+            motor_pair.stop(pair)
+
+    async def run_for_degrees(self, motor_port, degrees, velocity):
+        """Like motor.run_for_degrees, but the motor stops on the tick the token is cancelled."""
+        motor.reset_relative_position(motor_port, 0)
+        distance = abs(degrees)
+
+        motor.run(motor_port, velocity if degrees >= 0 else -velocity)
+        try:
+            await self.until(lambda: abs(motor.relative_position(motor_port)) >= distance)
+        finally:
+            motor.stop(motor_port)
+
+########################################################################
+# 👥 TaskGroup - tasks that are stopped together
+########################################################################
+class TaskGroup:
+    """A set of tasks that share one CancelToken.
+
+    group.cancel() cancels the token: cleanups run immediately and every task
+    waiting on the token gets Cancelled on its next tick. The tasks returned by
+    group.tasks() catch Cancelled, so the program ends quietly.
+
+    Example:
+        group = TaskGroup()
+        group.on_cancel(lambda: motor_pair.stop(motor_pair.PAIR_1))
+
+        async def when_hand_wave():
+            await group.token.until(is_near)
+            group.cancel()
+
+        async def robot_movement():
+            while True:
+                await group.token.move_for_degrees(motor_pair.PAIR_1, 180, -100)
+
+        runloop.run(*group.tasks(when_hand_wave(), robot_movement()))
+    """
+
+    def __init__(self):
+        self.token = CancelToken()
+
+    def on_cancel(self, cleanup):
+        """Call cleanup() when the group is cancelled."""
+        self.token.on_cancel(cleanup)
+
+    def cancel(self):
+        """Cancel every task in the group."""
+        self.token.cancel()
+
+    def is_cancelled(self):
+        """Return True once the group has been cancelled."""
+        return self.token.cancelled
+
+    async def _guard(self, coroutine):
+        try:
+            await coroutine
+        except Cancelled:
+            pass
+
+    def tasks(self, *coroutines):
+        """Wrap coroutines so Cancelled ends them quietly; pass the result to runloop.run(*...)."""
+        return [self._guard(coroutine) for coroutine in coroutines]
@@ -0,0 +1,85 @@
+# Telemetry Recorder
+from array import array
+
+########################################################################
+# 📈 Telemetry - record control loop numbers now, print them later
+########################################################################
+class Telemetry:
+    """Record line follower numbers into ready-made arrays instead of printing them.
+
+    Printing a long line every iteration takes much longer than reading the
+    sensor and setting the motors, so the robot ends up driving at "console
+    speed". Telemetry writes five whole numbers into arrays that were created
+    before the run, then dump() prints everything in one go after the robot stops.
+
+    Recorded fields (one row per recorded iteration):
+        iteration, reflection, correction, left_speed, right_speed
+
+    Args:
+        capacity (int): The most rows that can be recorded.
+            Defaults to 500.
+        every (int): Record only every Nth iteration (decimation).
+            Defaults to 1 (record every iteration).
+
+    Example:
+        telemetry = Telemetry(capacity=1000, every=2)
+        line_follower = LineFollow(60, 180, 6.8, telemetry=telemetry)
+
+        for i in range(2000):
+            await line_follower.follow_line()
+
+        await line_follower.stop_motors()
+        telemetry.dump()
+
+    Note:
+        - Values are stored as whole numbers, so corrections and speeds lose their decimals.
+        - When the arrays are full new rows are skipped and counted in dropped.
+    """
+
+    HEADER = "iteration,reflection,correction,left_speed,right_speed"
+
+    def __init__(self, capacity=500, every=1):
+        self.capacity = capacity
+        self.every = every
+        self.length = 0
+        self.dropped = 0
+
+        # int32 for the iteration counter, int16 for everything else
+        self.iteration = array("i", [0] * capacity)
+        self.reflection = array("h", [0] * capacity)
+        self.correction = array("h", [0] * capacity)
+        self.left_speed = array("h", [0] * capacity)
+        self.right_speed = array("h", [0] * capacity)
+
+    def record(self, iteration, reflection, correction, left_speed, right_speed):
+        """Store one row, unless decimation skips it or the arrays are full."""
+        if iteration % self.every:
+            return
+
+        row = self.length
+        if row == self.capacity:
+            self.dropped += 1
+            return
+
+        self.iteration[row] = iteration
+        self.reflection[row] = reflection
+        self.correction[row] = int(correction)
+        self.left_speed[row] = int(left_speed)
+        self.right_speed[row] = int(right_speed)
+        self.length = row + 1
+
+    def clear(self):
+        """Forget all recorded rows so the arrays can be reused for another run."""
+        self.length = 0
+        self.dropped = 0
+
+    def dump(self):
+        """Print every recorded row as CSV in a single write."""
+        lines = [self.HEADER]
+        for row in range(self.length):
+            lines.append("%d,%d,%d,%d,%d" % (
+                self.iteration[row], self.reflection[row], self.correction[row],
+                self.left_speed[row], self.right_speed[row]))
+        if self.dropped:
+            lines.append("# dropped %d rows (capacity %d)" % (self.dropped, self.capacity))
+        print("\n".join(lines))
@@ -3,6 +3,11 @@ import runloop, time, sys, motor_pair, motor, force_sensor
 import color, color_sensor, distance_sensor
 from hub import light_matrix, port, sound
 from time import sleep, sleep_ms
+from sensor_cache import SensorSnapshot
+
+# Every check of the same port in one tick shares a single sensor reading
+sensors = SensorSnapshot()
+
 async def main():
     motor_pair.pair(motor_pair.PAIR_1, port.C, port.D)
 
@@ -19,16 +24,16 @@ async def main():
     await motor.run_to_absolute_position(port.E, 320, 200, direction=motor.SHORTEST_PATH)
 
     # Wait for 1 second
-    sleep(1)
+    await runloop.sleep_ms(1000)
 
     # Run shortest distance to absolute 0
     await motor.run_to_absolute_position(port.E, 0, 200, direction=motor.SHORTEST_PATH)
 
     # move forward until an object within 10cm
-    if distance_sensor.distance(port.B) > 100 or distance_sensor.distance(port.B) == -1 : pass
+    if sensors.distance(port.B) > 100 or sensors.distance(port.B) == -1 : pass
 
     # Move forward until object withiin 10cm
-    if distance_sensor.distance(port.B) > 10 or distance_sensor.distance(port.B) == -1:
+    if sensors.distance(port.B) > 10 or sensors.distance(port.B) == -1:
 
         # stop moving
         motor_pair.stop(motor_pair.PAIR_1)
@@ -3,6 +3,7 @@ import sys, motor_pair, motor
 from hub import port, motion_sensor, button
 from runloop import run, until
 from time import sleep, sleep_ms
+from gyro_turn import GyroTurn
 
 # Constants
 CM_TO_DEGREES = 21
@@ -24,6 +25,9 @@ speed = int(.2 * 1100)
 # Connect two motors together so they work as a team
 motor_pair.pair(motor_pair.PAIR_1, left_motor, right_motor)
 
+# Turns slow down as they get close to the target angle (up to 2x default speed)
+gyro_turn = GyroTurn(motor_pair.PAIR_1, max_speed=2 * speed, tolerance=10)
+
 
 ########################################################################
 # 🤖 Gyro turn left 90 degrees then right 90 degrees
@@ -32,17 +36,13 @@ async def gyro_90_degree_turn():
 
     motion_sensor.reset_yaw(0)
 
-    # turn left in place until yaw reaches 90 degrees
-    motor_pair.move(motor_pair.PAIR_1, -100, velocity=speed)
-    await until(lambda: motion_sensor.tilt_angles()[0] >= 885)
-    motor_pair.stop(motor_pair.PAIR_1, stop=motor.BRAKE)
-    #sleep_ms(40)
+    # turn left in place to 90 degrees (900 decidegrees)
+    await gyro_turn.turn_to(900)
+    print(gyro_turn.report())
 
-    # turn right in place until yaw reaches 0 degrees
-    motor_pair.move(motor_pair.PAIR_1, 100, velocity=speed)
-    await until(lambda: motion_sensor.tilt_angles()[0] <= 15)
-    motor_pair.stop(motor_pair.PAIR_1, stop=motor.BRAKE)
-    #sleep_ms(40)
+    # turn right in place back to 0 degrees
+    await gyro_turn.turn_to(0)
+    print(gyro_turn.report())
 
 
 ########################################################################
@@ -50,11 +50,11 @@ async def gyro_90_degree_turn():
 ########################################################################
 async def when_left_button_pressed():
 
-    # wait for .5 seconds
-    sleep_ms(500)
-
+    # after the turns, every time the left button is pressed (other tasks keep running)
     # move forward 10 cm and then move back 10 cm
-    if button.pressed(button.LEFT):
+    await until(lambda: turns_finished)
+    while True:
+        await until(lambda: button.pressed(button.LEFT))
         await motor_pair.move_for_degrees(motor_pair.PAIR_1, 10 * CM_TO_DEGREES, 0)
         await motor_pair.move_for_degrees(motor_pair.PAIR_1, -10 * CM_TO_DEGREES, 0)
 
@@ -64,29 +64,31 @@ async def when_left_button_pressed():
 ########################################################################
 async def when_right_button_pressed():
 
-    # wait for .5 seconds
-    sleep_ms(500)
-
+    # after the turns, every time the right button is pressed (other tasks keep running)
     # pivot turn left 10 wheel rotations -40 steering
-    if button.pressed(button.RIGHT):
+    await until(lambda: turns_finished)
+    while True:
+        await until(lambda: button.pressed(button.RIGHT))
         await motor_pair.move_for_degrees(motor_pair.PAIR_1, 10 * 360, -40)
 
 
 ########################################################################
 # 🤖 main
 ########################################################################
+turns_finished = False
+
 async def main():
+    global turns_finished
 
+    # one turn at a time, each finishing before the next starts
     for i in range(5):
-        run(gyro_90_degree_turn())
-
-    while True:
-
-        # Run all functions concurrently as events
-        run(
-            when_left_button_pressed(),
-            when_right_button_pressed(),
-        )
-
-run(main())
+        await gyro_90_degree_turn()
+    turns_finished = True
+
+# The button tasks loop on their own, so they run next to main as events
+run(
+    main(),
+    when_left_button_pressed(),
+    when_right_button_pressed(),
+)
 sys.exit()
@@ -0,0 +1,126 @@
+# Cooperative Waits
+import runloop, time # pyright: ignore[reportMissingImports]
+
+########################################################################
+# ⏳ Waits that let every other task keep running
+#
+# time.sleep() and time.sleep_ms() freeze the WHOLE hub: no other task
+# runs until they finish. Everything in this file is built on
+# runloop.until(), which checks the condition once per scheduler tick and
+# lets the other tasks run in between.
+#
+# Examples:
+#     await wait_for(is_pressed, timeout_ms=2000)
+#     which = await wait_any([is_pressed, is_near])
+#     await wait_all([is_pressed, lambda: button.pressed(button.LEFT)])
+#     await wait_rising(is_near)     # wait until something ARRIVES
+########################################################################
+
+TIMED_OUT = -1
+
+def _deadline(timeout_ms):
+    if timeout_ms is None:
+        return None
+    return time.ticks_add(time.ticks_ms(), timeout_ms)
+
+def _expired(deadline):
+    return deadline is not None and time.ticks_diff(time.ticks_ms(), deadline) >= 0
+
+########################################################################
+# ⏳ wait_any - wait until at least one condition is True
+########################################################################
+async def wait_any(conditions, timeout_ms=None):
+    """
+    Wait until any of the conditions is True.
+
+    Returns:
+        The index of the first True condition, or TIMED_OUT (-1) if timeout_ms
+        milliseconds passed first.
+    """
+    deadline = _deadline(timeout_ms)
+    found = [TIMED_OUT]
+
+    def check():
+        for index in range(len(conditions)):
+            if conditions[index]():
+                found[0] = index
+                return True
+        return _expired(deadline)
+
+    await runloop.until(check)
+    return found[0]
+
+########################################################################
+# ⏳ wait_all - wait until every condition is True at the same time
+########################################################################
+async def wait_all(conditions, timeout_ms=None):
+    """
+    Wait until all of the conditions are True in the same check.
+
+    Returns:
+        True if they all became True, False if timeout_ms milliseconds passed first.
+    """
+    deadline = _deadline(timeout_ms)
+    done = [False]
+
+    def check():
+        for condition in conditions:
+            if not condition():
+                return _expired(deadline)
+        done[0] = True
+        return True
+
+    await runloop.until(check)
+    return done[0]
+
+########################################################################
+# ⏳ wait_for - wait for one condition, with an optional timeout
+########################################################################
+async def wait_for(condition, timeout_ms=None):
+    """
+    Wait until condition is True.
+
+    Returns:
+        True if it became True, False if timeout_ms milliseconds passed first.
+    """
+    return await wait_any((condition,), timeout_ms) != TIMED_OUT
+
+########################################################################
+# ⏳ wait_rising / wait_falling - wait for a condition to CHANGE
+########################################################################
+async def _wait_edge(condition, becomes, timeout_ms):
+    deadline = _deadline(timeout_ms)
+    last = [bool(condition())]
+    seen = [False]
+
+    def check():
+        now = bool(condition())
+        if now == becomes and last[0] != becomes:
+            seen[0] = True
+            return True
+        last[0] = now
+        return _expired(deadline)
+
+    await runloop.until(check)
+    return seen[0]
+
+async def wait_rising(condition, timeout_ms=None):
+    """
+    Wait until condition goes from False to True.
+
+    Unlike wait_for, a condition that is already True does not count: it has
+    to become False and then True again (for example, a NEW button press).
+
+    Returns:
+        True on the change, False if timeout_ms milliseconds passed first.
+    """
+    return await _wait_edge(condition, True, timeout_ms)
+
+async def wait_falling(condition, timeout_ms=None):
+    """
+    Wait until condition goes from True to False.
+
+    Returns:
+        True on the change, False if timeout_ms milliseconds passed first.
+    """
+    return await _wait_edge(condition, False, timeout_ms)